@@ -16,9 +16,8 @@ class AIPlayer(Player):
         return False
 
     def _choose_action(self, game_state: 'GameState', verbose: bool = False) -> 'Action':
-        eligible_actions = ActionService().get_valid_actions(self, game_state.board)
+        eligible_indices = ActionService().get_valid_action_indices(self, game_state.board)
         if verbose:
-            for action in eligible_actions:
-                print(action)
-        action = choice(eligible_actions)
-        return action
+            for action_idx in eligible_indices:
+                print(ActionService().idx_to_action(action_idx))
+        return ActionService().idx_to_action(choice(eligible_indices))
@@ -4,6 +4,7 @@ from typing import Optional, List
 from gym import Env, spaces
 
 from base.actions.action import Action
+from base.actions.action_result import ActionResult
 from base.action_service import ActionService
 from ai.controlled_game import ControlledGame
 from base.enums.game_phase import GamePhase
@@ -65,19 +66,19 @@ class CanastaEnv(Env):
             raise RuntimeError("Episode is done, please reset the game.")
         action = ActionService().idx_to_action(action_idx)  # type: Action
         self.curr_step += 1
-        self._take_action(action, action_idx)
-        reward = action.get_reward()
+        reward = self._take_action(action, action_idx).reward
         observation = self._get_state()
         return observation, reward, self.game.is_finished(), {}
 
     def get_current_actions_mask(self):
         return self.game.get_current_actions_mask()
 
-    def _take_action(self, action: Action, action_idx: int):
+    def _take_action(self, action: Action, action_idx: int) -> ActionResult:
         self.action_episode_memory[self.curr_episode].append(action_idx)
-        self.game.play_action(action)
+        result = self.game.play_action(action)
         if self.game.board.phase == GamePhase.END_TURN_PHASE:
             self.game.switch_player_turns()
+        return result
 
     def reset(self):
         """
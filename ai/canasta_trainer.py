@@ -71,8 +71,7 @@ class DQN:
 
     def get_action(self, states, mask, epsilon):
         if np.random.random() < epsilon:
-            valid_actions_indexes = [idx for idx, is_valid in enumerate(mask) if is_valid]
-            return np.random.choice(valid_actions_indexes)
+            return np.random.choice(np.flatnonzero(mask))
         else:
             return np.argmax(self.predict(np.atleast_2d(states), np.atleast_2d(mask))[0])
 
@@ -1,7 +1,10 @@
-from typing import List
+from typing import Optional
+
+import numpy as np
 
 from base.actions.action import Action
-from base.action_service import ActionService
+from base.actions.action_result import ActionResult
+from base.action_mask_tracker import ActionMaskTracker
 from ai.controlled_player import ControlledPlayer
 from base.constants import Constants
 from base.enums.team_color import TeamColor
@@ -11,23 +14,32 @@ from base.team import Team
 
 class ControlledGame(Game):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, debug_actions_mask: bool = False, seed: Optional[int] = None, audit_cards: bool = False):
+        super().__init__(seed=seed, audit_cards=audit_cards)
+        # Keeps the valid actions mask up to date between actions, cross-checked against full recomputations if debugging
+        self.mask_tracker = ActionMaskTracker(debug=debug_actions_mask)
+
+    def clone(self) -> 'ControlledGame':
+        clone = super().clone()
+        # The tracked masks belong to the hands and board of this game, the clone tracks its own
+        clone.mask_tracker = ActionMaskTracker(debug=self.mask_tracker.debug)
+        return clone
 
-    def play(self, verbose: bool = False):
+    def play(self, verbose: bool = False, max_steps: Optional[int] = None) -> int:
         raise NotImplemented("The training game can only be played through the play_action() function.")
 
-    def play_action(self, action: Action):
+    def play_action(self, action: Action) -> ActionResult:
         if not self.initialized:
             raise Exception("Game not initialized")
-        self.players[self.current_player_index].play_action(game_state=self.get_state(), action=action)
-
-    def switch_player_turns(self):
-        self._next_player_turn()
+        result = self.players[self.current_player_index].play_action(game_state=self.get_state(), action=action)
+        self.mask_tracker.update(self.current_player, self.board)
+        if self.board.auditor is not None:
+            self.board.auditor.check(self.board, self.players)
+        return result
 
-    def get_current_actions_mask(self) -> List[bool]:
+    def get_current_actions_mask(self) -> np.ndarray:
         """Return a boolean mask representing the current valid actions."""
-        return ActionService().get_valid_actions_mask(self.current_player, self.board)
+        return self.mask_tracker.get_valid_actions_mask(self.current_player, self.board)
 
     def _initialize_players(self) -> None:
         self.players = [ControlledPlayer(i) for i in range(Constants.NUM_PLAYERS)]
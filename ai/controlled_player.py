@@ -1,4 +1,5 @@
 from base.actions.action import Action
+from base.actions.action_result import ActionResult
 from base.game_state import GameState
 from base.player import Player
 
@@ -12,5 +13,5 @@ class ControlledPlayer(Player):
     def _choose_action(self, game_state: 'GameState', verbose: bool = False) -> 'Action':
         raise NotImplemented("Controlled players need action determination from the outside.")
 
-    def play_action(self, game_state: 'GameState', action: Action):
-        action.execute(self, game_state.board)
+    def play_action(self, game_state: 'GameState', action: Action) -> ActionResult:
+        return action.execute(self, game_state.board)
@@ -0,0 +1,158 @@
+import math
+import random
+import time
+from typing import Dict, Optional
+
+from base.action_service import ActionService
+from base.cards.stack import Stack
+from base.enums.game_phase import GamePhase
+from base.enums.pile_side import PileSide
+from base.game import Game
+from base.game_state import GameState
+
+#: The score difference between the teams at which a playout is worth about 88% of a win
+SCORE_SCALE = 500
+
+
+class ISMCTS:
+    """
+    Single observer information set Monte Carlo tree search, choosing the action of the current player of a game.
+
+    Each iteration samples a determinization of the game: the cards the current player cannot see (the cards of the
+    other hands not known to all players, the deck and the piles) are shuffled and dealt back to the same places. The
+    determinization is then searched with UCT over the indexes of the :class:`ActionService`: the nodes of the tree
+    are shared by all determinizations, only the children whose actions are valid in the current one are selected,
+    using the number of times they were available rather than the visits of their parent. The playouts follow random
+    valid actions for a limited number of steps, and are scored by the score difference of the teams.
+    """
+
+    def __init__(self, max_iterations: Optional[int] = None, max_time: Optional[float] = None,
+                 exploration: float = 0.7, rollout_depth: int = 20, seed: Optional[int] = None):
+        """
+        :param max_iterations: the maximum number of iterations of a search
+        :param max_time: the maximum duration of a search in seconds
+        :param exploration: the exploration constant of UCT
+        :param rollout_depth: the maximum number of random actions played after leaving the tree
+        :param seed: the seed of the random generator sampling the determinizations and playouts
+        """
+        if max_iterations is None and max_time is None:
+            raise Exception("The search needs a maximum number of iterations or a maximum time")
+        self.max_iterations = max_iterations
+        self.max_time = max_time
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self._random = random.Random(seed)
+
+    def search(self, game_state: GameState) -> Dict[int, int]:
+        """Search the actions of the current player of the given state, and return the visits of each action index."""
+        deadline = time.perf_counter() + self.max_time if self.max_time is not None else None
+        game = Game.from_state(game_state)
+        root = _Node(None, None, None)
+        num_iterations = 0
+        while self.max_iterations is None or num_iterations < self.max_iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate(root, game)
+            num_iterations += 1
+        return {action_idx: child.visits for action_idx, child in root.children.items()}
+
+    def _iterate(self, root: '_Node', game: Game) -> None:
+        game = game.clone()
+        self._determinize(game)
+        service = ActionService()
+        node = root
+        # Selection and expansion
+        while not game.is_finished():
+            valid_indices = service.get_valid_action_indices(game.current_player, game.board).tolist()
+            if not valid_indices:
+                # A dead end of the rules, scored like the end of the game
+                break
+            children = node.children
+            untried = []
+            for action_idx in valid_indices:
+                child = children.get(action_idx)
+                if child is None:
+                    untried.append(action_idx)
+                else:
+                    child.availability += 1
+            if untried:
+                action_idx = self._random.choice(untried)
+                node = children[action_idx] = _Node(node, action_idx, game.current_team_index)
+                self._play(game, action_idx)
+                break
+            node = max((children[action_idx] for action_idx in valid_indices), key=self._uct)
+            self._play(game, node.action_idx)
+        # Playout
+        for _ in range(self.rollout_depth):
+            if game.is_finished():
+                break
+            valid_indices = service.get_valid_action_indices(game.current_player, game.board).tolist()
+            if not valid_indices:
+                break
+            self._play(game, self._random.choice(valid_indices))
+        # Backpropagation, from the point of view of the team playing the action of each node
+        red_reward = 0.5 + 0.5 * math.tanh((game.get_red_team_score() - game.get_blue_team_score()) / SCORE_SCALE)
+        while node is not root:
+            node.visits += 1
+            node.reward += red_reward if node.team_index == 0 else 1 - red_reward
+            node = node.parent
+
+    def _determinize(self, game: Game) -> None:
+        """
+        Shuffle the cards the current player of the given game cannot see: the cards of the other hands that are not
+        known to all players, the deck and the piles. The stack and the known cards (see :meth:`Hand.get_known_cards`)
+        stay in place.
+        """
+        board = game.board
+        others = [player for player in game.players if player is not game.current_player]
+        piles = [(side, pile) for side, pile in [(PileSide.LEFT, board.left_pile), (PileSide.RIGHT, board.right_pile)]
+                 if pile is not None]
+        known_cards = [player.hand.get_known_cards() for player in others]
+        unseen = []
+        for player, known in zip(others, known_cards):
+            hidden = player.hand.clone()
+            for card in known:
+                hidden.pop(card)
+            unseen.extend(hidden.get_raw_cards())
+        unseen.extend(board.deck.get_cards())
+        for _, pile in piles:
+            unseen.extend(pile.get_raw_cards())
+        self._random.shuffle(unseen)
+
+        start = 0
+        for player, known in zip(others, known_cards):
+            num_cards = len(player.hand) - len(known)
+            player.hand.clear()
+            player.hand.add(known, known=True)
+            player.hand.add(unseen[start:start + num_cards])
+            start += num_cards
+        num_cards = board.deck.num_cards()
+        board.deck.set_cards(unseen[start:start + num_cards])
+        start += num_cards
+        for side, pile in piles:
+            board.restore_pile(side, Stack(unseen[start:start + len(pile)]))
+            start += len(pile)
+
+    @staticmethod
+    def _play(game: Game, action_idx: int) -> None:
+        ActionService().idx_to_action(action_idx).execute(game.current_player, game.board)
+        if game.board.phase == GamePhase.END_TURN_PHASE:
+            game.switch_player_turns()
+
+    def _uct(self, node: '_Node') -> float:
+        return node.reward / node.visits + self.exploration * math.sqrt(math.log(node.availability) / node.visits)
+
+
+class _Node:
+    """A node of the search tree, reached by playing the given action index."""
+
+    __slots__ = ['parent', 'action_idx', 'team_index', 'children', 'visits', 'availability', 'reward']
+
+    def __init__(self, parent: Optional['_Node'], action_idx: Optional[int], team_index: Optional[int]):
+        self.parent = parent
+        self.action_idx = action_idx
+        self.team_index = team_index  # The index of the team playing the action
+        self.children = {}  # type: Dict[int, _Node]
+        self.visits = 0
+        self.availability = 1  # The number of times the action was valid when its parent was visited
+        self.reward = 0.0
@@ -0,0 +1,98 @@
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, TYPE_CHECKING
+
+from ai.ismcts import ISMCTS
+from base.action_service import ActionService
+from base.player import Player
+
+if TYPE_CHECKING:
+    from base.game_state import GameState
+    from base.actions.action import Action
+
+
+class ISMCTSPlayer(Player):
+    """
+    An AI player choosing its actions with an :class:`ISMCTS` search, within an iteration or time budget per action.
+
+    With several workers, each worker process runs an independent search with its own seed on the same state (root
+    parallelism), and the action visited most over all searches is chosen. The budget applies to each search.
+    """
+
+    def __init__(self, identifier: int, max_iterations: Optional[int] = None, max_time: Optional[float] = 1.0,
+                 num_workers: int = 1, exploration: float = 0.7, rollout_depth: int = 20, seed: Optional[int] = None):
+        """
+        :param identifier: the identifier of the player
+        :param max_iterations: the maximum number of iterations of each search
+        :param max_time: the maximum duration of each search in seconds
+        :param num_workers: the number of processes searching in parallel, 1 to search in this process
+        :param exploration: the exploration constant of UCT
+        :param rollout_depth: the maximum number of random actions played after leaving the search tree
+        :param seed: the seed of the random generator giving the seed of each search
+        """
+        super().__init__(identifier)
+        self.max_iterations = max_iterations
+        self.max_time = max_time
+        self.num_workers = num_workers
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self._random = random.Random(seed)
+        self._executor = None  # type: Optional[ProcessPoolExecutor]
+
+    @property
+    def is_human(self):
+        return False
+
+    def _choose_action(self, game_state: 'GameState', verbose: bool = False) -> 'Action':
+        eligible_indices = ActionService().get_valid_action_indices(self, game_state.board).tolist()
+        if not eligible_indices:
+            raise Exception("Player {} has no valid action in phase {}".format(self.identifier, game_state.board.phase))
+        if len(eligible_indices) == 1:
+            return ActionService().idx_to_action(eligible_indices[0])
+        visits = self.search(game_state)
+        if not visits:
+            # The search did not complete any iteration within its budget
+            return ActionService().idx_to_action(self._random.choice(eligible_indices))
+        if verbose:
+            for action_idx, num_visits in sorted(visits.items(), key=lambda item: -item[1]):
+                print("{} visits: {}".format(num_visits, ActionService().idx_to_action(action_idx)))
+        return ActionService().idx_to_action(max(visits, key=visits.get))
+
+    def search(self, game_state: 'GameState') -> Dict[int, int]:
+        """Search the actions of this player in the given state, and return the total visits of each action index."""
+        seeds = [self._random.getrandbits(32) for _ in range(self.num_workers)]
+        if self.num_workers == 1:
+            return _search(game_state, self._create_search(seeds[0]))
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_workers, initializer=_initialize_worker)
+        visits = Counter()
+        for search_visits in self._executor.map(_search, [game_state] * self.num_workers,
+                                                [self._create_search(seed) for seed in seeds]):
+            visits.update(search_visits)
+        return dict(visits)
+
+    def close(self) -> None:
+        """Stop the worker processes, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self):
+        # The player is sent to the workers as part of the game state, without its workers
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+    def _create_search(self, seed: int) -> ISMCTS:
+        return ISMCTS(max_iterations=self.max_iterations, max_time=self.max_time, exploration=self.exploration,
+                      rollout_depth=self.rollout_depth, seed=seed)
+
+
+def _search(game_state: 'GameState', search: ISMCTS) -> Dict[int, int]:
+    return search.search(game_state)
+
+
+def _initialize_worker() -> None:
+    # Load the action catalog when the worker starts, rather than during its first search
+    ActionService()
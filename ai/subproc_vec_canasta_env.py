@@ -0,0 +1,176 @@
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ai.vec_canasta_env import VecCanastaEnv
+from base.action_service import ActionService
+from base.game_state import GameState
+
+#: The commands sent to the workers
+STEP = 'step'
+RESET = 'reset'
+CLOSE = 'close'
+
+
+class SubprocVecCanastaEnv:
+    """
+    A :class:`VecCanastaEnv` whose games are stepped in parallel by worker processes.
+
+    Each worker owns a contiguous slice of the games. The action indices, observations, rewards, done flags and valid
+    actions masks of all games are stored in shared memory arrays, which the workers read and write directly, so no
+    array is ever pickled. The only messages exchanged are a command to each worker, and its ready signal once done.
+    """
+
+    def __init__(self, num_envs: int, num_workers: Optional[int] = None, seed: Optional[int] = None,
+                 start_method: Optional[str] = None):
+        """
+        :param num_envs: the number of games
+        :param num_workers: the number of worker processes, by default the number of CPUs
+        :param seed: the seed of the first game, the other games use the next seeds
+        :param start_method: the multiprocessing start method of the workers, by default the platform default
+        """
+        self.num_envs = num_envs
+        self.num_actions = ActionService().num_actions
+        self.observation_size = GameState.SIZE
+        self._shared_memories = []  # type: List[SharedMemory]
+        self._specs = []  # type: List[Tuple[str, Tuple[int, ...], np.dtype]]
+        self._actions = self._create_array((num_envs,), np.int64)
+        self._observations = self._create_array((num_envs, self.observation_size), VecCanastaEnv.OBSERVATION_DTYPE)
+        self._rewards = self._create_array((num_envs,), VecCanastaEnv.REWARD_DTYPE)
+        self._dones = self._create_array((num_envs,), bool)
+        self._masks = self._create_array((num_envs, self.num_actions), bool)
+
+        context = multiprocessing.get_context(start_method)
+        num_workers = min(num_envs, num_workers or os.cpu_count())
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int).tolist()
+        self._connections = []  # type: List[Connection]
+        self._processes = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(target=_run_worker, args=(worker_connection, self._specs, start, end, seed),
+                                      daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+        self._closed = False
+        self._wait()
+
+    def reset(self, copy: bool = True) -> np.ndarray:
+        """Reset all games and return their observations."""
+        self._send(RESET)
+        return self._observations.copy() if copy else self._observations
+
+    def step(self, action_indices: np.ndarray,
+             copy: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Execute the action with the given index in each game, see :meth:`VecCanastaEnv.step`.
+
+        :param action_indices: the index of the action to execute in each game
+        :param copy: if False, return the shared arrays themselves, which are overwritten by the next step
+        :return: the observations, rewards, done flags and valid actions masks of the games after the actions
+        """
+        if len(action_indices) != self.num_envs:
+            raise Exception("Expected {} actions, got {}".format(self.num_envs, len(action_indices)))
+        self._actions[:] = action_indices
+        self._send(STEP)
+        if copy:
+            return self._observations.copy(), self._rewards.copy(), self._dones.copy(), self._masks.copy()
+        return self._observations, self._rewards, self._dones, self._masks
+
+    def get_current_actions_masks(self) -> np.ndarray:
+        """Return the valid actions masks of all games."""
+        return self._masks.copy()
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory, the arrays returned with ``copy=False`` become invalid."""
+        if self._closed:
+            return
+        self._closed = True
+        for connection in self._connections:
+            try:
+                connection.send(CLOSE)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+        # Release the arrays before their memory
+        self._actions = self._observations = self._rewards = self._dones = self._masks = None
+        for shared_memory in self._shared_memories:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, '_closed'):
+            self.close()
+
+    def _create_array(self, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        shared_memory = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        self._shared_memories.append(shared_memory)
+        self._specs.append((shared_memory.name, shape, dtype))
+        return np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+
+    def _send(self, command: str) -> None:
+        for connection in self._connections:
+            connection.send(command)
+        self._wait()
+
+    def _wait(self) -> None:
+        """Wait for the ready signal of every worker, raising the exception of any worker that failed."""
+        errors = [connection.recv() for connection in self._connections]
+        for error in errors:
+            if error is not None:
+                raise error
+
+
+def _run_worker(connection: Connection, specs: List[Tuple[str, Tuple[int, ...], np.dtype]], start: int, end: int,
+                seed: Optional[int]) -> None:
+    """Step the games from start to end of a :class:`SubprocVecCanastaEnv` on the commands received."""
+    shared_memories = [SharedMemory(name=name) for name, _, _ in specs]
+    try:
+        actions, observations, rewards, dones, masks = [np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+                                                        for shared_memory, (_, shape, dtype)
+                                                        in zip(shared_memories, specs)]
+        try:
+            env = VecCanastaEnv(end - start, seed=None if seed is None else seed + start,
+                                observations=observations[start:end], rewards=rewards[start:end],
+                                dones=dones[start:end], masks=masks[start:end])
+        except Exception as e:
+            connection.send(e)
+            return
+        connection.send(None)
+        while True:
+            command = connection.recv()
+            if command == CLOSE:
+                break
+            try:
+                if command == STEP:
+                    env.step(actions[start:end], copy=False)
+                elif command == RESET:
+                    env.reset(copy=False)
+                else:
+                    raise Exception("Unknown command {}".format(command))
+                connection.send(None)
+            except Exception as e:
+                connection.send(e)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Release the arrays before their memory
+        actions = observations = rewards = dones = masks = env = None
+        for shared_memory in shared_memories:
+            shared_memory.close()
+        connection.close()
@@ -0,0 +1,100 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ai.controlled_game import ControlledGame
+from base.action_service import ActionService
+from base.enums.game_phase import GamePhase
+from base.game_state import GameState
+
+
+class VecCanastaEnv:
+    """
+    A batch of Canasta environments stepped in lockstep, so the agent can choose the actions of all games at once.
+
+    Observations, rewards, done flags and valid actions masks are returned as arrays with one row per game. Finished
+    games, and stalled games in which the current player has no valid action (see :meth:`Game.is_stalled`), are
+    reset automatically: the observation and mask returned for such a game are those of the new game, while its
+    reward and done flag are those of the action that ended the previous one.
+
+    The arrays are written to buffers, which may be given to share them (see :class:`SubprocVecCanastaEnv`). Unless
+    ``copy=False`` is passed, copies of the buffers are returned so they remain valid after the next step.
+    """
+
+    OBSERVATION_DTYPE = np.float32
+    REWARD_DTYPE = np.float32
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None, observations: Optional[np.ndarray] = None,
+                 rewards: Optional[np.ndarray] = None, dones: Optional[np.ndarray] = None,
+                 masks: Optional[np.ndarray] = None):
+        """
+        :param num_envs: the number of games
+        :param seed: the seed of the first game, the other games use the next seeds
+        :param observations: the (num_envs x observation_size) buffer to write the observations to
+        :param rewards: the (num_envs) buffer to write the rewards to
+        :param dones: the (num_envs) buffer to write the done flags to
+        :param masks: the (num_envs x num_actions) buffer to write the valid actions masks to
+        """
+        self.num_envs = num_envs
+        self.num_actions = ActionService().num_actions
+        self.observation_size = GameState.SIZE
+        self.games = [ControlledGame(seed=None if seed is None else seed + i)
+                      for i in range(num_envs)]  # type: List[ControlledGame]
+        self._observations = observations if observations is not None \
+            else np.zeros((num_envs, self.observation_size), dtype=self.OBSERVATION_DTYPE)
+        self._rewards = rewards if rewards is not None else np.zeros(num_envs, dtype=self.REWARD_DTYPE)
+        self._dones = dones if dones is not None else np.zeros(num_envs, dtype=bool)
+        self._masks = masks if masks is not None else np.zeros((num_envs, self.num_actions), dtype=bool)
+
+    def reset(self, copy: bool = True) -> np.ndarray:
+        """Reset all games and return their observations."""
+        for i in range(self.num_envs):
+            self._reset_game(i)
+        self._rewards[:] = 0
+        self._dones[:] = False
+        return self._observations.copy() if copy else self._observations
+
+    def step(self, action_indices: np.ndarray,
+             copy: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Execute the action with the given index in each game.
+
+        :param action_indices: the index of the action to execute in each game
+        :param copy: if False, return the buffers themselves, which are overwritten by the next step
+        :return: the observations, rewards, done flags and valid actions masks of the games after the actions
+        """
+        if len(action_indices) != self.num_envs:
+            raise Exception("Expected {} actions, got {}".format(self.num_envs, len(action_indices)))
+        rewards = self._rewards
+        dones = self._dones
+        for i, action_idx in enumerate(np.asarray(action_indices).tolist()):
+            game = self.games[i]
+            rewards[i] = game.play_action(ActionService().idx_to_action(action_idx)).reward
+            if game.board.phase == GamePhase.END_TURN_PHASE:
+                game.switch_player_turns()
+            dones[i] = game.is_finished()
+            if not dones[i]:
+                self._observe(i)
+                # A dead end of the rules (see Game.is_stalled) also ends the game, as no action can be taken
+                dones[i] = not self._masks[i].any()
+            if dones[i]:
+                self._reset_game(i)
+        if copy:
+            return self._observations.copy(), rewards.copy(), dones.copy(), self._masks.copy()
+        return self._observations, rewards, dones, self._masks
+
+    def get_current_actions_masks(self) -> np.ndarray:
+        """Return the valid actions masks of all games."""
+        return self._masks.copy()
+
+    def _reset_game(self, i: int) -> None:
+        self.games[i].reset_game(initialize=True)
+        self._observe(i)
+
+    def _observe(self, i: int) -> None:
+        game = self.games[i]
+        game.get_state().create_numeral_array(game.current_player, out=self._observations[i])
+        # The mask tracked by each game is cheaper than computing the masks of all games at once with
+        # ActionService.get_valid_actions_masks (see the vec_canasta_env_step and valid_actions_masks[batched]
+        # benchmarks), as a step only changes a few cards and series of each game
+        self._masks[i] = game.get_current_actions_mask()
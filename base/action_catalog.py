@@ -0,0 +1,129 @@
+from typing import List, Optional, Iterable, Tuple, Type
+
+import numpy as np
+
+from base.actions.action import Action
+from base.actions.add_back_action import AddBackAction
+from base.actions.add_front_action import AddFrontAction
+from base.actions.discard_card_action import DiscardCardAction
+from base.actions.put_action import PutAction
+from base.actions.swap_joker_action import SwapJokerAction
+from base.actions.swap_two_action import SwapTwoAction
+from base.actions.take_card_action import TakeCardAction
+from base.actions.take_pile_action import TakePileAction
+from base.actions.take_stack_action import TakeStackAction
+from base.card import Card
+from base.cards.card_series import CardSeries
+from base.enums.pile_side import PileSide
+from base.enums.two_swap_direction import TwoSwapDirection
+from base.utils.cache_key import compute_cache_key, load_cache_file, save_cache_file
+from base.utils.card_constants import NUM_CARD_TYPES
+
+
+class ActionCatalog:
+    """
+    Compact representation of the list of all possible actions.
+
+    Each action is stored as its type, card, option (pile side or two-swap direction) and the cards of its series,
+    all cards being stored as card indexes (see :meth:`Card.get_index`), along with the result of
+    :meth:`Action.is_possible`. Action objects are only created on request.
+    The catalog can be stored on disk along with a key identifying the code and constants it was generated with.
+    """
+
+    FORMAT_VERSION = 2
+
+    #: All action types in the catalog, the index in this list is the stored type code
+    ACTION_TYPES = [TakeCardAction, TakePileAction, TakeStackAction, SwapJokerAction, SwapTwoAction,
+                    PutAction, DiscardCardAction, AddFrontAction, AddBackAction]  # type: List[Type[Action]]
+
+    #: The arrays describing the catalog, as stored on disk
+    ARRAY_NAMES = ['type_codes', 'card_indices', 'option_codes', 'series_offsets', 'series_cards', 'possible']
+
+    def __init__(self, type_codes: np.ndarray, card_indices: np.ndarray, option_codes: np.ndarray,
+                 series_offsets: np.ndarray, series_cards: np.ndarray, possible: np.ndarray):
+        self.type_codes = type_codes
+        self.card_indices = card_indices  # Index 0 represents no card
+        self.option_codes = option_codes
+        self.series_offsets = series_offsets  # The series cards of action i are series_cards[offsets[i]:offsets[i + 1]]
+        self.series_cards = series_cards
+        self.possible = possible
+        self._cards = [None] + [Card.from_index(i) for i in range(1, NUM_CARD_TYPES)]
+        self._series = {}  # Actions targeting the same series share the same CardSeries object
+
+    def __len__(self):
+        return len(self.type_codes)
+
+    @classmethod
+    def from_actions(cls, actions: List[Action]) -> 'ActionCatalog':
+        type_codes = np.zeros(len(actions), dtype=np.int8)
+        card_indices = np.zeros(len(actions), dtype=np.int8)
+        option_codes = np.zeros(len(actions), dtype=np.int8)
+        series_offsets = np.zeros(len(actions) + 1, dtype=np.int32)
+        series_cards = []
+        possible = np.zeros(len(actions), dtype=bool)
+        for i, action in enumerate(actions):
+            type_codes[i] = cls.ACTION_TYPES.index(type(action))
+            card = getattr(action, 'card', None)
+            if card is not None:
+                card_indices[i] = card.get_index()
+            series = getattr(action, 'series', None)
+            if series is not None:
+                series_cards.extend(cls.series_key(series))
+            series_offsets[i + 1] = len(series_cards)
+            if isinstance(action, SwapTwoAction):
+                option_codes[i] = list(TwoSwapDirection).index(action.direction)
+            elif isinstance(action, TakePileAction):
+                option_codes[i] = list(PileSide).index(action.side)
+            possible[i] = action.is_possible()
+        return cls(type_codes, card_indices, option_codes, series_offsets, np.array(series_cards, dtype=np.int8),
+                   possible)
+
+    @classmethod
+    def load(cls, path: str, key: str) -> Optional['ActionCatalog']:
+        """Load the catalog stored at the given path, None if there is no such file or if it has a different key."""
+        data = load_cache_file(path, key, cls.ARRAY_NAMES)
+        return cls(**data) if data is not None else None
+
+    def save(self, path: str, key: str) -> None:
+        """Store this catalog at the given path, along with the given key."""
+        save_cache_file(path, key, {name: getattr(self, name) for name in self.ARRAY_NAMES})
+
+    @classmethod
+    def compute_key(cls, sources: Iterable[object]) -> str:
+        """Return a key identifying the catalog generated by the given modules and the current Constants."""
+        return compute_cache_key(cls.FORMAT_VERSION, sources)
+
+    @staticmethod
+    def series_key(series: CardSeries) -> Tuple[int, ...]:
+        """Return the tuple of card indexes of the given series, as used to identify series in the catalog."""
+        return tuple(card.get_index() for card in series)
+
+    def get_types(self) -> List[Type[Action]]:
+        """Return the type of each action in the catalog."""
+        return [self.ACTION_TYPES[type_code] for type_code in self.type_codes.tolist()]
+
+    def get_series_keys(self) -> List[Tuple[int, ...]]:
+        """Return the series key of each action in the catalog, the empty tuple for actions without series."""
+        offsets = self.series_offsets.tolist()
+        series_cards = self.series_cards.tolist()
+        return [tuple(series_cards[offsets[i]:offsets[i + 1]]) for i in range(len(self))]
+
+    def create_action(self, i: int) -> Action:
+        """Create the action with the given index."""
+        action_type = self.ACTION_TYPES[self.type_codes[i]]
+        card = self._cards[self.card_indices[i]]
+        series_key = tuple(self.series_cards[self.series_offsets[i]:self.series_offsets[i + 1]].tolist())
+        if action_type is PutAction:
+            return PutAction([self._cards[c] for c in series_key])
+        elif action_type is DiscardCardAction:
+            return DiscardCardAction(card=card)
+        elif action_type is TakePileAction:
+            return TakePileAction(list(PileSide)[self.option_codes[i]])
+        elif action_type in (AddFrontAction, AddBackAction, SwapJokerAction, SwapTwoAction):
+            series = self._series.get(series_key)
+            if series is None:
+                series = self._series[series_key] = CardSeries([self._cards[c] for c in series_key])
+            if action_type is SwapTwoAction:
+                return SwapTwoAction(card=card, series=series, direction=list(TwoSwapDirection)[self.option_codes[i]])
+            return action_type(card=card, series=series)
+        return action_type()
@@ -0,0 +1,214 @@
+from typing import Callable, Dict, List, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from base.action_catalog import ActionCatalog
+from base.actions.action import Action
+from base.actions.put_action import PutAction
+from base.actions.series_interaction_action import SeriesInteractionAction
+from base.actions.take_pile_action import TakePileAction
+from base.cards.series_catalog import SeriesCatalog
+from base.enums.game_phase import GamePhase
+from base.utils.card_constants import NUM_CARD_TYPES
+from base.utils.generators import hand_series_generator
+
+if TYPE_CHECKING:
+    from base.board import Board
+    from base.player import Player
+    from base.cards.hand import Hand
+
+
+class ActionMaskEngine:
+    """
+    Vectorized computation of the valid actions mask.
+
+    The card requirements of all actions are stored as a sparse (actions x card types) matrix of required counts,
+    ordered by card type and count. The requirements met by a hand are then the leading entries of the columns of
+    the card types it holds, so checking the cards of all actions comes down to counting those entries per action.
+    Phase and board series constraints are applied as boolean masks.
+    For many games at once, the card and phase requirements are multiplied with the conditions met by each game
+    ('holds at least c cards of type t', 'the board is in phase p') as a single sparse matrix product.
+    The few conditions which depend on more of the game state (clearing the hand, taking a pile) are delegated to
+    :meth:`Action.validate`, only for the actions which passed all other checks.
+
+    Whether an action can be valid at all (valid series, addable or swappable card) is taken from the catalog.
+    For a single hand, the put actions it holds the cards of are enumerated from the hand (see
+    :func:`hand_series_generator`) rather than checked among all put actions.
+    """
+
+    def __init__(self, catalog: ActionCatalog, get_action: Callable[[int], Action],
+                 series_to_put_idx: Dict[Tuple[int, ...], int]):
+        self.num_actions = len(catalog)
+        self._get_action = get_action
+        self._series_to_put_idx = series_to_put_idx
+        type_codes = catalog.type_codes.astype(np.intp)
+        action_types = ActionCatalog.ACTION_TYPES
+        is_put = type_codes == action_types.index(PutAction)
+        is_series_interaction = np.isin(type_codes, [code for code, action_type in enumerate(action_types)
+                                                     if issubclass(action_type, SeriesInteractionAction)])
+        series_lengths = np.diff(catalog.series_offsets)
+        series_rows = np.repeat(np.arange(self.num_actions), series_lengths)
+        contains_joker = np.zeros(self.num_actions, dtype=bool)
+        contains_joker[series_rows[catalog.series_cards == NUM_CARD_TYPES - 1]] = True
+
+        # Card requirements: the series cards of put actions and the single card of all other actions
+        card_rows = np.flatnonzero(catalog.card_indices)
+        rows = np.concatenate([series_rows[is_put[series_rows]], card_rows])
+        cols = np.concatenate([catalog.series_cards[is_put[series_rows]], catalog.card_indices[card_rows]])
+        entries, counts = np.unique(rows * NUM_CARD_TYPES + cols.astype(np.intp), return_counts=True)
+        rows, cols = np.divmod(entries, NUM_CARD_TYPES)
+        order = np.lexsort((counts, cols))
+        self._requirement_rows = rows[order]
+        self._num_requirements = np.bincount(rows, minlength=self.num_actions)
+        # The requirements for card type t which are met when holding c such cards are
+        # _requirement_rows[_column_ends[t, 0]:_column_ends[t, c]], with c at most _max_count
+        self._max_count = counts.max()
+        column_keys = cols[order] * (self._max_count + 1) + counts[order]
+        card_types = np.arange(NUM_CARD_TYPES)
+        self._column_ends = np.searchsorted(column_keys, card_types[:, None] * (self._max_count + 1)
+                                            + np.arange(self._max_count + 1)[None, :], side='right')
+        # For each phase, the actions whose type allows them in that phase. In the play joker phase, only put actions
+        # of a series containing the joker and actions adding the joker itself are allowed
+        self._phase_masks = {}  # type: Dict[GamePhase, np.ndarray]
+        for phase in GamePhase:
+            self._phase_masks[phase] = np.isin(type_codes, [code for code, action_type in enumerate(action_types)
+                                                            if phase in action_type.VALID_PHASES])
+        self._phase_masks[GamePhase.PLAY_JOKER_PHASE] &= ((is_put & contains_joker)
+                                                          | (catalog.card_indices == NUM_CARD_TYPES - 1))
+        for phase_mask in self._phase_masks.values():
+            phase_mask &= catalog.possible
+        # For many games at once, all requirements as an (actions x conditions) matrix: holding at least c cards of
+        # type t (condition t * _max_count + c - 1), then the board being in each phase. Series interaction actions
+        # also require their series to be on the board, which is counted separately
+        self._phase_codes = {phase: code for code, phase in enumerate(self._phase_masks)}
+        phase_rows, phase_codes = np.nonzero(np.column_stack(list(self._phase_masks.values())))
+        self._requirement_matrix = csr_matrix(
+            (np.ones(len(rows) + len(phase_rows), dtype=np.int8),
+             (np.concatenate([rows, phase_rows]),
+              np.concatenate([cols * self._max_count + counts - 1, NUM_CARD_TYPES * self._max_count + phase_codes]))),
+            shape=(self.num_actions, NUM_CARD_TYPES * self._max_count + len(self._phase_codes)))
+        self._num_batch_requirements = (self._num_requirements + 1 + is_series_interaction).astype(np.int8)
+        self._not_series_interaction = ~is_series_interaction
+        # Actions are validated individually when the player holds at most this many cards, as they might clear its hand
+        self._clear_thresholds = np.full(self.num_actions, -1, dtype=np.int8)
+        self._clear_thresholds[is_put] = series_lengths[is_put] + 1
+        self._clear_thresholds[is_series_interaction] = 2
+        self._max_clear_threshold = self._clear_thresholds.max()
+        # All actions by decreasing threshold, with for every number of cards the number of actions to validate
+        self._clearing_order = np.argsort(-self._clear_thresholds, kind='stable')
+        self._num_clearing = np.searchsorted(-self._clear_thresholds[self._clearing_order],
+                                             -np.arange(self._max_clear_threshold + 1), side='right')
+        self._validated_indices = np.flatnonzero(type_codes == action_types.index(TakePileAction))
+        # The actions requiring a single card (or none, card type 0) ordered by card type, the actions requiring card
+        # type t being _single_card_order[_single_card_ends[t]:_single_card_ends[t + 1]]
+        single_card_types = np.where(is_put, NUM_CARD_TYPES, catalog.card_indices)
+        self._single_card_order = np.argsort(single_card_types, kind='stable')
+        self._single_card_ends = np.searchsorted(single_card_types[self._single_card_order],
+                                                 np.arange(NUM_CARD_TYPES + 1)).tolist()
+
+    def get_valid_actions_mask(self, player: 'Player', board: 'Board') -> np.ndarray:
+        """Return a boolean array with, for every action index, whether that action is valid for the given player and board."""
+        if board.phase not in self._phase_masks:
+            return np.zeros(self.num_actions, dtype=bool)
+        mask = self._phase_masks[board.phase] & self.get_possession_mask(player.hand)
+        # Series interaction actions are only valid for the series the team of the player has on the board
+        on_board_indices = list(board.get_series_action_indices(player.team))
+        on_board_mask = mask[on_board_indices]
+        mask &= self._not_series_interaction
+        mask[on_board_indices] = on_board_mask
+        return self._validate_remaining(mask, player, board)
+
+    def get_valid_actions_masks(self, pairs: Sequence[Tuple['Player', 'Board']]) -> np.ndarray:
+        """
+        Return a boolean array of shape (number of pairs, number of actions) with, for every (player, board) pair,
+        whether each action is valid for that player and board.
+
+        The masks are computed action-major, so the returned array is the transpose of a C-ordered array.
+        """
+        num_pairs = len(pairs)
+        if num_pairs == 0:
+            return np.zeros((0, self.num_actions), dtype=bool)
+        conditions = np.zeros((self._requirement_matrix.shape[1], num_pairs), dtype=np.int8)
+        hand_counts = self.get_hand_counts_matrix([player.hand for player, _ in pairs])
+        for c in range(self._max_count):
+            conditions[c:NUM_CARD_TYPES * self._max_count:self._max_count] = hand_counts.T > c
+        for i, (_, board) in enumerate(pairs):
+            if board.phase in self._phase_codes:
+                conditions[NUM_CARD_TYPES * self._max_count + self._phase_codes[board.phase], i] = 1
+        num_met = self._requirement_matrix @ conditions
+        # Series interaction actions are only valid for the series the team of the player has on the board
+        on_board_indices = [np.fromiter(board.get_series_action_indices(player.team), dtype=np.intp) * num_pairs + i
+                            for i, (player, board) in enumerate(pairs)]
+        num_met.reshape(-1)[np.concatenate(on_board_indices)] += 1
+        masks = num_met == self._num_batch_requirements[:, None]
+        # Validate the actions depending on the rest of the game state one by one
+        for j, i in zip(*np.nonzero(masks[self._validated_indices])):
+            player, board = pairs[i]
+            masks[self._validated_indices[j], i] = self._get_action(self._validated_indices[j]).validate(player, board)
+        for i, (player, board) in enumerate(pairs):
+            clearing_indices = self._get_clearing_indices(player.num_cards())
+            for j in clearing_indices[masks[clearing_indices, i]]:
+                masks[j, i] = self._get_action(j).validate(player=player, board=board)
+        return masks.T
+
+    def complete_mask(self, card_and_series_mask: np.ndarray, player: 'Player', board: 'Board') -> np.ndarray:
+        """
+        Return the valid actions mask, given whether the player holds the cards and (for series interaction actions)
+        its team has the series on the board, for every action.
+        """
+        if board.phase not in self._phase_masks:
+            return np.zeros(self.num_actions, dtype=bool)
+        return self._validate_remaining(self._phase_masks[board.phase] & card_and_series_mask, player, board)
+
+    def _validate_remaining(self, mask: np.ndarray, player: 'Player', board: 'Board') -> np.ndarray:
+        """Validate the actions of the given mask which depend on the rest of the game state one by one."""
+        for i in self._validated_indices[mask[self._validated_indices]]:
+            mask[i] = self._get_action(i).validate(player=player, board=board)
+        clearing_indices = self._get_clearing_indices(player.num_cards())
+        for i in clearing_indices[mask[clearing_indices]]:
+            mask[i] = self._get_action(i).validate(player=player, board=board)
+        return mask
+
+    def _get_clearing_indices(self, num_cards: int) -> np.ndarray:
+        """Return the indexes of the actions which might clear the hand of a player holding the given number of cards."""
+        if num_cards > self._max_clear_threshold:
+            return self._clearing_order[:0]
+        return self._clearing_order[:self._num_clearing[num_cards]]
+
+    def get_series_interaction_mask(self) -> np.ndarray:
+        """Return a boolean array with, for every action index, whether that action interacts with a board series."""
+        return ~self._not_series_interaction
+
+    def get_num_requirements(self) -> np.ndarray:
+        """Return the number of distinct card types each action requires."""
+        return self._num_requirements
+
+    def get_requirement_rows(self, card_type: int, lower_count: int, upper_count: int) -> np.ndarray:
+        """
+        Return the indexes of the actions whose requirement for the given card type is met by holding upper_count such
+        cards, but not by holding lower_count such cards.
+        """
+        return self._requirement_rows[self._column_ends[card_type, min(lower_count, self._max_count)]:
+                                      self._column_ends[card_type, min(upper_count, self._max_count)]]
+
+    def get_possession_mask(self, hand: 'Hand') -> np.ndarray:
+        """Return a boolean array with, for every action index, whether the given hand holds all cards of that action."""
+        hand_counts = self.get_hand_counts(hand)
+        mask = np.zeros(self.num_actions, dtype=bool)
+        for card_type in [0] + np.flatnonzero(hand_counts).tolist():
+            mask[self._single_card_order[self._single_card_ends[card_type]:self._single_card_ends[card_type + 1]]] = True
+        put_indices = [self._series_to_put_idx[series] for series in hand_series_generator(
+            hand_counts.tolist(), min_length=SeriesCatalog.MIN_LENGTH, max_length=SeriesCatalog.MAX_LENGTH)]
+        mask[put_indices] = True
+        return mask
+
+    @staticmethod
+    def get_hand_counts_matrix(hands: List['Hand']) -> np.ndarray:
+        """Return the number of cards of each card type (see :meth:`Card.get_index`) in each of the given hands."""
+        return np.array([hand.get_counts() for hand in hands]).reshape(len(hands), NUM_CARD_TYPES)
+
+    @staticmethod
+    def get_hand_counts(hand: 'Hand') -> np.ndarray:
+        """Return the number of cards of each card type (see :meth:`Card.get_index`) in the given hand."""
+        return hand.get_counts()
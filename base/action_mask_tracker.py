@@ -0,0 +1,100 @@
+from typing import Dict, Set, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from base.action_service import ActionService
+from base.enums.team_color import TeamColor
+
+if TYPE_CHECKING:
+    from base.board import Board
+    from base.cards.hand import Hand
+    from base.player import Player
+
+
+class ActionMaskTracker:
+    """
+    Keeps the valid actions mask up to date as actions are executed, instead of recomputing it from scratch.
+
+    For every player, the number of card requirements met by its hand is kept per action, and for every team, which
+    series interaction actions target a series on its board. After an action, only the actions requiring one of the
+    card types that changed in the hand, or targeting one of the series that changed on the board, are updated.
+    In debug mode, every mask is cross-checked against the full recomputation.
+    """
+
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+        self._engine = ActionService().get_mask_engine()
+        self._num_requirements = self._engine.get_num_requirements()
+        self._hands = {}  # type: Dict[int, Hand]
+        self._hand_counts = {}  # type: Dict[int, np.ndarray]
+        self._num_met = {}  # type: Dict[int, np.ndarray]
+        self._has_cards = {}  # type: Dict[int, np.ndarray]
+        self._board = None  # type: Optional[Board]
+        self._series_indices = {}  # type: Dict[TeamColor, Set[int]]
+        self._series_versions = {}  # type: Dict[TeamColor, int]
+        self._series_available = {}  # type: Dict[TeamColor, np.ndarray]
+
+    def update(self, player: 'Player', board: 'Board') -> None:
+        """Bring the tracked state of the given player's hand and its team's series on the board up to date."""
+        self._update_hand(player)
+        self._update_series(player, board)
+
+    def get_valid_actions_mask(self, player: 'Player', board: 'Board') -> np.ndarray:
+        """Return a boolean mask corresponding to the unique indexes representing the valid actions for the given player and board."""
+        self.update(player, board)
+        mask = self._engine.complete_mask(self._has_cards[player.identifier]
+                                          & self._series_available[player.team_color], player, board)
+        if self.debug:
+            expected = self._engine.get_valid_actions_mask(player, board)
+            differences = np.flatnonzero(mask != expected)
+            if len(differences) > 0:
+                raise Exception("Tracked actions mask differs from the full recomputation for actions {}"
+                                .format([ActionService().idx_to_action(i) for i in differences]))
+        return mask
+
+    def _update_hand(self, player: 'Player') -> None:
+        key = player.identifier
+        hand_counts = self._engine.get_hand_counts(player.hand)
+        if self._hands.get(key) is not player.hand:
+            # A new hand (e.g. a new game), start from scratch
+            self._hands[key] = player.hand
+            self._hand_counts[key] = hand_counts
+            num_met = np.zeros_like(self._num_requirements)
+            for card_type in np.flatnonzero(hand_counts).tolist():
+                num_met[self._engine.get_requirement_rows(card_type, 0, hand_counts[card_type])] += 1
+            self._num_met[key] = num_met
+            self._has_cards[key] = num_met == self._num_requirements
+            return
+        previous_counts = self._hand_counts[key]
+        num_met = self._num_met[key]
+        has_cards = self._has_cards[key]
+        for card_type in np.flatnonzero(hand_counts != previous_counts).tolist():
+            previous_count, count = previous_counts[card_type], hand_counts[card_type]
+            if count > previous_count:
+                rows = self._engine.get_requirement_rows(card_type, previous_count, count)
+                num_met[rows] += 1
+            else:
+                rows = self._engine.get_requirement_rows(card_type, count, previous_count)
+                num_met[rows] -= 1
+            has_cards[rows] = num_met[rows] == self._num_requirements[rows]
+        self._hand_counts[key] = hand_counts
+
+    def _update_series(self, player: 'Player', board: 'Board') -> None:
+        if self._board is not board:
+            # A new board (e.g. a new game), start from scratch
+            self._board = board
+            self._series_indices = {color: set() for color in TeamColor}
+            self._series_versions = {color: -1 for color in TeamColor}
+            self._series_available = {color: ~self._engine.get_series_interaction_mask() for color in TeamColor}
+        color = player.team_color
+        # Only look up the actions of the series again when a series was put on the board, altered or removed
+        series_version = board.get_series_version(player.team)
+        if series_version == self._series_versions[color]:
+            return
+        self._series_versions[color] = series_version
+        series_indices = set(board.get_series_action_indices(player.team))
+        previous_series_indices = self._series_indices[color]
+        if series_indices != previous_series_indices:
+            self._series_available[color][list(previous_series_indices - series_indices)] = False
+            self._series_available[color][list(series_indices - previous_series_indices)] = True
+            self._series_indices[color] = series_indices
@@ -1,59 +1,146 @@
-from copy import copy
-from typing import List
+import logging
+import os
+from collections import defaultdict
+from typing import List, Dict, Optional, Sequence, Tuple, TYPE_CHECKING
 
+import numpy as np
+
+from base.action_catalog import ActionCatalog
+from base.action_mask_engine import ActionMaskEngine
 from base.actions.action import Action
 from base.actions.add_back_action import AddBackAction
 from base.actions.add_front_action import AddFrontAction
 from base.actions.discard_card_action import DiscardCardAction
 from base.actions.put_action import PutAction
+from base.actions.series_interaction_action import SeriesInteractionAction
 from base.actions.swap_joker_action import SwapJokerAction
 from base.actions.swap_two_action import SwapTwoAction
 from base.actions.take_card_action import TakeCardAction
 from base.actions.take_pile_action import TakePileAction
 from base.actions.take_stack_action import TakeStackAction
-from base.board import Board
 from base.card import Card
+from base.cards import series_catalog
+from base.cards.card_series import CardSeries
+from base.cards.series_catalog import SeriesCatalog
+from base.cards.series_code import SeriesCode
+from base.constants import Constants
 from base.enums.pile_side import PileSide
 from base.enums.two_swap_direction import TwoSwapDirection
-from base.player import Player
 from base.utils.card_constants import POSSIBLE_SUIT, JOKER_SUIT, JOKER_RANK, POSSIBLE_RANK
-from base.utils.generators import series_generator
+from base.utils import card_constants, generators
 from base.utils.singleton import Singleton
 
+if TYPE_CHECKING:
+    from base.board import Board
+    from base.player import Player
+
 
 class ActionService(metaclass=Singleton):
 
+    CATALOG_FILE_NAME = "action_catalog.npz"
+
     def __init__(self):
-        self._all_actions = (list(self._get_take_card_actions()) +
-                             list(self._get_take_pile_actions()) +
-                             list(self._get_take_stack_actions()) +
-                             list(self._get_swap_joker_actions()) +
-                             list(self._get_swap_two_actions()) +
-                             list(self._get_put_actions()) +
-                             list(self._get_discard_card_actions()) +
-                             list(self._get_add_front_actions()) +
-                             list(self._get_add_back_actions()))  # type: List['Action']
-        self.num_actions = len(self._all_actions)
-        self._action_to_idx = {action: i for i, action in enumerate(self._all_actions)}
-        self._idx_to_action = {i: action for action, i in self._action_to_idx.items()}
+        self._catalog = self._load_catalog()
+        self.num_actions = len(self._catalog)
+        self._actions = [None] * self.num_actions  # type: List[Optional[Action]]  # Created from the catalog on first use
+        # Put actions are looked up by their series, series interaction actions by the series they target
+        self._series_to_put_idx = {}  # type: Dict[Tuple[int, ...], int]
+        self._series_to_action_indices = defaultdict(list)  # type: Dict[Tuple[int, ...], List[int]]
+        self._other_indices = []  # type: List[int]
+        for i, (action_type, series_key) in enumerate(zip(self._catalog.get_types(), self._catalog.get_series_keys())):
+            if action_type is PutAction:
+                self._series_to_put_idx[series_key] = i
+            elif issubclass(action_type, SeriesInteractionAction):
+                self._series_to_action_indices[series_key].append(i)
+            else:
+                self._other_indices.append(i)
+        self._series_to_action_indices = dict(self._series_to_action_indices)
+        self._code_to_action_indices = {}  # type: Dict[int, List[int]]  # Filled on first lookup of each series code
+        self._mask_engine = ActionMaskEngine(self._catalog, self.idx_to_action, self._series_to_put_idx)
 
     def action_to_idx(self, action: 'Action') -> int:
         """Return the unique index associated with the given action."""
-        return self._action_to_idx[action]
+        if isinstance(action, PutAction):
+            return self._series_to_put_idx[ActionCatalog.series_key(action.series)]
+        if isinstance(action, SeriesInteractionAction):
+            candidates = self._series_to_action_indices.get(ActionCatalog.series_key(action.series), [])
+        else:
+            candidates = self._other_indices
+        for i in candidates:
+            if self.idx_to_action(i) == action:
+                return i
+        raise KeyError(action)
 
     def idx_to_action(self, index: int) -> 'Action':
-        """Return the action associated with the given unique index."""
-        # Always return a copy so a unique action object is obtained
-        return copy(self._idx_to_action[index])
+        """
+        Return the action associated with the given unique index.
+
+        Actions are immutable, so the same action object is shared by all callers. It is created on first use.
+        """
+        action = self._actions[index]
+        if action is None:
+            action = self._actions[index] = self._catalog.create_action(index)
+        return action
+
+    def get_mask_engine(self) -> ActionMaskEngine:
+        """Return the engine computing the valid actions masks."""
+        return self._mask_engine
+
+    def get_series_action_indices(self, series: CardSeries) -> List[int]:
+        """Return the indexes of all series interaction actions (add, swap) that target the given series."""
+        code = series.get_code()
+        if code is None:
+            return self._series_to_action_indices.get(ActionCatalog.series_key(series), [])
+        action_indices = self._code_to_action_indices.get(code)
+        if action_indices is None:
+            action_indices = self._code_to_action_indices[code] = \
+                self._series_to_action_indices.get(ActionCatalog.series_key(series), [])
+        return action_indices
 
     def get_valid_actions(self, player: 'Player', board: 'Board') -> List['Action']:
         """Return a list of all valid actions for the given player on the given board."""
-        # Make sure to return copies of each action so they can be executed later on
-        return [copy(a) for a in self._all_actions if a.validate(player=player, board=board)]
+        return [self.idx_to_action(i) for i in self.get_valid_action_indices(player, board).tolist()]
+
+    def get_valid_action_indices(self, player: 'Player', board: 'Board') -> np.ndarray:
+        """Return the unique indexes of all valid actions for the given player on the given board, in increasing order."""
+        return np.flatnonzero(self.get_valid_actions_mask(player, board))
 
-    def get_valid_actions_mask(self, player: 'Player', board: 'Board') -> List[bool]:
+    def get_valid_actions_mask(self, player: 'Player', board: 'Board') -> np.ndarray:
         """Return a boolean mask corresponding to the unique indexes representing the valid actions for the given player and board."""
-        return [a.validate(player=player, board=board) for a in self._all_actions]
+        return self._mask_engine.get_valid_actions_mask(player, board)
+
+    def get_valid_actions_masks(self, pairs: Sequence[Tuple['Player', 'Board']]) -> np.ndarray:
+        """
+        Return the valid actions masks of many (player, board) pairs at once, e.g. for many concurrent games,
+        stacked as a boolean array of shape (number of pairs, number of actions).
+        """
+        return self._mask_engine.get_valid_actions_masks(pairs)
+
+    def _load_catalog(self) -> ActionCatalog:
+        """Return the catalog of all possible actions, loaded from disk if possible. Generates (and stores) it otherwise."""
+        # The catalog stores card indexes and series codes, so it also depends on the encoding of the cards
+        key = ActionCatalog.compute_key([ActionService, ActionCatalog, CardSeries, series_catalog, generators, Card,
+                                         SeriesCode, card_constants] + ActionCatalog.ACTION_TYPES)
+        path = os.path.join(Constants.ACTION_CACHE_DIR, self.CATALOG_FILE_NAME)
+        catalog = ActionCatalog.load(path, key)
+        if catalog is None:
+            catalog = ActionCatalog.from_actions(self._generate_all_actions())
+            try:
+                catalog.save(path, key)
+            except OSError as e:
+                logging.warning("Could not store the action catalog in {}: {}".format(path, e))
+        return catalog
+
+    def _generate_all_actions(self) -> List['Action']:
+        return (list(self._get_take_card_actions()) +
+                list(self._get_take_pile_actions()) +
+                list(self._get_take_stack_actions()) +
+                list(self._get_swap_joker_actions()) +
+                list(self._get_swap_two_actions()) +
+                list(self._get_put_actions()) +
+                list(self._get_discard_card_actions()) +
+                list(self._get_add_front_actions()) +
+                list(self._get_add_back_actions()))
 
     #####################
     # ACTION GENERATORS #
@@ -74,17 +161,19 @@ class ActionService(metaclass=Singleton):
 
     @staticmethod
     def _get_swap_joker_actions() -> List['Action']:
-        for series in series_generator(min_length=3, max_length=14):
+        catalog = SeriesCatalog()
+        for series_id, series in enumerate(catalog.series):
             if series.has_joker():
-                options = series.get_swap_joker_options()
+                options = catalog.get_swap_joker_options(series_id)
                 for option in options:
                     yield SwapJokerAction(card=option, series=series)
 
     @staticmethod
     def _get_swap_two_actions() -> List['Action']:
-        for series in series_generator(min_length=3, max_length=14):
+        catalog = SeriesCatalog()
+        for series_id, series in enumerate(catalog.series):
             if series.has_two_joker():
-                options = series.get_swap_two_options()
+                options = catalog.get_swap_two_options(series_id)
                 for option in options:
                     # We cannot put the two-joker to the front if either:
                     #    - There is an ace in front of the series
@@ -99,8 +188,8 @@ class ActionService(metaclass=Singleton):
 
     @staticmethod
     def _get_put_actions() -> List['Action']:
-        for series in series_generator(min_length=3, max_length=14):
-            yield PutAction(cards=series.get_raw_cards())
+        for series in SeriesCatalog().series:
+            yield PutAction(cards=list(series.get_raw_cards()))
 
     @staticmethod
     def _get_discard_card_actions() -> List['Action']:
@@ -111,14 +200,16 @@ class ActionService(metaclass=Singleton):
 
     @staticmethod
     def _get_add_front_actions() -> List['Action']:
-        for series in series_generator(min_length=3, max_length=14):
-            add_front_options = series.get_add_front_options()
+        catalog = SeriesCatalog()
+        for series_id, series in enumerate(catalog.series):
+            add_front_options = catalog.get_add_front_options(series_id)
             for option in add_front_options:
                 yield AddFrontAction(card=option, series=series)
 
     @staticmethod
     def _get_add_back_actions() -> List['Action']:
-        for series in series_generator(min_length=3, max_length=14):
-            add_back_options = series.get_add_back_options()
+        catalog = SeriesCatalog()
+        for series_id, series in enumerate(catalog.series):
+            add_back_options = catalog.get_add_back_options(series_id)
             for option in add_back_options:
                 yield AddBackAction(card=option, series=series)
@@ -1,7 +1,8 @@
 from abc import ABCMeta, abstractmethod
 from numbers import Number
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List
 
+from base.actions.action_result import ActionResult
 from base.enums.game_phase import GamePhase
 
 if TYPE_CHECKING:
@@ -10,10 +11,19 @@ if TYPE_CHECKING:
 
 
 class Action(metaclass=ABCMeta):
+    """
+    Base class for all actions.
+
+    Actions are immutable descriptors of a move, which can be shared and executed any number of times.
+    Everything resulting from executing an action is returned by :meth:`execute` as an :class:`ActionResult`.
+    """
+
+    #: The game phases in which an action of this type can possibly be valid, the single source of the phases of each
+    #: action type. In the PLAY_JOKER_PHASE, only actions playing the joker are valid (see :meth:`validate`)
+    VALID_PHASES = []  # type: List[GamePhase]
 
     def __init__(self):
         super().__init__()
-        self.is_executed = False
 
     @abstractmethod
     def _key(self):
@@ -25,35 +35,68 @@ class Action(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    def _execute(self, player: 'Player', board: 'Board'):
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
+        """Perform this action for the given player on the given board and return the obtained reward."""
         raise NotImplementedError
 
     @abstractmethod
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         raise NotImplementedError
 
+    def _get_undo_data(self, player: 'Player', board: 'Board') -> Any:
+        """Return the data needed by :meth:`_undo` to revert this action, collected right before executing it."""
+        return None
+
+    @abstractmethod
+    def _undo(self, player: 'Player', board: 'Board', undo_data: Any) -> None:
+        """Revert the changes made by :meth:`_execute`, given the data returned by :meth:`_get_undo_data`."""
+        raise NotImplementedError
+
+    def is_possible(self) -> bool:
+        """
+        Return False if this action can never be valid, regardless of the player and board.
+
+        Like :attr:`VALID_PHASES`, this only depends on the action itself.
+        """
+        return True
+
     def get_reward(self) -> Number:
-        """Return the reward for this action, assuming the action has already been executed."""
+        """Return the reward for this action, for actions whose reward does not depend on the board."""
         return 0
 
     def will_create_pure(self, player: 'Player', board: 'Board') -> bool:
         """Return True if executing this action will create a pure canasta for the player."""
         return False
 
-    def execute(self, player: 'Player', board: 'Board') -> None:
+    def execute(self, player: 'Player', board: 'Board') -> ActionResult:
         """
         Validate this action for the given player and board, execute the action and update the board phase.
 
         :param player: player performing the action
         :param board: board on which the action is performed
+        :return: the result of executing this action
         """
-        if self.is_executed:
-            raise Exception("Cannot execute the same action twice!")
         if not self.validate(player=player, board=board, verbose=True):
             raise Exception("Invalid action. \n {} \n {} \n {}".format(self, player, board))
-        self._execute(player, board)
-        self.is_executed = True
+        previous_phase = board.phase
+        undo_data = self._get_undo_data(player, board)
+        reward = self._execute(player, board)
         board.set_phase(self._target_phase(player=player, board=board))
+        return ActionResult(self, reward, previous_phase, undo_data)
+
+    def undo(self, player: 'Player', board: 'Board', result: ActionResult) -> None:
+        """
+        Revert executing this action, restoring the player and board exactly as they were before.
+
+        Actions must be undone in the reverse order in which they were executed, as each undo expects the player and
+        board to be in the state right after executing the action.
+
+        :param player: player who performed the action
+        :param board: board on which the action was performed
+        :param result: the result of executing this action
+        """
+        self._undo(player, board, result.undo_data)
+        board.set_phase(result.previous_phase)
 
     def __repr__(self):
         return self.__str__()
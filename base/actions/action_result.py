@@ -0,0 +1,25 @@
+from numbers import Number
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from base.actions.action import Action
+    from base.enums.game_phase import GamePhase
+
+
+class ActionResult:
+    """
+    The outcome of executing an action: the executed action and the reward obtained by executing it.
+
+    It also holds what is needed to undo the action (see :meth:`Action.undo`): the game phase before the action and
+    the action specific undo data.
+    """
+
+    def __init__(self, action: 'Action', reward: Number, previous_phase: Optional['GamePhase'] = None,
+                 undo_data: Any = None):
+        self.action = action
+        self.reward = reward
+        self.previous_phase = previous_phase
+        self.undo_data = undo_data
+
+    def __repr__(self):
+        return "ActionResult({}, reward={})".format(self.action, self.reward)
@@ -1,10 +1,13 @@
 import logging
+from numbers import Number
 from typing import TYPE_CHECKING
 
 from base.actions.action import Action
 from base.actions.series_interaction_action import SeriesInteractionAction
 from base.card import Card
+from base.card_auditor import CardAuditor
 from base.cards.card_series import CardSeries
+from base.cards.series_catalog import SeriesCatalog
 from base.enums.game_phase import GamePhase
 
 if TYPE_CHECKING:
@@ -14,6 +17,8 @@ if TYPE_CHECKING:
 
 class AddFrontAction(SeriesInteractionAction):
 
+    VALID_PHASES = [GamePhase.ACTION_PHASE, GamePhase.PLAY_JOKER_PHASE]
+
     def __init__(self, card: Card, series: CardSeries):
         super().__init__(series)
         self.card = card
@@ -24,7 +29,7 @@ class AddFrontAction(SeriesInteractionAction):
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
         # Check the board phase
-        if board.phase not in [GamePhase.ACTION_PHASE, GamePhase.PLAY_JOKER_PHASE]:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
@@ -36,27 +41,35 @@ class AddFrontAction(SeriesInteractionAction):
         if player.num_cards() <= 2 and not board.player_may_clear_hand(player, self):
             return False
         # Make sure the player is adding to its own teams series
-        team_series = board.get_series_for_player(player)
-        if self.series not in team_series:
+        if not board.has_series(player.team, self.series):
             return False
         # Make sure the player has the card it wants to add in its hand
         if self.card not in player.hand:
             return False
         # Make sure the card is addable to the series
-        add_front_options = self.series.get_add_front_options()
-        if self.card not in add_front_options:
+        if not self.is_possible():
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
-        pre_execution_value = self.series.get_total_value()
+    def is_possible(self) -> bool:
+        return SeriesCatalog().is_add_front_option(self.series, self.card)
+
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         player.hand.pop(self.card)
+        if board.auditor is not None:
+            board.auditor.move(self.card, CardAuditor.hand(player), CardAuditor.series(player.team))
         # Make sure to add the card to the series on the board (not self.series!)
-        for series in board.get_series_for_player(player):
-            if series == self.series:
-                series.add_front(self.card)
-                break
-        self.score_value = self.series.get_total_value() - pre_execution_value
+        series = board.find_series(player.team, self.series)
+        pre_execution_value = series.get_total_value()
+        series.add_front(self.card)
+        board.update_series_index(player.team, series)
+        return series.get_total_value() - pre_execution_value
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data) -> None:
+        player.hand.add(self.card)
+        if board.auditor is not None:
+            board.auditor.move(self.card, CardAuditor.series(player.team), CardAuditor.hand(player))
+        self._restore_series(player, board, undo_data)
 
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         if player.hand.is_empty():
@@ -70,5 +83,4 @@ class AddFrontAction(SeriesInteractionAction):
         return False
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}AddFront {}  >>>  {}".format(execution_tag, self.card, self.series)
+        return "AddFront {}  >>>  {}".format(self.card, self.series)
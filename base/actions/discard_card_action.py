@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from base.actions.action import Action
 from base.card import Card
+from base.card_auditor import CardAuditor
 from base.enums.game_phase import GamePhase
 
 if TYPE_CHECKING:
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 class DiscardCardAction(Action):
 
+    VALID_PHASES = [GamePhase.ACTION_PHASE]
+
     def __init__(self, card: Card):
         super().__init__()
         self.card = card
@@ -26,7 +29,7 @@ class DiscardCardAction(Action):
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
         # Check the board phase
-        if board.phase != GamePhase.ACTION_PHASE:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
@@ -35,9 +38,18 @@ class DiscardCardAction(Action):
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         card = player.hand.pop(self.card)
         board.stack.put(card)
+        if board.auditor is not None:
+            board.auditor.move(card, CardAuditor.hand(player), CardAuditor.STACK)
+        return self.get_reward()
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data) -> None:
+        card = board.stack.pop()
+        player.hand.add(card)
+        if board.auditor is not None:
+            board.auditor.move(card, CardAuditor.STACK, CardAuditor.hand(player))
 
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         if player.hand.is_empty():
@@ -45,5 +57,4 @@ class DiscardCardAction(Action):
         return GamePhase.END_TURN_PHASE
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}Discard {}".format(execution_tag, self.card)
+        return "Discard {}".format(self.card)
@@ -1,10 +1,12 @@
 import logging
+from collections import Counter
 from numbers import Number
 from typing import List
 from typing import TYPE_CHECKING
 
 from base.actions.action import Action
 from base.card import Card
+from base.card_auditor import CardAuditor
 from base.cards.card_series import CardSeries
 from base.enums.game_phase import GamePhase
 
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 
 class PutAction(Action):
 
+    VALID_PHASES = [GamePhase.ACTION_PHASE, GamePhase.PLAY_JOKER_PHASE]
+
     def __init__(self, cards: List[Card]):
         super().__init__()
         self.series = CardSeries(cards)
@@ -29,7 +33,7 @@ class PutAction(Action):
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
         # Check the board phase
-        if board.phase not in [GamePhase.ACTION_PHASE, GamePhase.PLAY_JOKER_PHASE]:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
@@ -40,20 +44,32 @@ class PutAction(Action):
         # Check if player is going to clear its hand and whether its allowed to do so
         if player.num_cards() <= len(self.series) + 1 and not board.player_may_clear_hand(player, self):
             return False
-        # Make sure the player has all specified cards
-        for card in self.series:
-            if card not in player.hand:
+        # Make sure the player has all specified cards, including duplicates such as the ace on both ends of a series
+        for card, count in Counter(self.series).items():
+            if player.hand.count(card) < count:
                 return False
         # Make sure the card series itself is valid
-        if not self.series.is_valid():
+        if not self.is_possible():
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
+    def is_possible(self) -> bool:
+        return self.series.is_valid()
+
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         for card in self.series:
             player.hand.pop(card)
-        team_series = board.get_series_for_player(player)
-        team_series.append(self.series)
+        if board.auditor is not None:
+            board.auditor.move(self.series.get_raw_cards(), CardAuditor.hand(player), CardAuditor.series(player.team))
+        # Put a new series on the board, so the series of this action is never altered by later actions
+        board.add_series(player.team, CardSeries(list(self.series.get_raw_cards())))
+        return self.get_reward()
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data) -> None:
+        series = board.pop_series(player.team)
+        player.hand.add(series.get_raw_cards())
+        if board.auditor is not None:
+            board.auditor.move(series.get_raw_cards(), CardAuditor.series(player.team), CardAuditor.hand(player))
 
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         if player.hand.is_empty():
@@ -67,5 +83,4 @@ class PutAction(Action):
         return False
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}Put {}".format(execution_tag, self.series)
+        return "Put {}".format(self.series)
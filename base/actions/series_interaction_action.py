@@ -1,9 +1,15 @@
 from abc import ABCMeta
 from numbers import Number
+from typing import TYPE_CHECKING, List, Tuple
 
 from base.actions.action import Action
 from base.cards.card_series import CardSeries
 
+if TYPE_CHECKING:
+    from base.board import Board
+    from base.card import Card
+    from base.player import Player
+
 
 class SeriesInteractionAction(Action, metaclass=ABCMeta):
     """Subclass of actions that interact with a series."""
@@ -11,7 +17,6 @@ class SeriesInteractionAction(Action, metaclass=ABCMeta):
     def __init__(self, series: CardSeries):
         super().__init__()
         self.series = series
-        self.score_value = None  # The added value to the teams score by performing this action
 
     def get_reward(self) -> Number:
         """
@@ -19,9 +24,17 @@ class SeriesInteractionAction(Action, metaclass=ABCMeta):
 
         The rewards for series interaction actions are computed by storing the value of the series before- and after execution.
         The reward is equal to the increase in the series value as a result of this action.
-        This means that the reward is only available after the action has been executed.
+        This means that the reward is only available in the result of executing the action, see :meth:`execute`.
         """
-        if self.is_executed:
-            return self.score_value
-        else:
-            raise NotImplementedError("Reward for this action is not implemented if the action is not yet executed.")
+        raise NotImplementedError("The reward of this action is only available in the result of executing it.")
+
+    def _get_undo_data(self, player: 'Player', board: 'Board') -> Tuple[CardSeries, List['Card']]:
+        """Return the series on the board this action interacts with, and its cards before executing it."""
+        series = board.find_series(player.team, self.series)
+        return series, list(series.get_raw_cards())
+
+    @staticmethod
+    def _restore_series(player: 'Player', board: 'Board', undo_data: Tuple[CardSeries, List['Card']]) -> None:
+        series, cards = undo_data
+        series.set_cards(cards)
+        board.update_series_index(player.team, series)
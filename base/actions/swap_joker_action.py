@@ -1,9 +1,12 @@
 import logging
+from numbers import Number
 from typing import TYPE_CHECKING
 
 from base.actions.series_interaction_action import SeriesInteractionAction
 from base.card import Card
+from base.card_auditor import CardAuditor
 from base.cards.card_series import CardSeries
+from base.cards.series_catalog import SeriesCatalog
 from base.constants import Constants
 from base.enums.game_phase import GamePhase
 from base.utils.card_constants import JOKER_SUIT, JOKER_RANK
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 
 class SwapJokerAction(SeriesInteractionAction):
 
+    VALID_PHASES = [GamePhase.ACTION_PHASE]
+
     def __init__(self, card: Card, series: CardSeries):
         super().__init__(series)
         self.card = card
@@ -25,7 +30,7 @@ class SwapJokerAction(SeriesInteractionAction):
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
         # Check the board phase
-        if board.phase != GamePhase.ACTION_PHASE:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
@@ -33,28 +38,41 @@ class SwapJokerAction(SeriesInteractionAction):
         if player.num_cards() <= 2 and not board.player_may_clear_hand(player, self):
             return False
         # Make sure the player is swapping a joker from a series its team owns
-        team_series = board.get_series_for_player(player)
-        if self.series not in team_series:
+        if not board.has_series(player.team, self.series):
             return False
         # Make sure the player has the swap card in its hand
         if self.card not in player.hand:
             return False
         # Make sure the swap card is a valid option to swap for the joker
-        swap_joker_options = self.series.get_swap_joker_options()
-        if self.card not in swap_joker_options:
+        if not self.is_possible():
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
-        pre_execution_value = self.series.get_total_value()
+    def is_possible(self) -> bool:
+        return SeriesCatalog().is_swap_joker_option(self.series, self.card)
+
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         player.hand.pop(self.card)
         # Make sure to swap the joker in the series on the board (not self.series!)
-        for series in board.get_series_for_player(player):
-            if series == self.series:
-                joker = series.swap_joker(self.card)
-                player.hand.add(joker)
-                break
-        self.score_value = self.series.get_total_value() - pre_execution_value + Constants.JOKER_SWAP_EXTRA_SCORE
+        series = board.find_series(player.team, self.series)
+        pre_execution_value = series.get_total_value()
+        joker = series.swap_joker(self.card)
+        player.hand.add(joker, known=True)
+        if board.auditor is not None:
+            board.auditor.move(self.card, CardAuditor.hand(player), CardAuditor.series(player.team))
+            board.auditor.move(joker, CardAuditor.series(player.team), CardAuditor.hand(player))
+        board.update_series_index(player.team, series)
+        return series.get_total_value() - pre_execution_value + Constants.JOKER_SWAP_EXTRA_SCORE
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data) -> None:
+        joker = Card(JOKER_RANK, JOKER_SUIT)
+        player.hand.forget([joker])
+        player.hand.pop(joker)
+        player.hand.add(self.card)
+        if board.auditor is not None:
+            board.auditor.move(joker, CardAuditor.hand(player), CardAuditor.series(player.team))
+            board.auditor.move(self.card, CardAuditor.series(player.team), CardAuditor.hand(player))
+        self._restore_series(player, board, undo_data)
 
     def will_create_pure(self, player: 'Player', board: 'Board') -> bool:
         """
@@ -65,9 +83,10 @@ class SwapJokerAction(SeriesInteractionAction):
         """
         def _player_can_play_joker_elsewhere():
             """Return True if the player has any option on the board to add a joker, besides this actions series."""
+            joker = Card(JOKER_RANK, JOKER_SUIT)
             for series in board.get_series_for_player(player):
-                all_add_card_action_options = series.get_add_back_options() + series.get_add_front_options()
-                if series != self.series and Card(JOKER_RANK, JOKER_SUIT) in all_add_card_action_options:
+                if series != self.series and (SeriesCatalog().is_add_back_option(series, joker)
+                                              or SeriesCatalog().is_add_front_option(series, joker)):
                     return True
             return False
 
@@ -79,5 +98,4 @@ class SwapJokerAction(SeriesInteractionAction):
         return GamePhase.PLAY_JOKER_PHASE
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}SwapJoker {}  >>>  {}".format(execution_tag, self.card, self.series)
+        return "SwapJoker {}  >>>  {}".format(self.card, self.series)
@@ -1,10 +1,13 @@
 import logging
 from copy import copy
+from numbers import Number
 from typing import TYPE_CHECKING
 
 from base.actions.series_interaction_action import SeriesInteractionAction
 from base.card import Card
+from base.card_auditor import CardAuditor
 from base.cards.card_series import CardSeries
+from base.cards.series_catalog import SeriesCatalog
 from base.enums.game_phase import GamePhase
 from base.enums.two_swap_direction import TwoSwapDirection
 
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 
 class SwapTwoAction(SeriesInteractionAction):
 
+    VALID_PHASES = [GamePhase.ACTION_PHASE]
+
     def __init__(self, card: Card, series: CardSeries, direction: TwoSwapDirection):
         super().__init__(series)
         self.card = card
@@ -26,42 +31,51 @@ class SwapTwoAction(SeriesInteractionAction):
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
         # Check the board phase
-        if board.phase != GamePhase.ACTION_PHASE:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
         # Check if player is going to clear its hand and whether its allowed to do so
         if player.num_cards() <= 2 and not board.player_may_clear_hand(player, self):
             return False
-        # Swapping to front is not allowed when there's an ace there
-        if self.direction == TwoSwapDirection.FRONT and self.series.get_card(0).get_rank() == 1:
-            return False
-        # Swapping to back is not allowed when there's an ace there
-        if self.direction == TwoSwapDirection.BACK and self.series.get_card(-1).get_rank() == 1:
-            return False
         # Make sure the player is swapping a joker from a series its team owns
-        team_series = board.get_series_for_player(player)
-        if self.series not in team_series:
+        if not board.has_series(player.team, self.series):
             return False
         # Make sure the player has the swap card in its hand
         if self.card not in player.hand:
             return False
-        # Make sure the swap card is a valid option to swap for the joker
-        swap_two_options = self.series.get_swap_two_options()
-        if self.card not in swap_two_options:
+        # Make sure the swap direction and card are valid for the series
+        if not self.is_possible():
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
-        # We keep track of the added value of executing this action to compute the reward
-        pre_execution_value = self.series.get_total_value()
+    def is_possible(self) -> bool:
+        # Swapping to front is not allowed when there's an ace there
+        if self.direction == TwoSwapDirection.FRONT and self.series.get_card(0).get_rank() == 1:
+            return False
+        # Swapping to back is not allowed when there's an ace there
+        if self.direction == TwoSwapDirection.BACK and self.series.get_card(-1).get_rank() == 1:
+            return False
+        # Make sure the swap card is a valid option to swap for the two
+        return SeriesCatalog().is_swap_two_option(self.series, self.card)
+
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         player.hand.pop(self.card)
+        if board.auditor is not None:
+            board.auditor.move(self.card, CardAuditor.hand(player), CardAuditor.series(player.team))
         # Make sure to swap the two in the series on the board (not self.series!)
-        for series in board.get_series_for_player(player):
-            if series == self.series:
-                series.swap_two(self.card, self.direction)
-                break
-        self.score_value = self.series.get_total_value() - pre_execution_value
+        series = board.find_series(player.team, self.series)
+        # We keep track of the added value of executing this action to compute the reward
+        pre_execution_value = series.get_total_value()
+        series.swap_two(self.card, self.direction)
+        board.update_series_index(player.team, series)
+        return series.get_total_value() - pre_execution_value
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data) -> None:
+        player.hand.add(self.card)
+        if board.auditor is not None:
+            board.auditor.move(self.card, CardAuditor.series(player.team), CardAuditor.hand(player))
+        self._restore_series(player, board, undo_data)
 
     def will_create_pure(self, player: 'Player', board: 'Board') -> bool:
         """Return True if executing this action will create a pure canasta for the player."""
@@ -79,5 +93,4 @@ class SwapTwoAction(SeriesInteractionAction):
         return GamePhase.ACTION_PHASE
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}SwapTwo ({}) {}  >>>  {}".format(execution_tag, self.direction.value, self.card, self.series)
+        return "SwapTwo ({}) {}  >>>  {}".format(self.direction.value, self.card, self.series)
@@ -1,9 +1,12 @@
 import logging
 from numbers import Number
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from base.actions.action import Action
+from base.card_auditor import CardAuditor
+from base.cards.stack import Stack
 from base.enums.game_phase import GamePhase
+from base.enums.pile_side import PileSide
 
 if TYPE_CHECKING:
     from base.board import Board
@@ -13,6 +16,8 @@ if TYPE_CHECKING:
 class TakeCardAction(Action):
     """ Take a card from the deck and add it to the players hand. """
 
+    VALID_PHASES = [GamePhase.DRAW_PHASE]
+
     def _key(self):
         """Return a tuple of all fields that should be checked in equality and hashing operations."""
         return None
@@ -21,30 +26,57 @@ class TakeCardAction(Action):
         return 1  # Basic reward to not discourage taking cards
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
-        if board.phase != GamePhase.DRAW_PHASE:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         deck_card = board.deck.deal()
         player.hand.add(deck_card)
+        if board.auditor is not None:
+            board.auditor.move(deck_card, CardAuditor.DECK, CardAuditor.hand(player))
         if board.deck.is_empty():
             if board.left_pile_active():
                 cards = board.grab_left_pile()
                 board.deck.add_cards(cards)
+                if board.auditor is not None:
+                    board.auditor.move(cards, CardAuditor.LEFT_PILE, CardAuditor.DECK)
             elif board.right_pile_active():
                 # Move the pile to the deck
                 cards = board.grab_right_pile()
                 board.deck.add_cards(cards)
+                if board.auditor is not None:
+                    board.auditor.move(cards, CardAuditor.RIGHT_PILE, CardAuditor.DECK)
             else:
                 # There are no cards left on the board, the game will end itself after the current players turn
                 pass
+        return self.get_reward()
+
+    def _get_undo_data(self, player: 'Player', board: 'Board') -> Optional[PileSide]:
+        """Return the side of the pile that will become the new deck, None if the deck will not run out."""
+        if board.deck.num_cards() == 1:
+            if board.left_pile_active():
+                return PileSide.LEFT
+            elif board.right_pile_active():
+                return PileSide.RIGHT
+        return None
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data: Optional[PileSide]) -> None:
+        if undo_data is not None:
+            # The deck consists of the pile that was moved to it
+            cards = board.deck.take_back_cards(board.deck.num_cards())
+            board.restore_pile(undo_data, Stack(cards))
+            if board.auditor is not None:
+                board.auditor.move(cards, CardAuditor.DECK, CardAuditor.pile(undo_data))
+        card = board.deck.undeal()
+        player.hand.pop(card)
+        if board.auditor is not None:
+            board.auditor.move(card, CardAuditor.hand(player), CardAuditor.DECK)
 
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         return GamePhase.ACTION_PHASE
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}TakeCard".format(execution_tag)
+        return "TakeCard"
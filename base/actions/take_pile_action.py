@@ -1,8 +1,11 @@
 import logging
 from numbers import Number
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from base.actions.action import Action
+from base.card import Card
+from base.card_auditor import CardAuditor
+from base.cards.stack import Stack
 from base.constants import Constants
 from base.enums.game_phase import GamePhase
 from base.enums.pile_side import PileSide
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 class TakePileAction(Action):
     """ Take one of the piles on the board. """
 
+    VALID_PHASES = [GamePhase.NO_CARDS_PHASE, GamePhase.NO_CARDS_END_TURN_PHASE]
+
     def __init__(self, side: PileSide):
         super().__init__()
         self.side = side
@@ -28,7 +33,7 @@ class TakePileAction(Action):
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
         # Check the board phase
-        if board.phase not in [GamePhase.NO_CARDS_PHASE, GamePhase.NO_CARDS_END_TURN_PHASE]:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
@@ -45,10 +50,27 @@ class TakePileAction(Action):
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         pile_cards = board.grab_pile(self.side)
         player.hand.add(pile_cards)
+        if board.auditor is not None:
+            board.auditor.move(pile_cards, CardAuditor.pile(self.side), CardAuditor.hand(player))
         player.set_pile_grabbed()
+        return self.get_reward()
+
+    def _get_undo_data(self, player: 'Player', board: 'Board') -> List[Card]:
+        """Return the cards of the pile that is taken."""
+        pile = board.left_pile if self.side == PileSide.LEFT else board.right_pile
+        return list(pile.get_raw_cards())
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data: List[Card]) -> None:
+        for card in undo_data:
+            player.hand.pop(card)
+        board.restore_pile(self.side, Stack(undo_data))
+        # Only a team that has not grabbed a pile yet can take one
+        player.set_pile_grabbed(False)
+        if board.auditor is not None:
+            board.auditor.move(undo_data, CardAuditor.hand(player), CardAuditor.pile(self.side))
 
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         if board.phase == GamePhase.NO_CARDS_END_TURN_PHASE:
@@ -57,5 +79,4 @@ class TakePileAction(Action):
             return GamePhase.ACTION_PHASE
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}TakePile {}".format(execution_tag, self.side.value)
+        return "TakePile {}".format(self.side.value)
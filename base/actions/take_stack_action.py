@@ -1,8 +1,10 @@
 import logging
 from numbers import Number
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from base.actions.action import Action
+from base.card import Card
+from base.card_auditor import CardAuditor
 from base.enums.game_phase import GamePhase
 
 if TYPE_CHECKING:
@@ -13,6 +15,8 @@ if TYPE_CHECKING:
 class TakeStackAction(Action):
     """ Take the stack and add the cards to the players hand. """
 
+    VALID_PHASES = [GamePhase.DRAW_PHASE]
+
     def _key(self):
         """Return a tuple of all fields that should be checked in equality and hashing operations."""
         return None
@@ -21,19 +25,34 @@ class TakeStackAction(Action):
         return 1  # Basic reward for not discouraging taking the stack
 
     def validate(self, player: 'Player', board: 'Board', verbose: bool = False):
-        if board.phase != GamePhase.DRAW_PHASE:
+        if board.phase not in self.VALID_PHASES:
             if verbose:
                 logging.info("Invalid action {}. Reason: wrong phase - {}".format(self, board.phase))
             return False
         return True
 
-    def _execute(self, player: 'Player', board: 'Board'):
+    def _execute(self, player: 'Player', board: 'Board') -> Number:
         stack_cards = board.stack.grab()
-        player.hand.add(stack_cards)
+        # The stack is face up, so all players know the cards taken
+        player.hand.add(stack_cards, known=True)
+        if board.auditor is not None:
+            board.auditor.move(stack_cards, CardAuditor.STACK, CardAuditor.hand(player))
+        return self.get_reward()
+
+    def _get_undo_data(self, player: 'Player', board: 'Board') -> List[Card]:
+        """Return the cards on the stack."""
+        return list(board.stack.get_raw_cards())
+
+    def _undo(self, player: 'Player', board: 'Board', undo_data: List[Card]) -> None:
+        player.hand.forget(undo_data)
+        for card in undo_data:
+            player.hand.pop(card)
+            board.stack.put(card)
+        if board.auditor is not None:
+            board.auditor.move(undo_data, CardAuditor.hand(player), CardAuditor.STACK)
 
     def _target_phase(self, player: 'Player', board: 'Board') -> GamePhase:
         return GamePhase.ACTION_PHASE
 
     def __str__(self):
-        execution_tag = "" if not self.is_executed else "(E) "
-        return "{}TakeStack".format(execution_tag)
+        return "TakeStack"
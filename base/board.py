@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Dict, Iterable, Tuple
 
+from base.action_service import ActionService
 from base.actions.action import Action
 from base.card import Card
+from base.card_auditor import CardAuditor
 from base.cards.card_series import CardSeries
 from base.cards.deck import Deck
 from base.cards.stack import Stack
@@ -10,10 +12,13 @@ from base.enums.pile_side import PileSide
 from base.player import Player
 from base.team import Team
 from base.enums.team_color import TeamColor
+from base.zobrist import Zobrist, MASK
 
 
 class Board:
 
+    _TEAM_COLORS = [TeamColor.RED, TeamColor.BLUE]
+
     def __init__(self, deck: Deck, left_pile: Stack, right_pile):
         self.phase = None
         self.deck = deck
@@ -22,6 +27,47 @@ class Board:
         self.stack = Stack()
         self.red_team_series = []  # type: List[CardSeries]
         self.blue_team_series = []  # type: List[CardSeries]
+        # Number of times a series of each team was put on the board, altered or removed, to detect changes to the series
+        self._series_versions = {TeamColor.RED: 0, TeamColor.BLUE: 0}  # type: Dict[TeamColor, int]
+        # Index from each live series on the board to the indexes of the actions that interact with it
+        self._series_index = {TeamColor.RED: {}, TeamColor.BLUE: {}}  # type: Dict[TeamColor, Dict[CardSeries, List[int]]]
+        # Zobrist key, total value and purity of each series of each team in the order of the series, so the totals of
+        # the team can be updated when a single series changes
+        self._series_stats = {TeamColor.RED: [], TeamColor.BLUE: []}  # type: Dict[TeamColor, List[Tuple[int, int, bool]]]
+        # Zobrist key, total value and number of pure canastas of the series of each team, updated along with the
+        # series index
+        self._series_hashes = {TeamColor.RED: 0, TeamColor.BLUE: 0}  # type: Dict[TeamColor, int]
+        self._series_values = {TeamColor.RED: 0, TeamColor.BLUE: 0}  # type: Dict[TeamColor, int]
+        self._num_pure = {TeamColor.RED: 0, TeamColor.BLUE: 0}  # type: Dict[TeamColor, int]
+        # Keeps count of the cards moved by actions, if the cards of this board are audited
+        self.auditor = None  # type: Optional[CardAuditor]
+
+    def clone(self) -> 'Board':
+        """Return a copy of this board, sharing the cards and the action indexes of its series."""
+        clone = object.__new__(Board)
+        clone.__dict__.update(self.__dict__)
+        clone.deck = self.deck.clone()
+        clone.left_pile = self.left_pile.clone() if self.left_pile is not None else None
+        clone.right_pile = self.right_pile.clone() if self.right_pile is not None else None
+        clone.stack = self.stack.clone()
+        clone.red_team_series = [series.clone() for series in self.red_team_series]
+        clone.blue_team_series = [series.clone() for series in self.blue_team_series]
+        clone._series_index = {}
+        for color, team_series in [(TeamColor.RED, clone.red_team_series), (TeamColor.BLUE, clone.blue_team_series)]:
+            # Key the index by the cloned series, so it is unaffected by changes to the original series
+            series_index = self._series_index[color]
+            if len(series_index) == len(team_series):
+                # The index was built in the order of the series
+                clone._series_index[color] = dict(zip(team_series, series_index.values()))
+            else:
+                clone._series_index[color] = {series: series_index[series] for series in team_series}
+        clone._series_versions = dict(self._series_versions)
+        clone._series_stats = {color: list(stats) for color, stats in self._series_stats.items()}
+        clone._series_hashes = dict(self._series_hashes)
+        clone._series_values = dict(self._series_values)
+        clone._num_pure = dict(self._num_pure)
+        clone.auditor = self.auditor.clone() if self.auditor is not None else None
+        return clone
 
     def set_phase(self, phase: GamePhase):
         self.phase = phase
@@ -37,6 +83,101 @@ class Board:
         else:
             return self.red_team_series
 
+    def add_series(self, team: Team, series: CardSeries) -> None:
+        """Put a new series on the board for the given team."""
+        self.get_series_for_team(team).append(series)
+        color = team.color
+        self._series_index[color][series] = ActionService().get_series_action_indices(series)
+        self._series_versions[color] += 1
+        stats = self._get_series_stats(color, series)
+        self._series_stats[color].append(stats)
+        self._add_series_stats(color, stats, 1)
+
+    def pop_series(self, team: Team) -> CardSeries:
+        """Remove the last series put on the board for the given team and return it."""
+        team_series = self.get_series_for_team(team)
+        series = team_series.pop()
+        color = team.color
+        if series not in team_series:
+            # Another series of the team may have the same cards, and hence share its entry in the index
+            del self._series_index[color][series]
+        self._series_versions[color] += 1
+        self._add_series_stats(color, self._series_stats[color].pop(), -1)
+        return series
+
+    def get_series_version(self, team: Team) -> int:
+        """
+        Return the number of times a series of the given team was put on the board, altered or removed. This only
+        increases, also when actions are undone, so an unchanged version means the series of the team are unchanged.
+        """
+        return self._series_versions[team.color]
+
+    def update_series_index(self, team: Team, series: CardSeries) -> None:
+        """
+        Update the series index of the given team after the given series of the team has been altered.
+
+        Series are hashed by their cards, so the index of the team is rebuilt, from the action indexes cached by card
+        series code (see :meth:`ActionService.get_series_action_indices`). The Zobrist key, the total value and the
+        number of pure canastas of the series of the team are only updated with those of the altered series.
+        """
+        team_series = self.get_series_for_team(team)
+        color = team.color
+        self._series_index[color] = {board_series: ActionService().get_series_action_indices(board_series)
+                                     for board_series in team_series}
+        self._series_versions[color] += 1
+        position = next(i for i, board_series in enumerate(team_series) if board_series is series)
+        team_stats = self._series_stats[color]
+        self._add_series_stats(color, team_stats[position], -1)
+        team_stats[position] = self._get_series_stats(color, series)
+        self._add_series_stats(color, team_stats[position], 1)
+
+    def _get_series_stats(self, color: TeamColor, series: CardSeries) -> Tuple[int, int, bool]:
+        """Return the Zobrist key, the total value and the purity of the given series of the team of the given color."""
+        return (Zobrist.team_series_key(series, self._TEAM_COLORS.index(color)), series.get_total_value(),
+                series.is_pure())
+
+    def _add_series_stats(self, color: TeamColor, stats: Tuple[int, int, bool], sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) the statistics of a series to the totals of the team of the given color."""
+        key, value, is_pure = stats
+        self._series_hashes[color] = (self._series_hashes[color] + sign * key) & MASK
+        self._series_values[color] += sign * value
+        self._num_pure[color] += sign * is_pure
+
+    def get_series_value(self, team: Team) -> int:
+        """Return the total value of the series on the board of the given team."""
+        return self._series_values[team.color]
+
+    def get_hash(self) -> int:
+        """
+        Return the Zobrist hash of the series of both teams, the top card and size of the stack, the remaining piles
+        and the phase of this board, see :class:`Zobrist`.
+        """
+        top_card = self.stack.look()
+        board_hash = self._series_hashes[TeamColor.RED] ^ self._series_hashes[TeamColor.BLUE] \
+            ^ Zobrist.STACK_TOP_KEYS[top_card.get_index() if top_card is not None else 0] \
+            ^ Zobrist.STACK_SIZE_KEYS[len(self.stack)] ^ Zobrist.PHASE_KEYS[self.phase]
+        if self.left_pile is not None:
+            board_hash ^= Zobrist.PILE_KEYS[0]
+        if self.right_pile is not None:
+            board_hash ^= Zobrist.PILE_KEYS[1]
+        return board_hash
+
+    def has_series(self, team: Team, series: CardSeries) -> bool:
+        """Return True if the given series is on the board for the given team."""
+        return series in self._series_index[team.color]
+
+    def find_series(self, team: Team, series: CardSeries) -> Optional[CardSeries]:
+        """Return the live series on the board of the given team that equals the given series, None if not found."""
+        for board_series in self.get_series_for_team(team):
+            if board_series == series:
+                return board_series
+        return None
+
+    def get_series_action_indices(self, team: Team) -> Iterable[int]:
+        """Return the indexes of all actions interacting with any series on the board of the given team."""
+        for action_indices in self._series_index[team.color].values():
+            yield from action_indices
+
     def num_piles_remaining(self) -> int:
         num_piles = 0
         if self.left_pile_active():
@@ -69,6 +210,15 @@ class Board:
         self.right_pile = None
         return cards
 
+    def restore_pile(self, side: PileSide, pile: Stack) -> None:
+        """Put the given pile back on the given side, after it has been grabbed."""
+        if side == PileSide.LEFT:
+            self.left_pile = pile
+        elif side == PileSide.RIGHT:
+            self.right_pile = pile
+        else:
+            raise Exception("Unknown pile side {}. Use PileSide enum!".format(side))
+
     def __repr__(self):
         return self.__str__()
 
@@ -104,7 +254,4 @@ class Board:
                 return self.team_has_pure(player.team)
 
     def team_has_pure(self, team: 'Team') -> bool:
-        for series in self.get_series_for_team(team):
-            if series.is_pure():
-                return True
-        return False
+        return self._num_pure[team.color] > 0
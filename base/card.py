@@ -2,7 +2,7 @@ from typing import Union
 
 from base.constants import Constants
 from base.utils.card_constants import POSSIBLE_RANK, POSSIBLE_SUIT, JOKER_SUIT, JOKER_RANK, RANK_TRANSLATION, \
-    RANK_TRANSLATION_SHORT, HEARTS, DIAMONDS, SPADES
+    RANK_TRANSLATION_SHORT, HEARTS, DIAMONDS, SPADES, CLUBS, NUM_CARD_TYPES
 
 """This module provides the :class:`Card` object.
 This module also has 5 constant attributes that help validate or string format
@@ -10,45 +10,92 @@ the :class:`Card` object: :attr:`POSSIBLE_SUIT`, :attr:`POSSIBLE_RANK`,
 , :attr:`JOKER_SUIT`, :attr:`JOKER_RANK`, and :attr:`RANK_TRANSLATION`
 """
 
+#: the suits in the order in which cards are sorted
+SORTED_SUITS = [HEARTS, SPADES, DIAMONDS, CLUBS]
+
 
 class Card(object):
-    """A Card object"""
+    """
+    A Card object.
+
+    Cards are immutable flyweights: there is a single instance for each of the card identities, which is returned by
+    every ``Card(rank, suit)`` call. Each instance holds its index (see :meth:`get_index`) as a small integer id,
+    along with its precomputed score, joker and two flags and sort ordinal.
+    """
+
+    __slots__ = ('_rank', '_suit', '_id', '_score', '_is_joker', '_is_two', '_ordinal')
 
-    #: Holds the suit as a lowercase string
-    _suit = None
+    #: The interned cards by (rank, suit), for the suit as given and in lowercase
+    _instances = {}
 
-    #: Holds an integer which represents the card rank
-    _rank = None
+    #: The interned cards by index, see :meth:`get_index`
+    _by_index = [None] * NUM_CARD_TYPES
 
-    def __init__(self, rank, suit):
+    def __new__(cls, rank, suit):
         """
         :param int rank: a rank in :attr:`POSSIBLE_RANK` or :attr:`JOKER_RANK`
         :param str suit: a case-independent string in :attr:`POSSIBLE_SUIT` or
                          :attr:`JOKER_SUIT`
         :raises: ValueError
         """
-
-        # convert to lowercase
-        suit = suit.lower()
-
+        card = cls._instances.get((rank, suit))
+        if card is not None:
+            return card
+        card = cls._instances.get((rank, suit.lower()))
+        if card is None:
+            card = cls._create(rank, suit.lower())
+        cls._instances[(rank, suit)] = card
+        return card
+
+    @classmethod
+    def _create(cls, rank, suit) -> 'Card':
+        """Validate the given rank and (lowercase) suit, and create the instance representing them."""
         base_error_str = 'A new Card cannot be created.'
 
         if suit == JOKER_SUIT:
-            if rank == JOKER_RANK:
-                self._suit = suit
-                self._rank = rank
-            else:
+            if rank != JOKER_RANK:
                 raise ValueError(base_error_str + " Joker's rank must be %d" % JOKER_RANK)
         elif suit in POSSIBLE_SUIT:
-            self._suit = suit
-
-            if rank in POSSIBLE_RANK:
-                self._rank = rank
-            else:
+            if rank not in POSSIBLE_RANK:
                 raise ValueError(base_error_str + " A normal card's rank (%s) is not %s." % (rank, POSSIBLE_RANK))
         else:
             raise ValueError(base_error_str + " Suit ('%s') is not in %s." % (suit, POSSIBLE_SUIT + [JOKER_SUIT]))
 
+        card = object.__new__(cls)
+        card._rank = rank
+        card._suit = suit
+        card._is_joker = suit == JOKER_SUIT
+        card._is_two = rank == 2
+        if card._is_joker:
+            card._id = NUM_CARD_TYPES - 1
+            card._score = Constants.JOKER_VALUE
+            card._ordinal = 0
+        else:
+            card._id = 1 + POSSIBLE_SUIT.index(suit) * len(POSSIBLE_RANK) + rank - 1
+            if rank == 1:  # Ace
+                card._score = Constants.ACE_VALUE
+            elif rank == 2:  # Two
+                card._score = Constants.HIGH_CARD_VALUE
+            elif rank <= 7:  # 3, 4, 5, 6, 7
+                card._score = Constants.LOW_CARD_VALUE
+            else:  # 8, 9, 10, J, Q, K
+                card._score = Constants.HIGH_CARD_VALUE
+            # Sorted by suit (hearts, spades, diamonds, clubs) then rank, after the joker
+            card._ordinal = 1 + SORTED_SUITS.index(suit) * len(POSSIBLE_RANK) + rank - 1
+        cls._instances[(rank, suit)] = card
+        cls._by_index[card._id] = card
+        return card
+
+    def __reduce__(self):
+        # Unpickled cards are the interned instances as well
+        return Card, (self._rank, self._suit)
+
+    def __copy__(self) -> 'Card':
+        return self
+
+    def __deepcopy__(self, memo) -> 'Card':
+        return self
+
     def _translate_rank(self) -> Union[int, str]:
         """This is a hidden method that changes the card rank to a
         human-readable string. It also returns the title case of the string if
@@ -123,18 +170,22 @@ class Card(object):
         """
         return self._suit
 
+    def get_index(self) -> int:
+        """
+        Return the index of this card in the list of all card types: [None, A-H, 2-H, ..., K-C, Joker].
+
+        This is the same ordering as used by the CardEncoder, index 0 represents the absence of a card.
+        """
+        return self._id
+
+    @staticmethod
+    def from_index(index: int) -> 'Card':
+        """Return the card with the given index in the list of all card types, see :meth:`get_index`."""
+        return Card._by_index[index]
+
     def get_score(self):
         """Return the value of this card in the scoring of the game."""
-        if self.is_joker():  # Joker
-            return Constants.JOKER_VALUE
-        elif self.get_rank() == 1:  # Ace
-            return Constants.ACE_VALUE
-        elif self.get_rank() == 2:  # Two
-            return Constants.HIGH_CARD_VALUE
-        elif self.get_rank() <= 7:  # 3, 4, 5, 6, 7
-            return Constants.LOW_CARD_VALUE
-        else:  # 8, 9, 10, J, Q, K and 2
-            return Constants.HIGH_CARD_VALUE
+        return self._score
 
     def is_joker_like(self) -> bool:
         """
@@ -148,30 +199,24 @@ class Card(object):
         :returns: True if joker
         :rtype: bool
         """
-        return (JOKER_RANK == self.get_rank()) and (JOKER_SUIT == self.get_suit())
+        return self._is_joker
 
     def is_two(self) -> bool:
         """
         :returns: True if two
         :rtype: bool
         """
-        return 2 == self.get_rank()
-
-    def _key(self):
-        return self._rank, self._suit
+        return self._is_two
 
     def __hash__(self):
-        return hash(self._key())
+        return self._id
 
     def __eq__(self, other) -> bool:
         """Override equality method
         :returns: True if two objects are cards and have the same :attr:`_rank` and :attr:`_suit`
         :rtype: bool
         """
-        if type(other) is type(self):
-            if self._key() == other._key():
-                return True
-        return False
+        return self is other or (type(other) is type(self) and self._id == other._id)
 
     def __ne__(self, other) -> bool:
         """Override inequality method
@@ -181,24 +226,12 @@ class Card(object):
         return not self.__eq__(other)
 
     def __lt__(self, other: 'Card') -> bool:
-        if self.is_joker():
-            return True
-        if other.is_joker():
-            return False
-        self_suit = self.get_suit()
-        other_suit = other.get_suit()
-        if self_suit == other_suit:
-            return self.get_rank() < other.get_rank()
-        else:
-            if self_suit == HEARTS:
-                return True
-            elif other_suit == HEARTS:
-                return False
-            elif self_suit == SPADES:
-                return True
-            elif other_suit == SPADES:
-                return False
-            elif self_suit == DIAMONDS:
-                return True
-            else:
-                return False
+        # The joker comes first, then the cards by suit (hearts, spades, diamonds, clubs) and rank
+        return self._is_joker or self._ordinal < other._ordinal
+
+
+# Intern all cards up front, so that :meth:`Card.from_index` is a lookup
+Card(JOKER_RANK, JOKER_SUIT)
+for _suit in POSSIBLE_SUIT:
+    for _rank in POSSIBLE_RANK:
+        Card(_rank, _suit)
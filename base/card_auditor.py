@@ -0,0 +1,132 @@
+from array import array
+from typing import TYPE_CHECKING, List, Union
+
+import numpy as np
+
+from base.card import Card
+from base.constants import Constants
+from base.enums.pile_side import PileSide
+from base.enums.team_color import TeamColor
+from base.utils.card_constants import NUM_CARD_TYPES, JOKER_RANK, JOKER_SUIT
+
+if TYPE_CHECKING:
+    from base.board import Board
+    from base.player import Player
+    from base.team import Team
+
+#: The number of cards of each card type (see :meth:`Card.get_index`) in a game: two decks of cards with jokers
+GAME_CARD_COUNTS = np.full(NUM_CARD_TYPES, 2, dtype=np.int16)
+GAME_CARD_COUNTS[0] = 0
+GAME_CARD_COUNTS[Card(JOKER_RANK, JOKER_SUIT).get_index()] = 4
+
+
+class CardAuditor:
+    """
+    Keeps running counts of the cards of each type in every location of a game, to check that no card is ever lost or
+    duplicated.
+
+    The locations are the deck, both piles, the stack, the hand of each player and the series of each team. Actions
+    report every card they move through :meth:`move`, which fails as soon as a card leaves a location that does not
+    hold it. :meth:`check` then compares the number of cards in each location with the board, which does not depend
+    on the number of cards, so it can be run after every step. :meth:`verify` does a full recount instead.
+    """
+
+    DECK = 0
+    LEFT_PILE = 1
+    RIGHT_PILE = 2
+    STACK = 3
+    _FIRST_HAND = 4
+    _FIRST_SERIES = _FIRST_HAND + Constants.NUM_PLAYERS
+    NUM_LOCATIONS = _FIRST_SERIES + Constants.NUM_TEAMS
+    _TEAM_COLORS = [TeamColor.RED, TeamColor.BLUE]
+
+    def __init__(self, board: 'Board', players: List['Player']):
+        counts = self.count(board, players)
+        if not (counts.sum(axis=0) == GAME_CARD_COUNTS).all():
+            raise Exception("Cannot audit a game which does not hold all cards of a double deck")
+        # Flat (location x card type) counts, in an array to keep the updates cheap
+        self._counts = array('h', counts.ravel().tolist())
+        self._totals = counts.sum(axis=1).tolist()  # type: List[int]
+
+    @staticmethod
+    def hand(player: 'Player') -> int:
+        """Return the location of the hand of the given player."""
+        return CardAuditor._FIRST_HAND + player.identifier
+
+    @staticmethod
+    def series(team: 'Team') -> int:
+        """Return the location of the series of the given team."""
+        return CardAuditor._FIRST_SERIES + CardAuditor._TEAM_COLORS.index(team.color)
+
+    @staticmethod
+    def pile(side: PileSide) -> int:
+        """Return the location of the pile on the given side."""
+        return CardAuditor.LEFT_PILE if side == PileSide.LEFT else CardAuditor.RIGHT_PILE
+
+    def move(self, cards: Union[Card, List[Card]], source: int, target: int) -> None:
+        """Record the given cards moving from the source location to the target location."""
+        if isinstance(cards, Card):
+            cards = [cards]
+        counts = self._counts
+        source_offset = source * NUM_CARD_TYPES
+        target_offset = target * NUM_CARD_TYPES
+        for card in cards:
+            index = card.get_index()
+            if counts[source_offset + index] == 0:
+                raise Exception("Card {} moved out of location {} which does not hold it".format(card, source))
+            counts[source_offset + index] -= 1
+            counts[target_offset + index] += 1
+        self._totals[source] -= len(cards)
+        self._totals[target] += len(cards)
+
+    def clone(self) -> 'CardAuditor':
+        clone = object.__new__(CardAuditor)
+        clone._counts = self._counts[:]
+        clone._totals = list(self._totals)
+        return clone
+
+    def get_counts(self) -> np.ndarray:
+        """Return the (location x card type) counts of the cards."""
+        return np.frombuffer(self._counts, dtype=np.int16).reshape(self.NUM_LOCATIONS, NUM_CARD_TYPES).copy()
+
+    def check(self, board: 'Board', players: List['Player']) -> None:
+        """Raise an exception if the number of cards in any location of the given game differs from the counts."""
+        sizes = self._sizes(board, players)
+        if sizes != self._totals:
+            raise Exception("Cards are not conserved, expected {} cards per location but found {}"
+                            .format(self._totals, sizes))
+
+    def verify(self, board: 'Board', players: List['Player']) -> None:
+        """Raise an exception if any card of the given game is not in the location given by the counts."""
+        counts = self.count(board, players)
+        differences = np.argwhere(counts != self.get_counts())
+        if len(differences) > 0:
+            raise Exception("Cards are not conserved, {} differ from the counts at (location, card index) {}"
+                            .format(", ".join(str(Card.from_index(i)) for i in differences[:, 1]),
+                                    differences.tolist()))
+
+    @staticmethod
+    def count(board: 'Board', players: List['Player']) -> np.ndarray:
+        """Return the (location x card type) counts of the cards of the given game."""
+        counts = np.zeros((CardAuditor.NUM_LOCATIONS, NUM_CARD_TYPES), dtype=np.int16)
+        locations = [(CardAuditor.DECK, board.deck.get_cards()), (CardAuditor.LEFT_PILE, board.left_pile or []),
+                     (CardAuditor.RIGHT_PILE, board.right_pile or []), (CardAuditor.STACK, board.stack)]
+        for i, team_series in enumerate([board.red_team_series, board.blue_team_series]):
+            locations.extend((CardAuditor._FIRST_SERIES + i, series) for series in team_series)
+        for location, cards in locations:
+            for card in cards:
+                counts[location, card.get_index()] += 1
+        for player in players:
+            counts[CardAuditor.hand(player)] = player.hand.get_counts()
+        return counts
+
+    @staticmethod
+    def _sizes(board: 'Board', players: List['Player']) -> List[int]:
+        sizes = [board.deck.num_cards(),
+                 len(board.left_pile) if board.left_pile is not None else 0,
+                 len(board.right_pile) if board.right_pile is not None else 0,
+                 len(board.stack)]
+        sizes.extend(len(player.hand) for player in players)
+        sizes.extend(sum(len(series) for series in team_series)
+                     for team_series in [board.red_team_series, board.blue_team_series])
+        return sizes
@@ -18,3 +18,8 @@ class CardEncoder:
         if cards is None or isinstance(cards, Card):
             cards = [cards]
         return self.encoder.fit_transform([cards])[0]
+
+    @staticmethod
+    def encode_counts(counts: np.ndarray) -> np.ndarray:
+        """Encode the cards given as the number of cards of each card type (see :meth:`Card.get_index`)."""
+        return (counts > 0).astype(int)
@@ -1,22 +1,52 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from base.card import Card, JOKER_RANK, JOKER_SUIT
 from base.cards.card_set import CardSet
+from base.cards.series_code import SeriesCode
 from base.constants import Constants
 from base.enums.two_swap_direction import TwoSwapDirection
 from base.utils.card_constants import POSSIBLE_SUIT
 
 
 class CardSeries(CardSet):
-    """A series of cards played by a team on the board. E.g: [3H-2H-5H-6H-7H] """
+    """
+    A series of cards played by a team on the board. E.g: [3H-2H-5H-6H-7H]
+
+    Valid series are identified by their :class:`SeriesCode`, from which their jokers, two-jokers, hash and equality
+    follow directly. The validity and code of each distinct list of cards are computed once per process.
+    The canasta classification and values are cached on the series until it is altered (add front/back, swap joker or
+    two), which also increments its version.
+    """
+
+    #: Validity and code (None if invalid) by tuple of card indexes
+    _codes = {}  # type: Dict[Tuple[int, ...], Tuple[bool, Optional[int]]]
 
     def __init__(self, cards):
         super().__init__(cards)
         self._main_suit = None  # Once we know our main suit, it always remains the same so we cache it
+        self._version = 0
+        self._valid_and_code = None  # type: Optional[Tuple[bool, Optional[int]]]
+        self._is_dirty = None  # type: Optional[bool]
+        self._is_pure = None  # type: Optional[bool]
+        self._canasta_score = None  # type: Optional[int]
+        self._total_value = None  # type: Optional[int]
 
     def description(self) -> str:
         return "CardSeries"
 
+    def get_version(self) -> int:
+        """Return the number of times this series has been altered, e.g. to detect changes to a cached series."""
+        return self._version
+
+    def _altered(self) -> None:
+        """Invalidate all cached properties after the cards of this series changed."""
+        self._version += 1
+        self._valid_and_code = None
+        self._is_dirty = None
+        self._is_pure = None
+        self._canasta_score = None
+        self._total_value = None
+
     def get_card(self, index: int) -> Card:
         return self._cards[index]
 
@@ -118,9 +148,16 @@ class CardSeries(CardSet):
 
     def add_front(self, card: Card):
         self._cards = [card] + self._cards
+        self._altered()
 
     def add_back(self, card: Card):
         self._cards.append(card)
+        self._altered()
+
+    def set_cards(self, cards: List[Card]):
+        """Replace the cards of this series, e.g. to restore the cards it had before an action."""
+        self._cards = cards
+        self._altered()
 
     def swap_joker(self, swap_card: Card):
         new_cards = []
@@ -132,6 +169,7 @@ class CardSeries(CardSet):
             else:
                 new_cards.append(card)
         self._cards = new_cards
+        self._altered()
         return joker
 
     def swap_two(self, swap_card: Card, direction: TwoSwapDirection = TwoSwapDirection.FRONT) -> None:
@@ -144,6 +182,7 @@ class CardSeries(CardSet):
             else:
                 new_cards.append(card)
         self._cards = new_cards
+        self._altered()
         if direction == TwoSwapDirection.FRONT:
             self.add_front(two)
         elif direction == TwoSwapDirection.BACK:
@@ -151,7 +190,55 @@ class CardSeries(CardSet):
         else:
             raise Exception("Invalid two-swap-direction, use TwoSwapDirection enum!")
 
+    def get_code(self) -> Optional[int]:
+        """Return the :class:`SeriesCode` of this series, None if it is invalid."""
+        if self._valid_and_code is None:
+            self._compute_valid_and_code()
+        return self._valid_and_code[1]
+
+    @classmethod
+    def store_codes(cls, codes: Dict[Tuple[int, ...], Tuple[bool, Optional[int]]]) -> None:
+        """
+        Store the validity and code of the given tuples of card indexes, e.g. as loaded from a cache, so they are not
+        computed again for series with these cards.
+        """
+        cls._codes.update(codes)
+
+    def _compute_valid_and_code(self) -> None:
+        key = tuple(card.get_index() for card in self._cards)
+        valid_and_code = self._codes.get(key)
+        if valid_and_code is None:
+            valid = self._check_valid()
+            valid_and_code = self._codes[key] = (valid, self._encode() if valid else None)
+        self._valid_and_code = valid_and_code
+
+    def _encode(self) -> Optional[int]:
+        """
+        Return the code of this valid series, None if its cards are not those of any code (e.g. a lone joker), in which
+        case the properties of the series are computed from its cards.
+        """
+        wildcards = [i for i, card in enumerate(self._cards) if card.is_joker() or self._is_two_joker(i)]
+        naturals = [i for i in range(len(self._cards)) if i not in wildcards]
+        if len(wildcards) > 1 or not naturals or len(self._cards) > 15:
+            return None
+        first_natural = self._cards[naturals[0]]
+        rank = first_natural.get_rank() if first_natural.get_rank() != 1 or naturals[0] == 0 else 14
+        start = rank - naturals[0]
+        if not 1 <= start <= 13:
+            return None
+        suit_index = POSSIBLE_SUIT.index(first_natural.get_suit())
+        if wildcards:
+            code = SeriesCode.pack(suit_index, start, len(self._cards), wildcards[0],
+                                   SeriesCode.wildcard_kind(self._cards[wildcards[0]]))
+        else:
+            code = SeriesCode.pack(suit_index, start, len(self._cards))
+        # Only use the code if it represents exactly these cards
+        return code if SeriesCode.decode(code) == self._cards else None
+
     def has_joker(self) -> bool:
+        code = self.get_code()
+        if code is not None:
+            return SeriesCode.has_joker(code)
         for card in self._cards:
             if card.is_joker():
                 return True
@@ -161,8 +248,11 @@ class CardSeries(CardSet):
         """
         :return: True if this series contains a two-joker
         """
+        code = self.get_code()
+        if code is not None:
+            return SeriesCode.has_two_joker(code)
         for i in range(len(self._cards)):
-            if self.is_two_joker(i):
+            if self._is_two_joker(i):
                 return True
         return False
 
@@ -170,6 +260,14 @@ class CardSeries(CardSet):
         """
         :return True if the card at the given index is a two-joker.
         """
+        code = self.get_code()
+        if code is not None:
+            return SeriesCode.is_two_joker(code, i)
+        return self._is_two_joker(i)
+
+    def _is_two_joker(self, i: int) -> bool:
+        if i < 0:
+            i += len(self)
         card = self.get_card(i)
         if card.is_two():
             if card.get_suit() != self.get_main_suit():
@@ -192,11 +290,15 @@ class CardSeries(CardSet):
 
     def is_dirty(self) -> bool:
         """Return True if this series is dirty."""
-        return self.num_cards() >= 7 and (self.has_joker() or self.has_two_joker())
+        if self._is_dirty is None:
+            self._is_dirty = self.num_cards() >= 7 and (self.has_joker() or self.has_two_joker())
+        return self._is_dirty
 
     def is_pure(self) -> bool:
         """Return True if this series is pure."""
-        return self.num_cards() >= 7 and not self.has_joker() and not self.has_two_joker()
+        if self._is_pure is None:
+            self._is_pure = self.num_cards() >= 7 and not self.has_joker() and not self.has_two_joker()
+        return self._is_pure
 
     def is_five_hundred(self) -> bool:
         """Return True if this series is a 500-series."""
@@ -207,6 +309,11 @@ class CardSeries(CardSet):
         return self.num_cards() == 13 and not self.has_joker() and not self.has_two_joker()
 
     def is_valid(self) -> bool:
+        if self._valid_and_code is None:
+            self._compute_valid_and_code()
+        return self._valid_and_code[0]
+
+    def _check_valid(self) -> bool:
         # Make sure all non-joker and non-two cards have the same suit
         if not self._check_valid_suits():
             return False
@@ -269,6 +376,10 @@ class CardSeries(CardSet):
             return True
         return all(first == rest for rest in iterator)
 
+    def _key(self):
+        code = self.get_code()
+        return code if code is not None else tuple(self._cards)
+
     def __repr__(self):
         repr_str = '{} ['.format(self.description())
         for card in self._cards:
@@ -287,19 +398,22 @@ class CardSeries(CardSet):
 
     def get_canasta_score(self):
         """Return the score value of this series specifically for the 'canastas'."""
-        if self.is_dirty():
-            return Constants.DIRTY_SCORE
-        elif self.is_pure():
-            return Constants.PURE_SCORE
-        elif self.is_five_hundred():
-            return Constants.FIVE_HUNDRED_SCORE
-        elif self.is_thousand():
-            return Constants.THOUSAND_SCORE
-        else:
-            return 0
+        if self._canasta_score is None:
+            if self.is_dirty():
+                self._canasta_score = Constants.DIRTY_SCORE
+            elif self.is_pure():
+                self._canasta_score = Constants.PURE_SCORE
+            elif self.is_five_hundred():
+                self._canasta_score = Constants.FIVE_HUNDRED_SCORE
+            elif self.is_thousand():
+                self._canasta_score = Constants.THOUSAND_SCORE
+            else:
+                self._canasta_score = 0
+        return self._canasta_score
 
     def get_total_value(self):
         """Return the total score value of this series."""
-        cards_score = sum([card.get_score() for card in self.get_raw_cards()])
-        canasta_score = self.get_canasta_score()
-        return cards_score + canasta_score
+        if self._total_value is None:
+            cards_score = sum([card.get_score() for card in self.get_raw_cards()])
+            self._total_value = cards_score + self.get_canasta_score()
+        return self._total_value
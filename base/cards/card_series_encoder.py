@@ -1,20 +1,29 @@
-from collections import Counter
 from typing import List, Union
 
 import numpy as np
-from sklearn.preprocessing import MultiLabelBinarizer
 
 from base.cards.card_series import CardSeries
-from base.utils.generators import series_generator
+from base.cards.series_catalog import SeriesCatalog
 
 
 class CardSeriesEncoder:
+    """Multi-hot encoding of series over all possible series of at most 13 cards, in :class:`SeriesCatalog` order."""
+
+    MAX_LENGTH = 13
 
     def __init__(self):
-        classes = list(series_generator(min_length=3))
-        self.encoder = MultiLabelBinarizer(classes=classes)
+        catalog = SeriesCatalog()
+        encoded = catalog.lengths <= self.MAX_LENGTH
+        self.num_classes = int(encoded.sum())
+        # The position in the encoding of each catalog series, -1 for series which are not encoded
+        self._positions = np.where(encoded, np.cumsum(encoded) - 1, -1)
 
     def encode(self, series: Union[CardSeries, List[CardSeries]]) -> np.ndarray:
         if isinstance(series, CardSeries):
             series = [series]
-        return self.encoder.fit_transform([series])[0]
+        encoding = np.zeros(self.num_classes, dtype=int)
+        for s in series:
+            series_id = SeriesCatalog().get_id(s)
+            if series_id is not None and self._positions[series_id] >= 0:
+                encoding[self._positions[series_id]] = 1
+        return encoding
@@ -23,18 +23,29 @@ class CardSet(metaclass=ABCMeta):
     def __iter__(self):
         return self._cards.__iter__()
 
+    def count(self, card: Card) -> int:
+        """Return the number of times the given card occurs in this set."""
+        return self._cards.count(card)
+
     def clear(self):
         self._cards = []
 
     def num_cards(self):
         return len(self._cards)
 
+    def clone(self) -> 'CardSet':
+        """Return a copy of this set, sharing the (immutable) cards."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._cards = list(self._cards)
+        return clone
+
     def get_raw_cards(self):
         return self._cards
 
     def __repr__(self):
         repr_str = '{} ['.format(self.description())
-        for card in sorted(self._cards):
+        for card in sorted(self):
             repr_str += repr(card) + ', '
         repr_str = repr_str[:-2]
         repr_str += ']'
@@ -42,7 +53,7 @@ class CardSet(metaclass=ABCMeta):
 
     def __str__(self):
         str_str = "{} [\n\t".format(self.description())
-        for card in sorted(self._cards):
+        for card in sorted(self):
             str_str += str(card) + ', '
         str_str = str_str[:-2]
         str_str += "\n]"
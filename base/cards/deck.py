@@ -3,139 +3,159 @@
 """
 
 import logging
-import random
-#: a logger object
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 from base.card import Card, JOKER_RANK, JOKER_SUIT, POSSIBLE_RANK, POSSIBLE_SUIT
+from base.utils.card_constants import NUM_CARD_TYPES
 
+#: a logger object
 LOGGER = logging.getLogger(__name__)
 
+#: the card indexes (see :meth:`Card.get_index`) of a single deck without jokers, in creation order
+_NORMAL_CARD_INDICES = [Card(rank, suit).get_index() for suit in POSSIBLE_SUIT for rank in POSSIBLE_RANK]
+
+#: the card index of the joker
+_JOKER_INDEX = Card(JOKER_RANK, JOKER_SUIT).get_index()
+
 
 class Deck(object):
     """A Deck object
     A new deck starts out ordered.
     If jokers are included, contains (2 + 4 * 13) :class:`deck_of_cards.card.Card` objects
     If no jokers are included, contains (4 * 13) :class:`deck_of_cards.card.Card` objects
-    """
 
-    #: a boolean to represent if jokers exist in deck
-    _with_jokers = True
-
-    #: an array of unused :class:`deck_of_cards.card.Card` objects that are
-    #: waiting to be dealt
-    _cards = []
+    The cards are stored as an array of card indexes (see :meth:`Card.get_index`), the top of the deck being the end
+    of the array, so dealing any number of cards is a single slice. Each deck shuffles with its own random generator.
+    """
 
-    #: an array of :class:`deck_of_cards.card.Card` objects that have been dealt
-    _in_play_cards = []
+    #: the number of copies of a single deck of cards this deck consists of
+    NUM_COPIES = 1
 
-    def __init__(self, with_jokers=True):
+    def __init__(self, with_jokers=True, seed: Union[None, int, np.random.Generator] = None):
         """
         :param bool with_jokers: include jokers if True
+        :param seed: the seed of the random generator used to shuffle, or the generator itself
         """
-        LOGGER.debug("Creating a new deck (with_jokers:%s)", with_jokers)
-
         self._num_added_cards = 0  # Keep track of how many cards are added to the deck after creation
         self._with_jokers = with_jokers
-        self._cards = []
-        self._in_play_cards = []
-
-        # add jokers if necessary
-        if with_jokers:
-            for _ in range(2):
-                self._cards.append(Card(JOKER_RANK, JOKER_SUIT))
+        self._rng = np.random.default_rng(seed)
 
-        for suit in POSSIBLE_SUIT:
-            for rank in POSSIBLE_RANK:
-                self._cards.append(Card(rank, suit))
+        single_deck = ([_JOKER_INDEX] * 2 if with_jokers else []) + _NORMAL_CARD_INDICES
+        #: the card indexes of the cards waiting to be dealt, in the first :attr:`_num_cards` entries
+        self._cards = np.array(single_deck * self.NUM_COPIES, dtype=np.int8)
+        self._num_cards = len(self._cards)
+        #: the card indexes of the cards that have been dealt, in the first :attr:`_num_in_play_cards` entries
+        self._in_play_cards = np.zeros_like(self._cards)
+        self._num_in_play_cards = 0
 
     def add_cards(self, cards: List[Card]) -> None:
-        self._cards.extend(cards)
+        end = self._num_cards + len(cards)
+        if end > len(self._cards):
+            self._cards = np.concatenate([self._cards[:self._num_cards], np.zeros(len(cards), dtype=np.int8)])
+        # Make room for dealing all the cards of the deck
+        num_missing = self._num_in_play_cards + end - len(self._in_play_cards)
+        if num_missing > 0:
+            self._in_play_cards = np.concatenate([self._in_play_cards, np.zeros(num_missing, dtype=np.int8)])
+        self._cards[self._num_cards:end] = [card.get_index() for card in cards]
+        self._num_cards = end
         self._num_added_cards += len(cards)
 
-    def __repr__(self):
+    def set_cards(self, cards: List[Card]) -> None:
         """
-        :returns: unambigious string represenation of deck object
-        :rtype: str
+        Replace the cards waiting to be dealt by the given cards, the last card to be dealt first, e.g. to sample an
+        unknown deck order. The number of cards must not change.
         """
-        card_arrays_dict = {
-            '_cards': self._cards,
-            '_in_play_cards': self._in_play_cards,
-        }
-
-        repr_str = 'Deck('
+        if len(cards) != self._num_cards:
+            raise Exception("Expected {} cards, got {}".format(self._num_cards, len(cards)))
+        self._cards[:self._num_cards] = [card.get_index() for card in cards]
 
-        for card_array_str, card_array in card_arrays_dict.items():
-            repr_str += "%s=[" % card_array_str
-            if card_array:
-                for c_card in card_array:
-                    repr_str += repr(c_card) + ', '
-                repr_str = repr_str[:-2]
-            repr_str += '], '
+    def get_cards(self) -> List[Card]:
+        """Return the cards waiting to be dealt, the next card to be dealt last."""
+        return self._to_cards(self._cards[:self._num_cards])
 
-        repr_str = repr_str[:-2] + ')'
+    def get_in_play_cards(self) -> List[Card]:
+        """Return the cards that have been dealt, in the order they were dealt."""
+        return self._to_cards(self._in_play_cards[:self._num_in_play_cards])
 
-        return repr_str
+    def __repr__(self):
+        """
+        :returns: unambigious string represenation of deck object
+        :rtype: str
+        """
+        return 'Deck(_cards=[{}], _in_play_cards=[{}])'.format(', '.join(repr(c) for c in self.get_cards()),
+                                                               ', '.join(repr(c) for c in self.get_in_play_cards()))
 
     def __str__(self):
         """
         :returns: human readable string represenation of deck object
         :rtype: str
         """
-        card_arrays_dict = {
-            '_cards': self._cards,
-            '_in_play_cards': self._in_play_cards,
-        }
-
-        str_str = "Deck(\n\t"
-
-        for card_array_str, card_array in card_arrays_dict.items():
-            str_str += "%s : [" % card_array_str
-            if card_array:
-                for c_card in card_array:
-                    str_str += str(c_card) + ', '
-                str_str = str_str[:-2]
-            str_str += '],\n\t'
-
-        str_str = str_str[:-3] + "\n)"
-
-        return str_str
+        return 'Deck(\n\t_cards : [{}],\n\t_in_play_cards : [{}]\n)'.format(
+            ', '.join(str(c) for c in self.get_cards()), ', '.join(str(c) for c in self.get_in_play_cards()))
 
     def num_cards(self) -> int:
-        return len(self._cards)
+        return self._num_cards
+
+    def clone(self) -> 'Deck':
+        """Return a copy of this deck, sharing its random generator."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._cards = self._cards.copy()
+        clone._in_play_cards = self._in_play_cards.copy()
+        return clone
 
     def shuffle(self):
         """Shuffle the unused set of cards in :attr:`_cards`
         """
-        LOGGER.debug("Shuffling deck")
-        random.shuffle(self._cards)
+        self._rng.shuffle(self._cards[:self._num_cards])
 
-    def deal(self):
+    def deal(self) -> Card:
         """Deals a single :class:`deck_of_cards.card.Card` from :attr:`_cards`
         Raises an IndexError when :attr:`_cards` is empty
         :returns: a single :class:`deck_of_cards.card.Card`
         :rtype: :class:`deck_of_cards.card.Card`
         :raises: IndexError
         """
-        LOGGER.debug("Number of cards left : %d", len(self._cards))
-
-        try:
-            # deal the last card from the unused _cards array
-            deal_card = self._cards.pop()
-        except IndexError:
+        if self._num_cards == 0:
             raise IndexError('Trying to deal from an empty deck.')
-
-        # add the newly dealt card to the _in_play_cards array
-        self._in_play_cards.append(deal_card)
-
-        LOGGER.info("Dealing : %s", deal_card)
-        return deal_card
+        # deal the last card from the unused _cards array, and add it to the _in_play_cards array
+        self._num_cards -= 1
+        index = self._cards[self._num_cards]
+        self._in_play_cards[self._num_in_play_cards] = index
+        self._num_in_play_cards += 1
+        return Card.from_index(index)
 
     def deal_n(self, n: int) -> List[Card]:
-        """Deal N times."""
-        cards = []
-        for _ in range(n):
-            cards.append(self.deal())
+        """Deal N times, the cards are returned in the order they are dealt.
+        Raises an IndexError when there are less than N cards left
+        """
+        if n > self._num_cards:
+            raise IndexError('Trying to deal {} cards from a deck of {} cards.'.format(n, self._num_cards))
+        start = self._num_cards - n
+        dealt = self._cards[start:self._num_cards][::-1]
+        self._in_play_cards[self._num_in_play_cards:self._num_in_play_cards + n] = dealt
+        self._num_in_play_cards += n
+        self._num_cards = start
+        return self._to_cards(dealt)
+
+    def undeal(self) -> Card:
+        """Put the last dealt card back on top of the deck, undoing :meth:`deal`, and return it."""
+        if self._num_cards == len(self._cards):
+            self._cards = np.concatenate([self._cards, np.zeros(1, dtype=np.int8)])
+        self._num_in_play_cards -= 1
+        index = self._in_play_cards[self._num_in_play_cards]
+        self._cards[self._num_cards] = index
+        self._num_cards += 1
+        return Card.from_index(index)
+
+    def take_back_cards(self, n: int) -> List[Card]:
+        """Remove the last N cards added to the top of the deck, undoing :meth:`add_cards`, and return them."""
+        start = self._num_cards - n
+        cards = self._to_cards(self._cards[start:self._num_cards])
+        self._num_cards = start
+        self._num_added_cards -= n
         return cards
 
     def is_empty(self):
@@ -143,49 +163,33 @@ class Deck(object):
         :returns: True if deck is empty
         :rtype: bool
         """
-        return not self._cards
+        return self._num_cards == 0
 
     def check_deck(self):
         """Check to make sure all the cards are accounted
         :returns: True if all cards are accounted
         :rtype: bool
         """
+        expected = np.zeros(NUM_CARD_TYPES, dtype=np.int64)
+        expected[_NORMAL_CARD_INDICES] = self.NUM_COPIES
+        if self._with_jokers:
+            expected[_JOKER_INDEX] = 2 * self.NUM_COPIES
 
         # start with a simple card count check
-        total_possible_cards = (13*4) + (2 if self._with_jokers else 0) + self._num_added_cards
-        if total_possible_cards != (len(self._cards)
-                                    + len(self._in_play_cards)):
+        if expected.sum() + self._num_added_cards != self._num_cards + self._num_in_play_cards:
             return False
 
-        return_value = True
-
-        # go through all piles of cards and create a dictionary with
-        # [suit][rank] = number of occurrences of card
-        card_dict = {}
-        for pile in [self._cards, self._in_play_cards]:
-            for c_card in pile:
-                suit = c_card.get_suit()
-                rank = c_card.get_rank()
-
-                if suit not in card_dict:
-                    card_dict[suit] = {}
-
-                if rank not in card_dict[suit]:
-                    card_dict[suit][rank] = 1
-                else:
-                    card_dict[suit][rank] += 1
-
-        # Don't do this check if we've manually added extra cards to the deck, as this will no longer work in that case
+        # Don't check the occurrences of each card if we've manually added extra cards to the deck, as this will no
+        # longer work in that case
         if self._num_added_cards == 0:
-            # go through generated card_dictionary to make sure that there are the
-            # appropriate rank of occurrences for each card
-            for suit in card_dict.keys():
-                for rank in card_dict[suit].keys():
-                    if 2 == card_dict[suit][rank]:
-                        # check for 2 jokers
-                        if not (JOKER_SUIT == suit and JOKER_RANK == rank):
-                            return_value = False
-                    elif 1 != card_dict[suit][rank]:
-                        LOGGER.info("Something is wrong with the %s", Card(rank, suit))
-                        return_value = False
-        return return_value
+            counts = np.bincount(self._cards[:self._num_cards], minlength=NUM_CARD_TYPES) \
+                     + np.bincount(self._in_play_cards[:self._num_in_play_cards], minlength=NUM_CARD_TYPES)
+            for index in np.flatnonzero(counts != expected).tolist():
+                LOGGER.info("Something is wrong with the %s", Card.from_index(index))
+            return bool((counts == expected).all())
+        return True
+
+    @staticmethod
+    def _to_cards(indices: np.ndarray) -> List[Card]:
+        by_index = Card._by_index
+        return [by_index[i] for i in indices.tolist()]
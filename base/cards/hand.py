@@ -1,27 +1,146 @@
+from array import array
 from typing import Union, List, Optional
 
+import numpy as np
+
 from base.card import Card
 from base.cards.card_set import CardSet
+from base.utils.card_constants import NUM_CARD_TYPES
+from base.zobrist import Zobrist
+
+#: The card indexes (see :meth:`Card.get_index`) in sorted card order
+SORTED_CARD_INDICES = sorted(range(1, NUM_CARD_TYPES), key=Card.from_index)
 
 
 class Hand(CardSet):
+    """
+    The cards in the hand of a player.
+
+    The hand is stored as the number of cards of each card type (see :meth:`Card.get_index`), so membership, adding and
+    removing cards take constant time. The list of cards, sorted, is only built when requested. The Zobrist hash and the
+    score of the cards of the hand are updated along with the counts.
+
+    The hand also counts the cards all players know it holds, e.g. the cards taken from the stack (see
+    :meth:`get_known_cards`).
+    """
+
+    def __init__(self, cards: Optional[List[Card]] = None):
+        super().__init__()
+        self._counts = array('h', [0]) * NUM_CARD_TYPES
+        self._num_cards = 0
+        self._cards = None  # Sorted list of the cards, None if it needs to be rebuilt
+        self._known = array('h', [0]) * NUM_CARD_TYPES  # The number of cards of each type known to all players
+        self._hash = 0
+        self._score = 0
+        if cards:
+            self.add(cards)
 
     def description(self) -> str:
         return "Hand"
 
-    def add(self, cards: Union[Card, List[Card]]):
+    def add(self, cards: Union[Card, List[Card]], known: bool = False):
+        """Add the given cards, known to all players if known is True (e.g. when they are taken from the stack)."""
+        counts = self._counts
+        keys = Zobrist.HAND_KEYS
         if isinstance(cards, Card):
-            self._cards.append(cards)
-        else:
-            self._cards.extend(cards)
+            cards = [cards]
+        for card in cards:
+            index = card.get_index()
+            self._hash ^= keys[index * Zobrist.MAX_COPIES + counts[index] % Zobrist.MAX_COPIES]
+            self._score += card.get_score()
+            counts[index] += 1
+            if known:
+                self._known[index] += 1
+        self._num_cards += len(cards)
+        self._cards = None
 
     def pop(self, card: Card) -> Card:
-        if card in self._cards:
-            self._cards.remove(card)
+        index = card.get_index()
+        if self._counts[index] > 0:
+            self._counts[index] -= 1
+            # The other players cannot tell which copy was removed, so they know of the copies left at most
+            if self._known[index] > self._counts[index]:
+                self._known[index] = self._counts[index]
+            self._hash ^= Zobrist.HAND_KEYS[index * Zobrist.MAX_COPIES + self._counts[index] % Zobrist.MAX_COPIES]
+            self._score -= card.get_score()
+            self._num_cards -= 1
+            self._cards = None
         return card
 
+    def forget(self, cards: List[Card]):
+        """No longer count the given cards as known to all players, e.g. when taking them from the stack is undone."""
+        known = self._known
+        for card in cards:
+            index = card.get_index()
+            if known[index] > 0:
+                known[index] -= 1
+
+    def get_known_cards(self) -> List[Card]:
+        """
+        Return the cards all players know are in this hand, sorted.
+
+        This is a lower bound: cards added back to the hand when an action is undone are no longer counted as known.
+        """
+        known = self._known
+        return [Card.from_index(i) for i in SORTED_CARD_INDICES for _ in range(known[i])]
+
     def is_empty(self) -> bool:
-        return len(self._cards) == 0
+        return self._num_cards == 0
 
     def sort(self, key=None, reverse=False):
-        self._cards.sort(key=key, reverse=reverse)
+        self.get_raw_cards().sort(key=key, reverse=reverse)
+
+    def get_counts(self) -> np.ndarray:
+        """Return the number of cards of each card type (see :meth:`Card.get_index`) in this hand."""
+        return np.frombuffer(self._counts, dtype=np.int16).copy()
+
+    def __len__(self):
+        return self._num_cards
+
+    def __contains__(self, item):
+        return isinstance(item, Card) and self._counts[item.get_index()] > 0
+
+    def __iter__(self):
+        return iter(self.get_raw_cards())
+
+    def count(self, card: Card) -> int:
+        """Return the number of times the given card occurs in this hand."""
+        return self._counts[card.get_index()]
+
+    def clear(self):
+        self._counts = array('h', [0]) * NUM_CARD_TYPES
+        self._num_cards = 0
+        self._cards = None
+        self._known = array('h', [0]) * NUM_CARD_TYPES
+        self._hash = 0
+        self._score = 0
+
+    def num_cards(self):
+        return self._num_cards
+
+    def clone(self) -> 'Hand':
+        clone = object.__new__(Hand)
+        clone._counts = self._counts[:]
+        clone._num_cards = self._num_cards
+        clone._cards = list(self._cards) if self._cards is not None else None
+        clone._known = self._known[:]
+        clone._hash = self._hash
+        clone._score = self._score
+        return clone
+
+    def get_score(self) -> int:
+        """Return the total score of the cards in this hand."""
+        return self._score
+
+    def get_hash(self) -> int:
+        """Return the Zobrist hash of the cards in this hand, see :class:`Zobrist`."""
+        return self._hash
+
+    def get_raw_cards(self):
+        if self._cards is None:
+            counts = self._counts
+            self._cards = [Card.from_index(i) for i in SORTED_CARD_INDICES for _ in range(counts[i])]
+        return self._cards
+
+    def _key(self):
+        return self._counts.tobytes()
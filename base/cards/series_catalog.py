@@ -0,0 +1,142 @@
+import logging
+import os
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from base.card import Card
+from base.cards.card_series import CardSeries
+from base.cards.series_code import SeriesCode
+from base.constants import Constants
+from base.utils import card_constants, generators
+from base.utils.cache_key import compute_cache_key, load_cache_file, save_cache_file
+from base.utils.card_constants import NUM_CARD_TYPES
+from base.utils.generators import series_generator
+from base.utils.singleton import Singleton
+
+
+class SeriesCatalog(metaclass=Singleton):
+    """
+    Process-wide catalog of all possible series (as generated by :func:`series_generator`), each with a stable integer id.
+
+    For every series, its validity, length, canasta score and total value are stored as arrays, along with boolean
+    (series x card index) tables of the cards that can be added to its front or back, or swapped for its joker or
+    two-joker. These tables are cached on disk like the action catalog.
+    """
+
+    FORMAT_VERSION = 2
+    FILE_NAME = "series_catalog.npz"
+    MIN_LENGTH = 3
+    MAX_LENGTH = 14
+    OPTION_TABLES = ['add_front_options', 'add_back_options', 'swap_joker_options', 'swap_two_options']
+    TABLES = ['valid', 'lengths', 'canasta_scores', 'total_values'] + OPTION_TABLES
+    #: The series are stored as their concatenated card indexes (see :meth:`Card.get_index`) and codes (-1 for None)
+    SERIES_ARRAYS = ['series_offsets', 'series_cards', 'codes']
+
+    def __init__(self):
+        self.series = []  # type: List[CardSeries]
+        self.valid = None  # type: Optional[np.ndarray]
+        self.lengths = None  # type: Optional[np.ndarray]
+        self.canasta_scores = None  # type: Optional[np.ndarray]
+        self.total_values = None  # type: Optional[np.ndarray]
+        self.add_front_options = None  # type: Optional[np.ndarray]
+        self.add_back_options = None  # type: Optional[np.ndarray]
+        self.swap_joker_options = None  # type: Optional[np.ndarray]
+        self.swap_two_options = None  # type: Optional[np.ndarray]
+        # The catalog stores card indexes and series codes, so it also depends on the encoding of the cards
+        key = compute_cache_key(self.FORMAT_VERSION, [SeriesCatalog, CardSeries, SeriesCode, generators, Card,
+                                                      card_constants])
+        path = os.path.join(Constants.ACTION_CACHE_DIR, self.FILE_NAME)
+        if not self._load(path, key):
+            self.series = list(series_generator(min_length=self.MIN_LENGTH, max_length=self.MAX_LENGTH))
+            self._compute()
+            try:
+                self._save(path, key)
+            except OSError as e:
+                logging.warning("Could not store the series catalog in {}: {}".format(path, e))
+        self._ids = {series: i for i, series in enumerate(self.series)}  # type: Dict[CardSeries, int]
+
+    def __len__(self):
+        return len(self.series)
+
+    def get_id(self, series: CardSeries) -> Optional[int]:
+        """Return the id of the given series, None if it is not in the catalog."""
+        return self._ids.get(series)
+
+    def get_add_front_options(self, series_id: int) -> List[Card]:
+        return self._get_options(self.add_front_options, series_id)
+
+    def get_add_back_options(self, series_id: int) -> List[Card]:
+        return self._get_options(self.add_back_options, series_id)
+
+    def get_swap_joker_options(self, series_id: int) -> List[Card]:
+        return self._get_options(self.swap_joker_options, series_id)
+
+    def get_swap_two_options(self, series_id: int) -> List[Card]:
+        return self._get_options(self.swap_two_options, series_id)
+
+    def is_add_front_option(self, series: CardSeries, card: Card) -> bool:
+        """Return True if the given card can be added to the front of the given series."""
+        return self._is_option(self.add_front_options, series, card, series.get_add_front_options)
+
+    def is_add_back_option(self, series: CardSeries, card: Card) -> bool:
+        """Return True if the given card can be added to the back of the given series."""
+        return self._is_option(self.add_back_options, series, card, series.get_add_back_options)
+
+    def is_swap_joker_option(self, series: CardSeries, card: Card) -> bool:
+        """Return True if the given card can be swapped for the joker of the given series."""
+        return self._is_option(self.swap_joker_options, series, card, series.get_swap_joker_options)
+
+    def is_swap_two_option(self, series: CardSeries, card: Card) -> bool:
+        """Return True if the given card can be swapped for the two-joker of the given series."""
+        return self._is_option(self.swap_two_options, series, card, series.get_swap_two_options)
+
+    def _is_option(self, table: np.ndarray, series: CardSeries, card: Card, get_options: Callable[[], List[Card]]) -> bool:
+        series_id = self._ids.get(series)
+        if series_id is None:
+            # Not a catalog series, compute the options from its cards
+            return card in get_options()
+        return bool(table[series_id, card.get_index()])
+
+    @staticmethod
+    def _get_options(table: np.ndarray, series_id: int) -> List[Card]:
+        """Return the cards of the given option table for the given series, in card index order."""
+        return [Card.from_index(i) for i in np.flatnonzero(table[series_id]).tolist()]
+
+    def _compute(self) -> None:
+        self.valid = np.array([series.is_valid() for series in self.series], dtype=bool)
+        self.lengths = np.array([len(series) for series in self.series], dtype=np.int8)
+        self.canasta_scores = np.array([series.get_canasta_score() for series in self.series], dtype=np.int16)
+        self.total_values = np.array([series.get_total_value() for series in self.series], dtype=np.int16)
+        for name in self.OPTION_TABLES:
+            table = np.zeros((len(self.series), NUM_CARD_TYPES), dtype=bool)
+            for i, series in enumerate(self.series):
+                table[i, [card.get_index() for card in getattr(series, 'get_' + name)()]] = True
+            setattr(self, name, table)
+
+    def _load(self, path: str, key: str) -> bool:
+        """
+        Load the series and tables stored at the given path, return False if there is no such file or if it has a
+        different key.
+        """
+        data = load_cache_file(path, key, self.SERIES_ARRAYS + self.TABLES)
+        if data is None:
+            return False
+        offsets = data['series_offsets'].tolist()
+        series_cards = data['series_cards'].tolist()
+        keys = [tuple(series_cards[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+        # The validity and code of the series are stored too, so they are not computed again to index the series
+        CardSeries.store_codes({series_key: (valid, code if code >= 0 else None) for series_key, valid, code
+                                in zip(keys, data['valid'].tolist(), data['codes'].tolist())})
+        self.series = [CardSeries([Card.from_index(i) for i in series_key]) for series_key in keys]
+        for name in self.TABLES:
+            setattr(self, name, data[name])
+        return True
+
+    def _save(self, path: str, key: str) -> None:
+        codes = [series.get_code() for series in self.series]
+        save_cache_file(path, key, dict(
+            series_offsets=np.cumsum([0] + [len(series) for series in self.series], dtype=np.int32),
+            series_cards=np.array([card.get_index() for series in self.series for card in series], dtype=np.int8),
+            codes=np.array([code if code is not None else -1 for code in codes], dtype=np.int32),
+            **{name: getattr(self, name) for name in self.TABLES}))
@@ -0,0 +1,80 @@
+from typing import List, Optional
+
+from base.card import Card
+from base.utils.card_constants import POSSIBLE_SUIT, JOKER_RANK, JOKER_SUIT
+
+
+class SeriesCode:
+    """
+    Packed integer representation of a valid series of cards.
+
+    A valid series is fully described by its main suit, the rank of its first position (the ace being rank 14 after
+    the king), its length and the position and kind (joker, or a two of some suit) of its single wildcard, if any.
+    These are packed into a single integer as: suit index (2 bits), start rank (4 bits), length (4 bits), wildcard
+    position (4 bits) and wildcard kind (3 bits: 0 for none, 1 for the joker, 2 + suit index for a two).
+    """
+
+    NO_WILDCARD = 0
+    JOKER = 1
+
+    @staticmethod
+    def pack(suit_index: int, start: int, length: int, wildcard_position: int = 0, wildcard_kind: int = NO_WILDCARD) -> int:
+        return suit_index | start << 2 | length << 6 | wildcard_position << 10 | wildcard_kind << 14
+
+    @staticmethod
+    def get_suit(code: int) -> str:
+        return POSSIBLE_SUIT[code & 0b11]
+
+    @staticmethod
+    def get_start(code: int) -> int:
+        return code >> 2 & 0b1111
+
+    @staticmethod
+    def get_length(code: int) -> int:
+        return code >> 6 & 0b1111
+
+    @staticmethod
+    def get_wildcard_position(code: int) -> Optional[int]:
+        """Return the position of the wildcard (joker or two-joker) in the series, None if there is none."""
+        return code >> 10 & 0b1111 if code >> 14 else None
+
+    @staticmethod
+    def get_wildcard_kind(code: int) -> int:
+        return code >> 14
+
+    @staticmethod
+    def has_joker(code: int) -> bool:
+        return code >> 14 == SeriesCode.JOKER
+
+    @staticmethod
+    def has_two_joker(code: int) -> bool:
+        return code >> 14 > SeriesCode.JOKER
+
+    @staticmethod
+    def is_two_joker(code: int, i: int) -> bool:
+        """Return True if the card at the given index (which may be negative) is a two-joker."""
+        if code >> 14 <= SeriesCode.JOKER:
+            return False
+        if i < 0:
+            i += code >> 6 & 0b1111
+        return i == code >> 10 & 0b1111
+
+    @staticmethod
+    def wildcard_kind(card: Card) -> int:
+        """Return the wildcard kind of the given card, used as a wildcard."""
+        if card.is_joker():
+            return SeriesCode.JOKER
+        return 2 + POSSIBLE_SUIT.index(card.get_suit())
+
+    @staticmethod
+    def decode(code: int) -> List[Card]:
+        """Return the cards of the series with the given code."""
+        suit = SeriesCode.get_suit(code)
+        start = SeriesCode.get_start(code)
+        cards = [Card(rank if rank <= 13 else 1, suit) for rank in range(start, start + SeriesCode.get_length(code))]
+        kind = SeriesCode.get_wildcard_kind(code)
+        if kind == SeriesCode.JOKER:
+            cards[SeriesCode.get_wildcard_position(code)] = Card(JOKER_RANK, JOKER_SUIT)
+        elif kind != SeriesCode.NO_WILDCARD:
+            cards[SeriesCode.get_wildcard_position(code)] = Card(2, POSSIBLE_SUIT[kind - 2])
+        return cards
@@ -20,6 +20,10 @@ class Stack(CardSet):
     def put(self, card: Card):
         self._cards.append(card)
 
+    def pop(self) -> Card:
+        """Remove the top card from the stack and return it."""
+        return self._cards.pop()
+
     def grab(self) -> List[Card]:
         cards = self._cards
         self._clear()
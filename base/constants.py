@@ -1,3 +1,6 @@
+import os
+
+
 class Constants:
 
     NUM_CARDS_IN_STARTING_HAND = 11
@@ -21,3 +24,5 @@ class Constants:
     JOKER_SWAP_EXTRA_SCORE = 40  # When swapping a joker, the value of a series might go down, so we add this score to add incentive
 
     GAME_ID_LENGTH = 20
+
+    ACTION_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "canasta")  # Location of the cached action catalog
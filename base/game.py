@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from ai.ai_player import AIPlayer
+from base.action_service import ActionService
 from base.board import Board
-from base.card import Card
-from base.cards.card_series import CardSeries
+from base.card_auditor import CardAuditor
 from base.cards.deck import Deck
 from base.cards.double_deck import DoubleDeck
 from base.cards.hand import Hand
@@ -16,19 +18,66 @@ from base.game_state import GameState
 from base.human_player import HumanPlayer
 from base.player import Player
 from base.team import Team
+from base.zobrist import Zobrist
 
 
 class Game:
 
-    def __init__(self, keep_history: bool = True):
+    def __init__(self, keep_history: bool = True, seed: Optional[int] = None, audit_cards: bool = False):
         self.players = None  # type: Optional[List[Player]]
         self.teams = None  # type: Optional[List[Team]]
         self.current_player_index = None
         self.current_team_index = None
         self.board = None  # type: Optional[Board]
         self.keep_history = keep_history
+        self.audit_cards = audit_cards  # If True, check that no card is lost or duplicated after every step
         self.history = GameHistory()
         self.initialized = False
+        # Random generator shuffling the decks of all the games played, so a seeded sequence of games is reproducible
+        self._rng = np.random.default_rng(seed)
+
+    def clone(self) -> 'Game':
+        """
+        Return a copy of this game which can be played independently, e.g. to explore actions in a search.
+
+        Only the mutable containers (hands, deck, piles, stack and series) are copied, the links between the players
+        and teams are rebuilt directly. The cards, actions and random generators are shared, the history is not copied.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.history = GameHistory()
+        if self.players is not None:
+            clone.players, clone.teams = self._clone_players(self.players, self.teams)
+        if self.board is not None:
+            clone.board = self.board.clone()
+        return clone
+
+    @classmethod
+    def from_state(cls, game_state: GameState, seed: Optional[int] = None) -> 'Game':
+        """
+        Return a new game continuing from the given state, with copies of its players and board (see :meth:`clone`).
+
+        The game keeps no history, and does not audit its cards.
+        """
+        game = cls(keep_history=False, seed=seed)
+        teams = [game_state.players[i].team for i in range(Constants.NUM_TEAMS)]
+        game.players, game.teams = cls._clone_players(game_state.players, teams)
+        game.board = game_state.board.clone()
+        game.board.auditor = None
+        game.current_player_index = game_state.current_player_index
+        game.current_team_index = game_state.current_team_index
+        game.initialized = True
+        return game
+
+    @staticmethod
+    def _clone_players(players: List[Player], teams: List[Team]) -> Tuple[List[Player], List[Team]]:
+        """Return copies of the given players and teams, linked to each other."""
+        player_clones = [player.clone() for player in players]
+        team_clones = {id(team): team.clone([player_clones[player.identifier] for player in team.players])
+                       for team in teams}
+        for player in player_clones:
+            player.team = team_clones[id(player.team)]
+        return player_clones, [team_clones[id(team)] for team in teams]
 
     def reset_game(self, initialize: bool = True, clear_history: bool = True):
         self.players = None  # type: Optional[List[Player]]
@@ -58,6 +107,8 @@ class Game:
             self._initialize_board_stack()
             # Set up game phase
             self.board.set_phase(GamePhase.DRAW_PHASE)
+            if self.audit_cards:
+                self.board.auditor = CardAuditor(self.board, self.players)
             self.initialized = True
             if self.keep_history:
                 self.history.add(self, None)
@@ -82,6 +133,23 @@ class Game:
             return self.teams[1]
         return None
 
+    def play(self, verbose: bool = False, max_steps: Optional[int] = None) -> int:
+        """
+        Play the game until it is finished or stalled (see :meth:`is_stalled`), or until the given maximum number of
+        steps have been played.
+
+        :return: the number of steps played
+        """
+        if not self.initialized:
+            raise Exception("Game not initialized")
+        num_steps = 0
+        while not self.is_finished() and (max_steps is None or num_steps < max_steps):
+            if self.is_stalled():
+                break
+            self.play_single_step(verbose=verbose)
+            num_steps += 1
+        return num_steps
+
     def play_single_step(self, verbose: bool = False):
         """Play a single action in a game of canasta."""
         if not self.initialized:
@@ -91,11 +159,49 @@ class Game:
                 self.print()
                 print("Current player: {}".format(self.current_player_index))
             action = self.players[self.current_player_index].play_single_step(self.get_state(), verbose=verbose)
+            if self.board.auditor is not None:
+                self.board.auditor.check(self.board, self.players)
             if self.keep_history:
                 self.history.add(self, action)
             if self.board.phase == GamePhase.END_TURN_PHASE:
                 self._next_player_turn()
 
+    def set_player(self, player: Player) -> None:
+        """
+        Replace the player with the same identifier by the given player, e.g. to let another AI play its seat.
+
+        The given player takes over the hand, team and pile of the replaced player.
+        """
+        if not self.initialized:
+            raise Exception("Game not initialized")
+        replaced = self.players[player.identifier]
+        player.deal(replaced.hand)
+        player.set_team(replaced.team)
+        if replaced.has_grabbed_pile():
+            player.set_pile_grabbed()
+        team_players = replaced.team.players
+        team_players[team_players.index(replaced)] = player
+        self.players[player.identifier] = player
+
+    def switch_player_turns(self) -> None:
+        """End the turn of the current player, when it has reached the END_TURN_PHASE."""
+        self._next_player_turn()
+
+    def get_hash(self) -> int:
+        """
+        Return the 64-bit Zobrist hash of the current position of this game: the board (see :meth:`Board.get_hash`),
+        the hands of the players, the pile flags of the teams and the current player.
+
+        The hash is built from parts kept up to date by the hands and the board, so it takes constant time.
+        """
+        game_hash = self.board.get_hash() ^ Zobrist.CURRENT_PLAYER_KEYS[self.current_player_index]
+        for player in self.players:
+            game_hash ^= Zobrist.hand(player.hand.get_hash(), player.identifier)
+        for i, team in enumerate(self.teams):
+            if team.has_grabbed_pile():
+                game_hash ^= Zobrist.TEAM_PILE_KEYS[i]
+        return game_hash
+
     def get_state(self) -> GameState:
         """Return the current GameState of this Board."""
         return GameState(self.board, self.players,
@@ -108,31 +214,25 @@ class Game:
         :param include_opponent_cards: if True, include the opponents cards values in the score
         :return: the total score for the red team.
         """
-        opponent_cards = []
-        if include_opponent_cards:
-            for player in self.blue_team.players:
-                opponent_cards.extend(player.hand.get_raw_cards())
-        return self._get_team_score(self.red_team, self.board.red_team_series, opponent_cards)
+        return self._get_team_score(self.red_team, self.blue_team if include_opponent_cards else None)
 
     def get_blue_team_score(self, include_opponent_cards: bool = True):
         """
         :param include_opponent_cards: if True, include the opponents cards values in the score
         :return: the total score for the blue team.
         """
-        opponent_cards = []
-        if include_opponent_cards:
-            for player in self.red_team.players:
-                opponent_cards.extend(player.hand.get_raw_cards())
-        return self._get_team_score(self.blue_team, self.board.blue_team_series, opponent_cards)
+        return self._get_team_score(self.blue_team, self.red_team if include_opponent_cards else None)
 
-    @staticmethod
-    def _get_team_score(team: Team, team_series: List[CardSeries], opponent_cards: List[Card]) -> int:
-        """Return the total score for given team, its card series and the oppposing teams cards."""
-        total_score = 0
-        for series in team_series:
-            total_score += series.get_total_value()
-        for card in opponent_cards:
-            total_score += card.get_score()
+    def _get_team_score(self, team: Team, opponent_team: Optional[Team]) -> int:
+        """
+        Return the total score for given team, optionally including the cards of the opposing team.
+
+        The values of the series and hands are kept up to date by the board and hands, so this takes constant time.
+        """
+        total_score = self.board.get_series_value(team)
+        if opponent_team is not None:
+            for player in opponent_team.players:
+                total_score += player.hand.get_score()
         if team.has_grabbed_pile():
             total_score += 100
         # TODO: Add 100 points for finishing the game by drawing a card from the deck
@@ -155,6 +255,18 @@ class Game:
                 return True
         return False
 
+    def is_stalled(self) -> bool:
+        """
+        Return True if the game is not finished, but the current player has no valid action.
+
+        This is a dead end of the rules: e.g. a player without cards in the NO_CARDS_END_TURN_PHASE, whose team has
+        already grabbed its pile, while no pile is left. A player with cards can always draw or discard one, so the
+        valid actions are only computed for an empty hand.
+        """
+        player = self.current_player
+        return player.hand.is_empty() and not self.is_finished() \
+            and not ActionService().get_valid_actions_mask(player, self.board).any()
+
     def _next_player_turn(self) -> None:
         """Increment the player and team counters to indicate it's now the next players turn."""
         self.current_player_index += 1
@@ -174,9 +286,8 @@ class Game:
         self.players[3].set_team(team_blue)
         self.teams = [team_red, team_blue]
 
-    @staticmethod
-    def _create_deck() -> Deck:
-        deck = DoubleDeck(with_jokers=True)
+    def _create_deck(self) -> Deck:
+        deck = DoubleDeck(with_jokers=True, seed=self._rng)
         deck.shuffle()
         return deck
 
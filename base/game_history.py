@@ -1,47 +1,109 @@
-from copy import deepcopy
-from typing import Tuple, Optional, TYPE_CHECKING
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
 
+from base.action_service import ActionService
 from base.actions.action import Action
+from base.enums.game_phase import GamePhase
 
 if TYPE_CHECKING:
     from base.game import Game
 
 
 class GameHistory:
-    """Class that represents the full history (actions taken and corresponding game state) of a game."""
+    """
+    Class that represents the full history (actions taken and corresponding game state) of a game.
 
-    def __init__(self):
-        self.history = []
+    The history is stored as the index of each action, with a copy of the game only every few steps (a checkpoint).
+    The state at any step is rebuilt by replaying the actions from the last checkpoint before it, which is checked
+    against the Zobrist hash (see :meth:`Game.get_hash`) recorded for each step.
+    """
+
+    def __init__(self, checkpoint_interval: int = 50):
+        """
+        :param checkpoint_interval: the number of steps between two copies of the game
+        """
+        self.checkpoint_interval = checkpoint_interval
+        self.clear()
 
     def add(self, game: 'Game', action: Optional[Action]):
-        action = deepcopy(action)
-        game = deepcopy(game)
-        game.history = None  # avoid recursive reference
-        self.history.append((game, action))
+        """Record the given game right after the given action, None for a game that was not reached by an action."""
+        i = len(self._action_indices)
+        if action is None or not self._checkpoint_indices \
+                or i - self._checkpoint_indices[-1] >= self.checkpoint_interval:
+            # Actions are immutable, so only the game needs to be copied
+            checkpoint = game.clone()
+            checkpoint.history = None
+            self._checkpoints[i] = checkpoint
+            self._checkpoint_indices.append(i)
+        self._action_indices.append(-1 if action is None else ActionService().action_to_idx(action))
+        self._hashes.append(game.get_hash())
 
     def get(self, i: int) -> Optional[Tuple['Game', Action]]:
-        try:
-            return self.history[i]
-        except IndexError:
+        i = self._to_index(i)
+        if i is None:
             return None
+        return self._get_state(i), self._get_action(i)
 
     def get_state_at(self, i: int) -> Optional['Game']:
-        try:
-            return self.history[i][0]
-        except IndexError:
+        """Return a copy of the game at the given step, rebuilt from the last checkpoint before it."""
+        i = self._to_index(i)
+        if i is None:
             return None
+        return self._get_state(i)
 
     def get_last_state(self) -> Optional['Game']:
         return self.get_state_at(-1)
 
     def get_action_at(self, i: int) -> Optional[Action]:
-        try:
-            return self.history[i][1]
-        except IndexError:
+        i = self._to_index(i)
+        if i is None:
             return None
+        return self._get_action(i)
 
     def get_last_action(self) -> Optional[Action]:
         return self.get_action_at(-1)
 
     def clear(self):
-        self.history = []
+        self._action_indices = array('i')  # The index of the action of each step, -1 if there is none
+        self._hashes = array('Q')  # The hash of the game at each step
+        self._checkpoints = {}  # type: Dict[int, Game]
+        self._checkpoint_indices = []  # type: List[int]
+        # The last game rebuilt and its step, to continue replaying from when accessing the steps in order
+        self._last_rebuilt = None  # type: Optional[Tuple[int, Game]]
+
+    def __len__(self):
+        return len(self._action_indices)
+
+    def _to_index(self, i: int) -> Optional[int]:
+        num_steps = len(self._action_indices)
+        if i < 0:
+            i += num_steps
+        return i if 0 <= i < num_steps else None
+
+    def _get_action(self, i: int) -> Optional[Action]:
+        action_idx = self._action_indices[i]
+        return ActionService().idx_to_action(action_idx) if action_idx >= 0 else None
+
+    def _get_state(self, i: int) -> 'Game':
+        start = self._checkpoint_indices[bisect_right(self._checkpoint_indices, i) - 1]
+        if self._last_rebuilt is not None and start <= self._last_rebuilt[0] <= i:
+            start, game = self._last_rebuilt
+        else:
+            game = self._checkpoints[start]
+        game = game.clone()
+        game.history = None
+        if start == i:
+            return game
+        for step in range(start + 1, i + 1):
+            # The game was recorded before moving to the next player, see Game.play_single_step
+            if game.board.phase == GamePhase.END_TURN_PHASE:
+                game.switch_player_turns()
+            ActionService().idx_to_action(self._action_indices[step]).execute(game.current_player, game.board)
+            if game.get_hash() != self._hashes[step]:
+                raise Exception("The game does not match its history at step {}, it was altered between steps"
+                                .format(step))
+        self._last_rebuilt = i, game
+        game = game.clone()
+        game.history = None
+        return game
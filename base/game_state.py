@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from base.board import Board
 from base.cards.card_encoder import CardEncoder
@@ -13,7 +15,7 @@ class GameState:
     The game state contains all necessary information for a player to determine the next action.
     """
 
-    SIZE = 20800  # Total number of integers required to represent the game state
+    SIZE = 20804  # Total number of integers required to represent the game state
 
     def __init__(self, board: Board, players: List[Player],
                  current_player_index: int, current_team_index: int,
@@ -31,20 +33,32 @@ class GameState:
 
         This representation only contains information that is accessible to the specified player.
         """
-        representation = []
-        representation.extend(self._own_player_index_representation(player=player))
-        representation.extend(self._current_player_representation())
-        representation.extend(self._current_team_representation())
-        representation.extend(self._player_hand_representation(player=player))
-        representation.extend(self._top_stack_card_representation())
-        representation.extend(self._team_piles_taken_representation())
-        representation.extend(self._player_piles_taken_representation())
-        representation.extend(self._players_num_cards_representation())
-        representation.extend(self._own_team_series_representation(player=player))
-        representation.extend(self._other_team_series_representation(player=player))
-        representation.extend(self._deck_num_cards_representation())
-        representation.extend(self._team_score_representations())
-        return representation
+        return self.create_numeral_array(player).tolist()
+
+    def create_numeral_array(self, player: Player, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Create the numerical representation of :meth:`create_numeral_representation` as an array of :attr:`SIZE`.
+
+        :param player: the player for which the representation is created
+        :param out: if given, the array (of any numerical type) the representation is written to
+        """
+        parts = [self._own_player_index_representation(player=player),
+                 self._current_player_representation(),
+                 self._current_team_representation(),
+                 self._player_hand_representation(player=player),
+                 self._top_stack_card_representation(),
+                 self._team_piles_taken_representation(),
+                 self._player_piles_taken_representation(),
+                 self._players_num_cards_representation(),
+                 self._own_team_series_representation(player=player),
+                 self._other_team_series_representation(player=player),
+                 self._deck_num_cards_representation(),
+                 self._team_score_representations()]
+        representation = np.concatenate(parts).astype(int)
+        if out is None:
+            return representation
+        out[:] = representation
+        return out
 
     @staticmethod
     def _own_player_index_representation(player: Player):
@@ -58,10 +72,10 @@ class GameState:
 
     @staticmethod
     def _player_hand_representation(player: Player):
-        return list(CardEncoder().encode(player.hand.get_raw_cards()))
+        return CardEncoder.encode_counts(player.hand.get_counts())
 
     def _top_stack_card_representation(self):
-        return list(CardEncoder().encode(self.board.stack.look()))
+        return CardEncoder().encode(self.board.stack.look())
 
     def _team_piles_taken_representation(self):
         red_grabbed_pile = False
@@ -87,12 +101,12 @@ class GameState:
         return [player.num_cards() for player in self.players]
 
     def _own_team_series_representation(self, player: Player):
-        return list(CardSeriesEncoder().encode(self.board.get_series_for_player(player)))
+        return CardSeriesEncoder().encode(self.board.get_series_for_player(player))
 
     def _other_team_series_representation(self, player: Player):
         for other_player in self.players:
             if other_player.team_color != player.team_color:
-                return list(CardSeriesEncoder().encode(self.board.get_series_for_player(other_player)))
+                return CardSeriesEncoder().encode(self.board.get_series_for_player(other_player))
 
     def _deck_num_cards_representation(self):
         return [self.board.deck.num_cards()]
@@ -37,9 +37,9 @@ class Player(metaclass=ABCMeta):
     def team_color(self):
         return self.team.color
 
-    def set_pile_grabbed(self):
-        self.team.set_pile_grabbed()
-        self._pile_grabbed = True
+    def set_pile_grabbed(self, grabbed: bool = True):
+        self.team.set_pile_grabbed(grabbed)
+        self._pile_grabbed = grabbed
 
     def has_grabbed_pile(self):
         return self._pile_grabbed
@@ -58,6 +58,13 @@ class Player(metaclass=ABCMeta):
         action.execute(self, game_state.board)
         return action
 
+    def clone(self) -> 'Player':
+        """Return a copy of this player with a copy of its hand, still linked to the same team."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.hand = self.hand.clone() if self.hand is not None else None
+        return clone
+
     def deal(self, hand: Hand):
         self.hand = hand
 
@@ -13,8 +13,15 @@ class Team:
         self.color = color
         self._pile_grabbed = False
 
-    def set_pile_grabbed(self):
-        self._pile_grabbed = True
+    def clone(self, players: List['Player']) -> 'Team':
+        """Return a copy of this team, consisting of the given players."""
+        clone = object.__new__(Team)
+        clone.__dict__.update(self.__dict__)
+        clone.players = players
+        return clone
+
+    def set_pile_grabbed(self, grabbed: bool = True):
+        self._pile_grabbed = grabbed
 
     def has_grabbed_pile(self):
         return self._pile_grabbed
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TranspositionTable:
+    """
+    A bounded cache of values computed for positions, keyed by their Zobrist hash (see :meth:`Game.get_hash`), e.g.
+    the statistics of a search or the valid actions of each position.
+
+    Positions reached by different orders of actions have the same hash, so their values are only computed once.
+    When the table is full, the least recently used entry is replaced.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        if capacity <= 0:
+            raise Exception("The capacity of a transposition table must be positive, got {}".format(capacity))
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict[int, Any]
+
+    def get(self, key: int, default: Optional[Any] = None) -> Any:
+        """Return the value stored for the given hash, or the default if there is none."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: int, value: Any) -> None:
+        """Store the value for the given hash, replacing the least recently used entry if the table is full."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+        entries[key] = value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,49 @@
+import hashlib
+import inspect
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from base.constants import Constants
+
+
+def compute_cache_key(format_version: int, sources: Iterable[object]) -> str:
+    """
+    Return a key identifying data cached on disk, generated by the given modules (or classes) with the current Constants.
+
+    The key changes whenever the format version, the source code of any of the given modules or a constant changes.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(format_version).encode())
+    for name, value in sorted(vars(Constants).items()):
+        if name.isupper() and name != "ACTION_CACHE_DIR":
+            digest.update("{}={!r}".format(name, value).encode())
+    for source in sources:
+        with open(inspect.getsourcefile(source), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_cache_file(path: str, key: str, names: Iterable[str]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Return the arrays with the given names stored at the given path, None if there is no such file, if it has a
+    different key or if it misses any of the arrays.
+    """
+    try:
+        with np.load(path) as data:
+            if str(data['key']) != key:
+                return None
+            return {name: data[name] for name in names}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_cache_file(path: str, key: str, arrays: Dict[str, np.ndarray]) -> None:
+    """Store the given arrays at the given path, along with the given key."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temporary file first so concurrent processes never read a partially written file
+    temp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(temp_path, 'wb') as f:
+        np.savez(f, key=np.array(key), **arrays)
+    os.replace(temp_path, path)
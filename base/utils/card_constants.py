@@ -17,6 +17,9 @@ JOKER_SUIT = 'joker'
 #: a number representing the Joker's rank
 JOKER_RANK = 0
 
+#: the number of card types: an empty slot, all suit and rank combinations and the joker
+NUM_CARD_TYPES = 1 + len(POSSIBLE_SUIT) * len(POSSIBLE_RANK) + 1
+
 #: a dictionary which translates the special face cards to strings
 RANK_TRANSLATION = {
     1: 'ace',
@@ -1,9 +1,19 @@
-from typing import Optional
+from itertools import accumulate
+from typing import Iterator, List, Optional, Tuple
 
 from base.card import Card
 from base.cards.card_series import CardSeries
 from base.utils.card_constants import POSSIBLE_SUIT, JOKER_SUIT, JOKER_RANK
 
+#: The ranks of all consecutive card positions in a series, the ace can be used both as the lowest and highest card
+SERIES_RANKS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 1]
+
+#: The card indexes (see Card.get_index) of the natural cards at each series position, per suit
+_SERIES_INDICES = [tuple(Card(rank, suit).get_index() for rank in SERIES_RANKS) for suit in POSSIBLE_SUIT]
+
+#: The card indexes of the cards which can replace any card of a series: the joker and the twos
+_WILDCARD_INDICES = [Card(JOKER_RANK, JOKER_SUIT).get_index()] + [Card(2, suit).get_index() for suit in POSSIBLE_SUIT]
+
 
 def series_generator(min_length: int = 1, max_length: Optional[int] = None):
     """
@@ -24,7 +34,7 @@ def suit_series_generator(suit: str, min_length: int = 1, max_length: Optional[i
         for i in range(len(original_series)):
             yield CardSeries(original_series[:i] + [Card(JOKER_RANK, JOKER_SUIT)] + original_series[i+1:])
         # Any card in the series can also be a 2 of another suit
-        for possible_suit in (set(POSSIBLE_SUIT) - {suit}):
+        for possible_suit in [other_suit for other_suit in POSSIBLE_SUIT if other_suit != suit]:
             for i in range(len(original_series)):
                 yield CardSeries(original_series[:i] + [Card(2, possible_suit)] + original_series[i+1:])
         # For the 2 of the suit itself, we must make sure not to replace the 'real' 2 with a joker one, this would be a duplicate
@@ -35,8 +45,49 @@ def suit_series_generator(suit: str, min_length: int = 1, max_length: Optional[i
 
 def ranks_list_generator(min_length: int, max_length: Optional[int]):
     """Generate lists of all possible CardSeries ranks."""
-    ranks = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 1]
+    ranks = SERIES_RANKS
     max_length = max_length or len(ranks) - 1
     for length in range(min_length, max_length + 1):
         for i in range(0, len(ranks) - length + 1):
             yield ranks[i:i+length]
+
+
+def hand_series_generator(hand_counts: List[int], min_length: int = 1,
+                          max_length: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+    """
+    Generate the card indexes (see Card.get_index) of all series produced by series_generator that can be formed with
+    the cards of a hand, given as the list of its number of cards of each card type (see Hand.get_counts).
+
+    Rather than checking every possible series, the series are built from the natural cards the hand holds in each suit.
+    A series holds at most one card that isn't its natural card, which must then be a joker or a two in the hand.
+    """
+    max_length = max_length or len(SERIES_RANKS) - 1
+    wildcards = [i for i in _WILDCARD_INDICES if hand_counts[i] > 0]
+    max_missing = 1 if wildcards else 0
+    num_positions = len(SERIES_RANKS)
+    for suit_indices in _SERIES_INDICES:
+        ace, two = suit_indices[0], suit_indices[1]
+        # The number of positions before each position for which the hand has no natural card
+        num_missing = [0] + list(accumulate(hand_counts[i] == 0 for i in suit_indices))
+        for start in range(num_positions - min_length + 1):
+            if num_missing[start + min_length] - num_missing[start] > max_missing:
+                continue
+            for end in range(start + min_length, min(start + max_length, num_positions) + 1):
+                num_gaps = num_missing[end] - num_missing[start]
+                if num_gaps > max_missing:
+                    break  # A single wildcard can't fill two gaps, longer series won't fit either
+                natural = suit_indices[start:end]
+                # The ace at both ends, or the two of the suit as both natural card and wildcard, must be held twice
+                single_two = start <= 1 < end and hand_counts[two] < 2
+                if end - start == num_positions and hand_counts[ace] < 2:
+                    positions = [0, len(natural) - 1] if num_gaps == 0 else []
+                elif num_gaps == 0:
+                    yield natural
+                    positions = range(len(natural))
+                else:
+                    positions = [next(i for i, card in enumerate(natural) if hand_counts[card] == 0)]
+                for i in positions:
+                    for wildcard in wildcards:
+                        # Replacing the natural two with itself would be a duplicate of the natural series
+                        if wildcard != natural[i] and not (wildcard == two and single_two):
+                            yield natural[:i] + (wildcard,) + natural[i + 1:]
@@ -0,0 +1,84 @@
+from typing import List, TYPE_CHECKING
+
+import numpy as np
+
+from base.constants import Constants
+from base.enums.game_phase import GamePhase
+from base.utils.card_constants import NUM_CARD_TYPES
+
+if TYPE_CHECKING:
+    from base.cards.card_series import CardSeries
+
+#: The mask of 64-bit unsigned integers
+MASK = (1 << 64) - 1
+
+#: Generates the keys, with a fixed seed so the hashes are the same in every process
+_rng = np.random.default_rng(0x5A0B1157)
+
+
+def _create_keys(n: int) -> List[int]:
+    return _rng.integers(0, 1 << 64, size=n, dtype=np.uint64).tolist()
+
+
+class Zobrist:
+    """
+    The random 64-bit keys from which the Zobrist hashes of the positions of a game are built.
+
+    A position is hashed by combining the keys of its parts with XOR, so each part can be updated on its own when it
+    changes: each card in a hand toggles the key of its card type and number of copies (see :meth:`Hand.get_hash`),
+    and the series of each team are combined by their sum, so the order in which they were put does not matter (see
+    :meth:`Board.get_hash`). :meth:`Game.get_hash` adds the hands of the players, the pile flags of the teams and the
+    current player.
+    """
+
+    #: The number of copies of each card type keyed in a hand, counts above wrap around
+    MAX_COPIES = 8
+    HAND_KEYS = _create_keys(NUM_CARD_TYPES * MAX_COPIES)
+    PLAYER_KEYS = _create_keys(Constants.NUM_PLAYERS)
+    CURRENT_PLAYER_KEYS = _create_keys(Constants.NUM_PLAYERS)
+    TEAM_SERIES_KEYS = _create_keys(Constants.NUM_TEAMS)
+    TEAM_PILE_KEYS = _create_keys(Constants.NUM_TEAMS)
+    PILE_KEYS = _create_keys(2)
+    #: The key of the top card of the stack by card index, 0 for an empty stack
+    STACK_TOP_KEYS = _create_keys(NUM_CARD_TYPES)
+    STACK_SIZE_KEYS = _create_keys(2 * NUM_CARD_TYPES + 1)
+    PHASE_KEYS = dict(zip([None] + list(GamePhase), _create_keys(len(GamePhase) + 1)))
+
+    @staticmethod
+    def mix(value: int) -> int:
+        """Return the 64-bit finalizer of SplitMix64 of the given value, a bijection scattering its bits."""
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK
+        return value ^ (value >> 31)
+
+    @staticmethod
+    def hand(hand_hash: int, identifier: int) -> int:
+        """Return the key of the hand with the given hash held by the player with the given identifier."""
+        return Zobrist.mix(hand_hash ^ Zobrist.PLAYER_KEYS[identifier])
+
+    @staticmethod
+    def series(series: 'CardSeries') -> int:
+        """Return the key of the given series, which depends on the order of its cards."""
+        code = series.get_code()
+        if code is not None:
+            return Zobrist.mix(code)
+        value = len(series)
+        for card in series:
+            value = Zobrist.mix(value ^ card.get_index())
+        return Zobrist.mix(value ^ MASK)
+
+    @staticmethod
+    def team_series(team_series: List['CardSeries'], team_index: int) -> int:
+        """
+        Return the key of the series of a team, the sum of the keys of its series (see :meth:`team_series_key`), which
+        does not depend on the order of the series.
+        """
+        return sum(Zobrist.team_series_key(series, team_index) for series in team_series) & MASK
+
+    @staticmethod
+    def team_series_key(series: 'CardSeries', team_index: int) -> int:
+        """
+        Return the key of the given series of the team with the given index. It is added to the key of the series of
+        the team, rather than combined with XOR, so two series with the same cards do not cancel each other out.
+        """
+        return Zobrist.mix(Zobrist.series(series) ^ Zobrist.TEAM_SERIES_KEYS[team_index])
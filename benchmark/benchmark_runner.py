@@ -0,0 +1,84 @@
+import random
+import time
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+
+from benchmark.benchmark_scenario import BenchmarkScenario
+
+
+class BenchmarkRunner:
+    """
+    Runs benchmark scenarios and compares their results against a baseline.
+
+    The speed of a scenario is the best number of operations per second over a few repeats, each repeat running the
+    operation for at least min_time seconds. The peak memory is the peak traced allocation while running the operation
+    once after setup, measured in a separate run as tracing slows down the code.
+    """
+
+    def __init__(self, min_time: float = 0.2, repeat: int = 3):
+        self.min_time = min_time
+        self.repeat = repeat
+
+    def run(self, scenario: BenchmarkScenario) -> Dict[str, float]:
+        """Run the given scenario, and return its number of operations per second and peak memory in bytes."""
+        operation = self._setup(scenario)
+        operation()  # warm up
+        best_ops_per_sec = 0.0
+        for _ in range(self.repeat):
+            num_ops = 0
+            start = time.perf_counter()
+            while True:
+                num_ops += self._call(operation)
+                elapsed = time.perf_counter() - start
+                if elapsed >= self.min_time:
+                    break
+            best_ops_per_sec = max(best_ops_per_sec, num_ops / elapsed)
+
+        operation = self._setup(scenario)
+        tracemalloc.start()
+        try:
+            start_memory = tracemalloc.get_traced_memory()[0]
+            self._call(operation)
+            peak_memory = tracemalloc.get_traced_memory()[1] - start_memory
+        finally:
+            tracemalloc.stop()
+        return {'ops_per_sec': best_ops_per_sec, 'peak_memory': peak_memory}
+
+    def run_all(self, scenarios: List[BenchmarkScenario]) -> Dict[str, Dict[str, float]]:
+        """Run all given scenarios, and return their results by scenario name."""
+        return {scenario.name: self.run(scenario) for scenario in scenarios}
+
+    @staticmethod
+    def _setup(scenario: BenchmarkScenario):
+        random.seed(scenario.seed)
+        np.random.seed(scenario.seed)
+        return scenario.setup(scenario.seed)
+
+    @staticmethod
+    def _call(operation) -> int:
+        num_ops = operation()
+        return 1 if num_ops is None else num_ops
+
+    @staticmethod
+    def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                max_slowdown: float, max_memory_increase: float) -> List[str]:
+        """
+        Return a description of every regression of the given results with respect to the baseline: scenarios which
+        are more than max_slowdown (a fraction) slower, or use more than max_memory_increase (a fraction) more memory.
+        Scenarios missing from either are ignored.
+        """
+        regressions = []
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            expected = baseline[name]
+            slowdown = 1 - result['ops_per_sec'] / expected['ops_per_sec']
+            if slowdown > max_slowdown:
+                regressions.append("{}: {:.1%} slower ({:.1f} ops/sec, baseline {:.1f} ops/sec)"
+                                   .format(name, slowdown, result['ops_per_sec'], expected['ops_per_sec']))
+            if result['peak_memory'] > (1 + max_memory_increase) * max(expected['peak_memory'], 1):
+                regressions.append("{}: peak memory {} bytes, baseline {} bytes"
+                                   .format(name, result['peak_memory'], expected['peak_memory']))
+        return regressions
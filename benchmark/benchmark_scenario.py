@@ -0,0 +1,19 @@
+from typing import Callable, Optional
+
+
+class BenchmarkScenario:
+    """
+    A reproducible benchmark scenario.
+
+    The setup function is called with the seed of the scenario (the random generators are also seeded with it), and
+    returns the operation to measure. The operation returns the number of operations it performed, or None for a
+    single operation.
+    """
+
+    def __init__(self, name: str, setup: Callable[[int], Callable[[], Optional[int]]], seed: int = 0):
+        self.name = name
+        self.setup = setup
+        self.seed = seed
+
+    def __repr__(self):
+        return "BenchmarkScenario({})".format(self.name)
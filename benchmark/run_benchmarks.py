@@ -0,0 +1,53 @@
+import argparse
+import json
+import platform
+import sys
+
+from benchmark.benchmark_runner import BenchmarkRunner
+from benchmark.scenarios import create_scenarios
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths of the rules engine.")
+    parser.add_argument('scenarios', nargs='*', help="run only the scenarios whose name contains one of these")
+    parser.add_argument('--list', action='store_true', help="list the scenarios and exit")
+    parser.add_argument('--min-time', type=float, default=0.2, help="minimum duration of each repeat, in seconds")
+    parser.add_argument('--repeat', type=int, default=3, help="number of repeats, the best one is reported")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', help="compare against the results stored in this JSON file")
+    parser.add_argument('--max-slowdown', type=float, default=0.1,
+                        help="allowed fraction of slowdown with respect to the baseline")
+    parser.add_argument('--max-memory-increase', type=float, default=0.25,
+                        help="allowed fraction of peak memory increase with respect to the baseline")
+    args = parser.parse_args()
+
+    scenarios = [scenario for scenario in create_scenarios()
+                 if not args.scenarios or any(pattern in scenario.name for pattern in args.scenarios)]
+    if args.list:
+        for scenario in scenarios:
+            print(scenario.name)
+        return 0
+
+    runner = BenchmarkRunner(min_time=args.min_time, repeat=args.repeat)
+    results = {}
+    print("{:<40} {:>14} {:>16}".format("scenario", "ops/sec", "peak memory (B)"))
+    for scenario in scenarios:
+        result = results[scenario.name] = runner.run(scenario)
+        print("{:<40} {:>14.1f} {:>16}".format(scenario.name, result['ops_per_sec'], result['peak_memory']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(), 'results': results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = BenchmarkRunner.compare(results, baseline, args.max_slowdown, args.max_memory_increase)
+        for regression in regressions:
+            print("REGRESSION {}".format(regression))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import random
+from copy import deepcopy
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from ai.vec_canasta_env import VecCanastaEnv
+from base.action_catalog import ActionCatalog
+from base.action_service import ActionService
+from base.actions.put_action import PutAction
+from base.cards.card_series import CardSeries
+from base.enums.game_phase import GamePhase
+from base.game import Game
+from base.game_history import GameHistory
+from base.utils.singleton import Singleton
+from benchmark.benchmark_scenario import BenchmarkScenario
+
+NUM_SERIES = 1000  # Number of series checked per operation of the series scenarios
+NUM_GAME_STEPS = 40  # Number of random steps played to reach the mid game states of the other scenarios
+NUM_BATCH_GAMES = 16  # Number of games of the batched scenarios
+
+
+def create_scenarios() -> List[BenchmarkScenario]:
+    """Return all benchmark scenarios of the rules engine hot paths."""
+    scenarios = [BenchmarkScenario("action_service_construction", _setup_action_service_construction)]
+    for phase in GamePhase:
+        scenarios.append(BenchmarkScenario("valid_actions_mask[{}]".format(phase.name.lower()),
+                                           lambda seed, phase=phase: _setup_valid_actions_mask(seed, phase)))
+    scenarios.extend([
+        BenchmarkScenario("valid_actions_masks[batched]", _setup_valid_actions_masks),
+        BenchmarkScenario("vec_canasta_env_step", _setup_vec_canasta_env_step),
+        BenchmarkScenario("card_series_is_valid", _setup_card_series_is_valid),
+        BenchmarkScenario("card_series_is_two_joker", _setup_card_series_is_two_joker),
+        BenchmarkScenario("game_state_numeral_representation", _setup_game_state_numeral_representation),
+        BenchmarkScenario("game_history_add", _setup_game_history_add),
+        BenchmarkScenario("game_clone", _setup_game_clone),
+        BenchmarkScenario("game_deepcopy", _setup_game_deepcopy),
+        BenchmarkScenario("random_game_steps", _setup_random_game_steps),
+    ])
+    return scenarios
+
+
+def _mid_game(seed: int) -> Game:
+    game = Game(keep_history=False, seed=seed)
+    game.initialize_game()
+    game.play(max_steps=NUM_GAME_STEPS)
+    return game
+
+
+def _put_series(num_series: int) -> List[CardSeries]:
+    """Return new series of randomly chosen put actions, valid or not."""
+    catalog = ActionService()._catalog
+    put_indices = np.flatnonzero(catalog.type_codes == ActionCatalog.ACTION_TYPES.index(PutAction))
+    return [CardSeries(list(catalog.create_action(i).series.get_raw_cards()))
+            for i in random.sample(put_indices.tolist(), num_series)]
+
+
+def _setup_action_service_construction(seed: int) -> Callable[[], None]:
+    def construct():
+        # Bypass the singleton, keeping the shared instance in place for the rest of the code
+        service = Singleton._instances.pop(ActionService, None)
+        try:
+            ActionService()
+        finally:
+            Singleton._instances[ActionService] = service
+    ActionService()
+    return construct
+
+
+def _setup_valid_actions_mask(seed: int, phase: GamePhase) -> Callable[[], None]:
+    game = _mid_game(seed)
+    game.board.set_phase(phase)
+    player = game.current_player
+
+    def compute():
+        ActionService().get_valid_actions_mask(player, game.board)
+    return compute
+
+
+def _setup_valid_actions_masks(seed: int) -> Callable[[], int]:
+    """The masks of many games at once, as a reference for the tracked masks of the vec_canasta_env_step scenario."""
+    games = [_mid_game(seed + i) for i in range(NUM_BATCH_GAMES)]
+    pairs = [(game.current_player, game.board) for game in games]
+
+    def compute():
+        ActionService().get_valid_actions_masks(pairs)
+        return len(pairs)
+    return compute
+
+
+def _setup_vec_canasta_env_step(seed: int) -> Callable[[], int]:
+    """Step many games with random valid actions, including their observations and tracked valid actions masks."""
+    env = VecCanastaEnv(NUM_BATCH_GAMES, seed=seed)
+    env.reset(copy=False)
+    rng = np.random.default_rng(seed)
+
+    def step():
+        masks = env.get_current_actions_masks()
+        env.step(np.array([rng.choice(np.flatnonzero(mask)) for mask in masks]), copy=False)
+        return env.num_envs
+    return step
+
+
+def _setup_card_series_is_valid(seed: int) -> Callable[[], int]:
+    series = _put_series(NUM_SERIES)
+
+    def check():
+        for s in series:
+            s.is_valid()
+        return len(series)
+    return check
+
+
+def _setup_card_series_is_two_joker(seed: int) -> Callable[[], int]:
+    series = [s for s in _put_series(NUM_SERIES) if any(card.is_two() for card in s)]
+
+    def check():
+        num_checks = 0
+        for s in series:
+            for i in range(len(s)):
+                s.is_two_joker(i)
+            num_checks += len(s)
+        return num_checks
+    return check
+
+
+def _setup_game_state_numeral_representation(seed: int) -> Callable[[], None]:
+    game = _mid_game(seed)
+    state = game.get_state()
+    player = game.current_player
+
+    def represent():
+        state.create_numeral_representation(player)
+    return represent
+
+
+def _setup_game_history_add(seed: int) -> Callable[[], None]:
+    """Record the steps of a game, copying it only at the checkpoints."""
+    game = _mid_game(seed)
+    action = ActionService().get_valid_actions(game.current_player, game.board)[0]
+    history = GameHistory()
+
+    def add():
+        if len(history) == 1000:
+            history.clear()
+        history.add(game, action if len(history) > 0 else None)
+    return add
+
+
+def _setup_game_clone(seed: int) -> Callable[[], None]:
+    game = _mid_game(seed)
+
+    def clone():
+        game.clone()
+    return clone
+
+
+def _setup_game_deepcopy(seed: int) -> Callable[[], None]:
+    """The generic copy of a game, as a reference for the game_clone scenario."""
+    game = _mid_game(seed)
+
+    def copy():
+        deepcopy(game)
+    return copy
+
+
+def _setup_random_game_steps(seed: int) -> Callable[[], Optional[int]]:
+    game = Game(keep_history=False, seed=seed)
+    game.initialize_game()
+
+    def step():
+        if game.is_finished() or game.is_stalled():
+            game.reset_game()
+        game.play_single_step()
+    return step
@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from base.action_service import ActionService
+from base.cards.card_series import CardSeries
+from base.game import Game
+
+#: The fields of the result of each game
+FIELDS = ['seed', 'num_steps', 'finished', 'stalled', 'red_score', 'blue_score', 'red_dirty_canastas', 'red_pure_canastas',
+          'blue_dirty_canastas', 'blue_pure_canastas']
+
+
+def play_game(seed: int, max_steps: int) -> Dict[str, int]:
+    """
+    Play a full AI-vs-AI game with the given seed and return its result.
+
+    A game in which the current player has no valid action left is stopped and marked as stalled (see
+    :meth:`Game.is_stalled`), like a game reaching the maximum number of steps it is not finished.
+    """
+    random.seed(seed)  # The AI players choose their actions with the random module
+    game = Game(keep_history=False, seed=seed)
+    game.initialize_game()
+    num_steps = game.play(max_steps=max_steps)
+    result = {'seed': seed, 'num_steps': num_steps, 'finished': int(game.is_finished()),
+              'stalled': int(game.is_stalled()),
+              'red_score': game.get_red_team_score(), 'blue_score': game.get_blue_team_score()}
+    for color, team_series in [('red', game.board.red_team_series), ('blue', game.board.blue_team_series)]:
+        result[color + '_dirty_canastas'] = _count(team_series, CardSeries.is_dirty)
+        result[color + '_pure_canastas'] = _count(team_series, CardSeries.is_pure)
+    return result
+
+
+def play_games(seeds: List[int], max_steps: int) -> List[Dict[str, int]]:
+    return [play_game(seed, max_steps) for seed in seeds]
+
+
+def simulate(num_games: int, seed: int = 0, max_steps: int = 2000, num_workers: Optional[int] = None,
+             chunk_size: int = 10) -> Iterator[Dict[str, int]]:
+    """
+    Play the given number of games across worker processes and yield their results, in order.
+
+    Game i is played with seed ``seed + i``, so the results do not depend on the number of workers.
+    """
+    seeds = list(range(seed, seed + num_games))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, num_games, chunk_size)]
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_initialize_worker) as executor:
+        for results in executor.map(play_games, chunks, [max_steps] * len(chunks)):
+            yield from results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Play AI-vs-AI games in parallel and store the result of each game.")
+    parser.add_argument('num_games', type=int, help="number of games to play")
+    parser.add_argument('--output', help="write the results to this .jsonl (streamed) or .npz file")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game, the next games use the next seeds")
+    parser.add_argument('--max-steps', type=int, default=2000, help="maximum number of steps played in each game")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument('--chunk-size', type=int, default=10, help="number of games sent to a worker at once")
+    args = parser.parse_args()
+    if args.output and os.path.splitext(args.output)[1] not in ['.jsonl', '.npz']:
+        parser.error("the output file must be a .jsonl or .npz file")
+
+    start = time.perf_counter()
+    # The results are only kept in memory to write them to a .npz file at the end, a .jsonl file is streamed
+    results = [] if args.output and args.output.endswith('.npz') else None
+    num_steps = 0
+    num_stalled = 0
+    with open(args.output, 'w') if args.output and args.output.endswith('.jsonl') else nullcontext() as f:
+        for result in simulate(args.num_games, args.seed, args.max_steps, args.workers, args.chunk_size):
+            if f is not None:
+                f.write(json.dumps(result) + "\n")
+            elif results is not None:
+                results.append(result)
+            num_steps += result['num_steps']
+            num_stalled += result['stalled']
+    duration = time.perf_counter() - start
+    if results is not None:
+        np.savez(args.output, **{field: np.array([result[field] for result in results]) for field in FIELDS})
+    print("Played {} games ({} steps, {} stalled) in {:.1f}s: {:.2f} games/sec, {:.0f} steps/sec"
+          .format(args.num_games, num_steps, num_stalled, duration, args.num_games / duration,
+                  num_steps / duration))
+    return 0
+
+
+def _initialize_worker() -> None:
+    # Load the action catalog when the worker starts, rather than during its first game
+    ActionService()
+
+
+def _count(team_series: List[CardSeries], predicate) -> int:
+    return sum(1 for series in team_series if predicate(series))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
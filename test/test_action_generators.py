@@ -1,8 +1,10 @@
-from collections import defaultdict
+from collections import defaultdict, Counter
 from unittest import TestCase
 
+from base.cards.double_deck import DoubleDeck
+from base.cards.hand import Hand
 from base.utils.card_constants import POSSIBLE_SUIT
-from base.utils.generators import ranks_list_generator, suit_series_generator, series_generator
+from base.utils.generators import ranks_list_generator, suit_series_generator, series_generator, hand_series_generator
 
 
 class TestGamePhase(TestCase):
@@ -28,3 +30,16 @@ class TestGamePhase(TestCase):
         max_length = 14
         # This generator is simply the suit_series_generator looped over all series and thus should produce 4 times the resuts
         self.assertEqual(4*2655, len(list(series_generator(min_length=min_length, max_length=max_length))))
+
+    def test_hand_series_generator(self):
+        all_series = [tuple(card.get_index() for card in series) for series in series_generator(min_length=3, max_length=14)]
+        for seed, num_cards in enumerate([0, 3, 11, 25, 50, 108]):
+            deck = DoubleDeck(with_jokers=True, seed=seed)
+            deck.shuffle()
+            hand_counts = Hand(deck.deal_n(num_cards)).get_counts().tolist()
+            # The hand generator should produce exactly those series for which the hand holds all cards
+            expected_series = {series for series in all_series
+                               if all(hand_counts[i] >= count for i, count in Counter(series).items())}
+            generated_series = list(hand_series_generator(hand_counts, min_length=3, max_length=14))
+            self.assertEqual(len(generated_series), len(set(generated_series)))
+            self.assertEqual(expected_series, set(generated_series), msg="failed for {} cards".format(num_cards))
@@ -0,0 +1,74 @@
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from base.action_catalog import ActionCatalog
+from base.action_service import ActionService
+from base.actions.put_action import PutAction
+from base.cards.card_series import CardSeries
+from base.cards.double_deck import DoubleDeck
+from base.cards.hand import Hand
+from base.enums.game_phase import GamePhase
+from base.game import Game
+
+
+class TestActionMaskEngine(TestCase):
+
+    def setUp(self) -> None:
+        catalog = ActionService()._catalog
+        put_indices = np.flatnonzero((catalog.type_codes == ActionCatalog.ACTION_TYPES.index(PutAction)) & catalog.possible)
+        self.possible_put_series = [catalog.create_action(i).series for i in put_indices]
+
+    def _random_series(self) -> CardSeries:
+        return CardSeries(list(random.choice(self.possible_put_series).get_raw_cards()))
+
+    def test_mask_matches_validate_for_random_states(self):
+        for seed in range(20):
+            random.seed(seed)
+            game = Game(keep_history=False, seed=seed)
+            game.initialize_game()
+            for _ in range(random.randint(0, 40)):
+                if game.is_finished():
+                    break
+                game.play_single_step()
+            player = game.current_player
+            # Randomize the hand (including small hands, which might be cleared), the board series and the phase
+            deck = DoubleDeck()
+            deck.shuffle()
+            cards = deck.deal_n(random.randint(0, 8))
+            for _ in range(random.randint(0, 1)):
+                cards.extend(self._random_series().get_raw_cards())
+            player.hand = Hand(cards)
+            for _ in range(random.randint(0, 3)):
+                game.board.add_series(player.team, self._random_series())
+            phases = 3 * [GamePhase.ACTION_PHASE, GamePhase.PLAY_JOKER_PHASE] + list(GamePhase) + [None]
+            game.board.set_phase(random.choice(phases))
+
+            mask = ActionService().get_valid_actions_mask(player, game.board)
+            expected = [ActionService().idx_to_action(i).validate(player=player, board=game.board)
+                        for i in range(ActionService().num_actions)]
+            self.assertIsInstance(mask, np.ndarray)
+            differences = np.flatnonzero(mask != np.array(expected))
+            self.assertEqual(0, len(differences),
+                             msg="failed for seed {}: {}".format(seed, [ActionService().idx_to_action(i)
+                                                                       for i in differences[:5]]))
+
+    def test_batch_masks_match_single_masks(self):
+        random.seed(0)
+        pairs = []
+        for seed in range(12):
+            game = Game(keep_history=False, seed=seed)
+            game.initialize_game()
+            for _ in range(random.randint(0, 80)):
+                if game.is_finished():
+                    break
+                game.play_single_step()
+            pairs.append((game.current_player, game.board))
+        pairs[-1][1].set_phase(None)
+
+        masks = ActionService().get_valid_actions_masks(pairs)
+        self.assertEqual((len(pairs), ActionService().num_actions), masks.shape)
+        for i, (player, board) in enumerate(pairs):
+            np.testing.assert_array_equal(ActionService().get_valid_actions_mask(player, board), masks[i])
+        self.assertEqual((0, ActionService().num_actions), ActionService().get_valid_actions_masks([]).shape)
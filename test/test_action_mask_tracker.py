@@ -0,0 +1,51 @@
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from ai.controlled_game import ControlledGame
+from base.action_mask_tracker import ActionMaskTracker
+from base.action_service import ActionService
+from base.enums.game_phase import GamePhase
+from base.game import Game
+
+
+class TestActionMaskTracker(TestCase):
+
+    def test_tracked_mask_matches_full_recomputation(self):
+        random.seed(0)
+        np.random.seed(0)
+        for seed in range(3):
+            # In debug mode, the tracker raises as soon as its mask differs from the full recomputation
+            game = ControlledGame(debug_actions_mask=True, seed=seed)
+            game.initialize_game()
+            for _ in range(300):
+                if game.is_finished():
+                    break
+                mask = game.get_current_actions_mask()
+                if not mask.any():
+                    # A dead end of the rules, where the player has no valid action left
+                    break
+                game.play_action(ActionService().idx_to_action(np.random.choice(np.flatnonzero(mask))))
+                if game.board.phase == GamePhase.END_TURN_PHASE:
+                    game.switch_player_turns()
+
+    def test_tracked_mask_after_undo(self):
+        random.seed(1)
+        game = Game(keep_history=False, seed=1)
+        game.initialize_game()
+        tracker = ActionMaskTracker(debug=True)
+        for _ in range(200):
+            if game.is_finished() or game.is_stalled():
+                break
+            player = game.current_player
+            # Execute and undo some actions, the tracker only seeing the state after each execution: a series put on
+            # the board and removed again may be replaced by another one, which must not keep stale series actions
+            actions = ActionService().get_valid_actions(player, game.board)
+            for action in random.sample(actions, min(len(actions), 4)):
+                result = action.execute(player, game.board)
+                tracker.get_valid_actions_mask(player, game.board)
+                action.undo(player, game.board, result)
+                del result
+            tracker.get_valid_actions_mask(player, game.board)
+            game.play_single_step()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from base.action_catalog import ActionCatalog
+from base.action_service import ActionService
+from base.card import Card
+from base.enums.game_phase import GamePhase
+from base.game import Game
+from base.utils.card_constants import JOKER_RANK, JOKER_SUIT
+
+
+class TestActionService(TestCase):
+
+    def setUp(self) -> None:
+        self.game = Game(keep_history=False)
+        self.game.initialize_game()
+        self.player = self.game.current_player
+        self.player.hand.add(Card(JOKER_RANK, JOKER_SUIT))
+
+    def _full_mask(self):
+        return [ActionService().idx_to_action(i).validate(player=self.player, board=self.game.board)
+                for i in range(ActionService().num_actions)]
+
+    def test_mask_matches_full_validation(self):
+        for phase in list(GamePhase) + [None]:
+            self.game.board.set_phase(phase)
+            mask = ActionService().get_valid_actions_mask(self.player, self.game.board)
+            self.assertEqual(self._full_mask(), list(mask), msg="failed for {}".format(phase))
+
+    def test_mask_matches_full_validation_during_game(self):
+        for _ in range(25):
+            if self.game.is_finished():
+                break
+            self.player = self.game.current_player
+            mask = ActionService().get_valid_actions_mask(self.player, self.game.board)
+            self.assertEqual(self._full_mask(), list(mask), msg="failed for {}".format(self.game.board))
+            self.game.play_single_step()
+
+    def test_valid_actions_match_mask(self):
+        self.game.board.set_phase(GamePhase.ACTION_PHASE)
+        mask = ActionService().get_valid_actions_mask(self.player, self.game.board)
+        valid_actions = ActionService().get_valid_actions(self.player, self.game.board)
+        self.assertEqual(sum(mask), len(valid_actions))
+        for action in valid_actions:
+            self.assertTrue(mask[ActionService().action_to_idx(action)])
+
+    def test_catalog_round_trip(self):
+        actions = ActionService()._generate_all_actions()
+        catalog = ActionCatalog.from_actions(actions)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "catalog.npz")
+            catalog.save(path, "key")
+            self.assertIsNone(ActionCatalog.load(path, "other key"))
+            loaded = ActionCatalog.load(path, "key")
+        self.assertEqual(len(actions), len(loaded))
+        for i, action in enumerate(actions):
+            self.assertEqual(action, loaded.create_action(i))
@@ -0,0 +1,63 @@
+import random
+from unittest import TestCase
+
+from base.action_service import ActionService
+from base.enums.game_phase import GamePhase
+from base.game import Game
+
+NUM_GAMES = 4
+NUM_ACTIONS_PER_STEP = 8  # Number of valid actions executed and undone at each step
+
+
+class TestActionUndo(TestCase):
+
+    @staticmethod
+    def _snapshot(game: Game):
+        """Return all the state of the given game that actions can alter."""
+        board = game.board
+        series = [[list(s) for s in team_series] for team_series in [board.red_team_series, board.blue_team_series]]
+        return (board.phase,
+                [player.hand.get_counts().tolist() for player in game.players],
+                [(player.has_grabbed_pile(), player.team.has_grabbed_pile()) for player in game.players],
+                board.deck.get_cards(), board.deck.get_in_play_cards(), board.deck.num_cards(), board.deck.check_deck(),
+                [list(pile) if pile is not None else None for pile in [board.left_pile, board.right_pile]],
+                list(board.stack), series,
+                [sorted(board.get_series_action_indices(team)) for team in game.teams],
+                board.auditor.get_counts().tolist(), game.get_hash(),
+                (game.get_red_team_score(), game.get_blue_team_score()),
+                [board.team_has_pure(team) for team in game.teams])
+
+    def test_execute_undo(self):
+        random.seed(0)
+        executed_types = set()
+        for i in range(NUM_GAMES):
+            game = Game(keep_history=False, seed=i, audit_cards=True)
+            game.initialize_game()
+            while not game.is_finished():
+                player = game.current_player
+                snapshot = self._snapshot(game)
+                actions = ActionService().get_valid_actions(player, game.board)
+                for action in random.sample(actions, min(len(actions), NUM_ACTIONS_PER_STEP)):
+                    result = action.execute(player, game.board)
+                    action.undo(player, game.board, result)
+                    self.assertEqual(snapshot, self._snapshot(game), "Undo of {}".format(action))
+                    executed_types.add(type(action).__name__)
+                game.board.auditor.verify(game.board, game.players)
+                game.play_single_step()
+        self.assertEqual({'PutAction', 'AddFrontAction', 'AddBackAction', 'SwapJokerAction', 'SwapTwoAction',
+                          'DiscardCardAction', 'TakeCardAction', 'TakeStackAction', 'TakePileAction'}, executed_types)
+
+    def test_undo_sequence(self):
+        random.seed(1)
+        game = Game(keep_history=False, seed=1, audit_cards=True)
+        game.initialize_game()
+        snapshot = self._snapshot(game)
+        executed = []
+        # Play (at most) a full turn, then undo all actions in reverse order
+        while not game.is_finished() and game.board.phase != GamePhase.END_TURN_PHASE:
+            player = game.current_player
+            action = random.choice(ActionService().get_valid_actions(player, game.board))
+            executed.append((action, action.execute(player, game.board)))
+        for action, result in reversed(executed):
+            action.undo(game.current_player, game.board, result)
+        self.assertEqual(snapshot, self._snapshot(game))
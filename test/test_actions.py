@@ -285,3 +285,28 @@ class TestGamePhase(TestCase):
     def test_initial_phase(self):
         validated_actions = ActionService().get_valid_actions(self.game.current_player, self.game.board)
         self.assertEqual(2, len(validated_actions))  # initial possible actions are TakeCardAction and TakeStackAction
+
+    def test_shared_action_result(self):
+        # Put a series on the board for the first player
+        target_player = self.game.players[0]
+        self.game.board.set_phase(GamePhase.ACTION_PHASE)
+        target_player.hand.clear()
+        target_player.hand.add([Card(1, HEARTS), Card(10, HEARTS), Card(11, HEARTS), Card(12, HEARTS)])
+        put_action = PutAction([Card(10, HEARTS), Card(11, HEARTS), Card(12, HEARTS)])
+        put_result = put_action.execute(target_player, self.game.board)
+        self.assertIs(put_action, put_result.action)
+        self.assertEqual(put_action.get_reward(), put_result.reward)
+        # Execute the shared add front action from the action service
+        target_card = Card(9, HEARTS)
+        target_player.hand.add(target_card)
+        target_series = self.game.board.get_series_for_player(target_player)[0]
+        add_front_action = AddFrontAction(card=target_card, series=target_series)
+        shared_action = ActionService().idx_to_action(ActionService().action_to_idx(add_front_action))
+        validated_actions = ActionService().get_valid_actions(target_player, self.game.board)
+        self.assertTrue(any(action is shared_action for action in validated_actions))
+        pre_execution_value = target_series.get_total_value()
+        add_front_result = shared_action.execute(target_player, self.game.board)
+        # The reward is the increase in series value, and the shared action itself is left untouched
+        self.assertEqual(target_series.get_total_value() - pre_execution_value, add_front_result.reward)
+        self.assertEqual(3, len(shared_action.series))
+        self.assertEqual(4, len(target_series))
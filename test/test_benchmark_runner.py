@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from benchmark.benchmark_runner import BenchmarkRunner
+from benchmark.benchmark_scenario import BenchmarkScenario
+
+
+class TestBenchmarkRunner(TestCase):
+
+    def test_run(self):
+        scenario = BenchmarkScenario("sum", lambda seed: lambda: sum(range(100)) and 10)
+        result = BenchmarkRunner(min_time=0.01, repeat=2).run(scenario)
+        self.assertGreater(result['ops_per_sec'], 0)
+        self.assertGreaterEqual(result['peak_memory'], 0)
+
+    def test_compare(self):
+        baseline = {'a': {'ops_per_sec': 100.0, 'peak_memory': 1000},
+                    'b': {'ops_per_sec': 100.0, 'peak_memory': 1000}}
+        results = {'a': {'ops_per_sec': 95.0, 'peak_memory': 1100},
+                   'b': {'ops_per_sec': 80.0, 'peak_memory': 2000},
+                   'c': {'ops_per_sec': 1.0, 'peak_memory': 10 ** 9}}
+        regressions = BenchmarkRunner.compare(results, baseline, max_slowdown=0.1, max_memory_increase=0.25)
+        self.assertEqual(2, len(regressions))
+        self.assertTrue(all(regression.startswith("b:") for regression in regressions))
@@ -0,0 +1,32 @@
+import pickle
+from copy import deepcopy
+from unittest import TestCase
+
+from base.card import Card
+from base.utils.card_constants import HEARTS, SPADES, DIAMONDS, CLUBS, JOKER_RANK, JOKER_SUIT, NUM_CARD_TYPES
+
+
+class TestCard(TestCase):
+
+    def test_interned(self):
+        card = Card(5, HEARTS)
+        self.assertIs(card, Card(5, "Hearts"))
+        self.assertIs(card, deepcopy(card))
+        self.assertIs(card, pickle.loads(pickle.dumps(card)))
+        self.assertEqual(hash(card), card.get_index())
+
+    def test_from_index(self):
+        for i in range(1, NUM_CARD_TYPES):
+            self.assertEqual(i, Card.from_index(i).get_index())
+        self.assertTrue(Card.from_index(NUM_CARD_TYPES - 1).is_joker())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Card, 14, HEARTS)
+        self.assertRaises(ValueError, Card, 1, JOKER_SUIT)
+        self.assertRaises(ValueError, Card, 1, "stars")
+
+    def test_sort(self):
+        cards = [Card(3, CLUBS), Card(2, DIAMONDS), Card(13, SPADES), Card(JOKER_RANK, JOKER_SUIT), Card(1, HEARTS),
+                 Card(12, SPADES)]
+        self.assertEqual([Card(JOKER_RANK, JOKER_SUIT), Card(1, HEARTS), Card(12, SPADES), Card(13, SPADES),
+                          Card(2, DIAMONDS), Card(3, CLUBS)], sorted(cards))
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from base.card import Card
+from base.card_auditor import CardAuditor
+from base.game import Game
+from base.utils.card_constants import JOKER_RANK, JOKER_SUIT
+
+
+class TestCardAuditor(TestCase):
+
+    def test_audited_games(self):
+        game = Game(keep_history=False, seed=5, audit_cards=True)
+        game.initialize_game()
+        for _ in range(3):
+            num_steps = 0
+            while not game.is_finished() and num_steps < 1000:
+                game.play_single_step()
+                game.board.auditor.verify(game.board, game.players)
+                num_steps += 1
+            game.reset_game()
+
+    def test_violations(self):
+        game = Game(keep_history=False, seed=6, audit_cards=True)
+        game.initialize_game()
+        auditor = game.board.auditor
+        player = game.current_player
+        self.assertEqual(len(player.hand), auditor.get_counts()[CardAuditor.hand(player)].sum())
+
+        # Moving a card out of a location which does not hold it
+        absent = next(Card.from_index(i) for i in range(1, 54) if Card.from_index(i) not in player.hand)
+        self.assertRaises(Exception, auditor.move, absent, CardAuditor.hand(player), CardAuditor.STACK)
+
+        # A card that silently disappears
+        player.hand.pop(next(iter(player.hand)))
+        self.assertRaises(Exception, auditor.check, game.board, game.players)
+        self.assertRaises(Exception, auditor.verify, game.board, game.players)
+
+        # A card that is duplicated
+        game.reset_game()
+        game.current_player.hand.add(Card(JOKER_RANK, JOKER_SUIT))
+        self.assertRaises(Exception, game.board.auditor.check, game.board, game.players)
+        self.assertRaises(Exception, CardAuditor, game.board, game.players)
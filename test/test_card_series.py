@@ -2,8 +2,11 @@ from unittest import TestCase
 
 from base.card import Card, JOKER_RANK, JOKER_SUIT, POSSIBLE_SUIT
 from base.cards.card_series import CardSeries
+from base.cards.series_code import SeriesCode
+from base.constants import Constants
 from base.enums.two_swap_direction import TwoSwapDirection
 from base.utils.card_constants import HEARTS, DIAMONDS
+from base.utils.generators import series_generator
 
 
 class TestCardSeries(TestCase):
@@ -235,3 +238,47 @@ class TestCardSeries(TestCase):
                                correct_options=[])
             check_swap_options(card_series=CardSeries([Card(4, suit), Card(5, suit), Card(JOKER_RANK, JOKER_SUIT)]),
                                correct_options=[])
+
+    def test_series_code(self):
+        for generated in series_generator(min_length=1):
+            cards = generated.get_raw_cards()
+            variants = [cards]
+            if len(cards) >= 3:
+                variants += [[card] + cards for card in generated.get_add_front_options()] \
+                    + [cards + [card] for card in generated.get_add_back_options()]
+            for variant in variants:
+                series = CardSeries(list(variant))
+                self.assertEqual(series._check_valid(), series.is_valid(), msg=str(series))
+                self.assertEqual(any(card.is_joker() for card in variant), series.has_joker(), msg=str(series))
+                for i in range(len(series)):
+                    self.assertEqual(series._is_two_joker(i), series.is_two_joker(i), msg="{} {}".format(series, i))
+                    self.assertEqual(series.is_two_joker(i), series.is_two_joker(i - len(series)))
+                code = series.get_code()
+                if code is not None:
+                    self.assertEqual(variant, SeriesCode.decode(code))
+                    self.assertEqual(len(variant), SeriesCode.get_length(code))
+                    self.assertEqual(series, CardSeries(SeriesCode.decode(code)))
+                    self.assertEqual(hash(series), hash(CardSeries(SeriesCode.decode(code))))
+                elif len(variant) >= 3:
+                    self.assertFalse(series.is_valid(), msg="valid series without code: {}".format(series))
+
+    def test_is_two_joker_negative_index(self):
+        series = CardSeries([Card(3, HEARTS), Card(4, HEARTS), Card(5, HEARTS), Card(2, HEARTS)])
+        self.assertTrue(series.is_two_joker(-1))
+        self.assertEqual([Card(7, HEARTS)], series.get_add_back_options())
+
+    def test_cached_properties(self):
+        series = CardSeries([Card(rank, HEARTS) for rank in range(3, 9)])
+        self.assertFalse(series.is_pure())
+        self.assertEqual(0, series.get_canasta_score())
+        value = series.get_total_value()
+        version = series.get_version()
+        series.add_back(Card(9, HEARTS))
+        self.assertGreater(series.get_version(), version)
+        self.assertTrue(series.is_pure())
+        self.assertEqual(Constants.PURE_SCORE, series.get_canasta_score())
+        self.assertEqual(value + Card(9, HEARTS).get_score() + Constants.PURE_SCORE, series.get_total_value())
+        series.add_front(Card(JOKER_RANK, JOKER_SUIT))
+        self.assertTrue(series.is_dirty())
+        self.assertFalse(series.is_pure())
+        self.assertEqual(Constants.DIRTY_SCORE, series.get_canasta_score())
@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from base.card import Card
+from base.cards.deck import Deck
+from base.cards.double_deck import DoubleDeck
+from base.game import Game
+from base.utils.card_constants import HEARTS, JOKER_RANK, JOKER_SUIT
+
+
+class TestDeck(TestCase):
+
+    def test_new_deck(self):
+        self.assertEqual(54, Deck().num_cards())
+        self.assertEqual(52, Deck(with_jokers=False).num_cards())
+        deck = DoubleDeck()
+        self.assertEqual(108, deck.num_cards())
+        self.assertEqual(4, deck.get_cards().count(Card(JOKER_RANK, JOKER_SUIT)))
+        self.assertEqual(2, deck.get_cards().count(Card(1, HEARTS)))
+        self.assertTrue(deck.check_deck())
+
+    def test_deal(self):
+        deck = DoubleDeck(seed=1)
+        deck.shuffle()
+        cards = deck.get_cards()
+        self.assertEqual(cards[-1], deck.deal())
+        self.assertEqual(cards[-12:-1][::-1], deck.deal_n(11))
+        self.assertEqual(cards[-12:][::-1], deck.get_in_play_cards())
+        self.assertEqual(96, deck.num_cards())
+        self.assertTrue(deck.check_deck())
+        self.assertEqual(cards[:-12], deck.get_cards())
+        self.assertRaises(IndexError, deck.deal_n, 97)
+        deck.deal_n(96)
+        self.assertTrue(deck.is_empty())
+        self.assertRaises(IndexError, deck.deal)
+
+    def test_add_cards(self):
+        deck = DoubleDeck(seed=2)
+        deck.shuffle()
+        dealt = deck.deal_n(108)
+        deck.add_cards(dealt[:30])
+        self.assertEqual(30, deck.num_cards())
+        self.assertEqual(dealt[29], deck.deal())
+        deck.add_cards(dealt[30:])
+        self.assertEqual(107, deck.num_cards())
+        self.assertEqual(dealt[-1], deck.deal())
+        self.assertEqual(108 + 108, deck.num_cards() + len(deck.get_in_play_cards()))
+        self.assertTrue(deck.check_deck())
+
+    def test_seed(self):
+        decks = [DoubleDeck(seed=3) for _ in range(2)]
+        for deck in decks:
+            deck.shuffle()
+        self.assertEqual(decks[0].get_cards(), decks[1].get_cards())
+        self.assertNotEqual(decks[0].get_cards(), DoubleDeck().get_cards())
+
+        games = [Game(keep_history=False, seed=4) for _ in range(2)]
+        for game in games:
+            game.initialize_game()
+            game.reset_game()
+        self.assertEqual(games[0].board.deck.get_cards(), games[1].board.deck.get_cards())
+        self.assertEqual([list(p.hand) for p in games[0].players], [list(p.hand) for p in games[1].players])
@@ -1,5 +1,7 @@
+import random
 from unittest import TestCase
 
+from base.cards.card_series import CardSeries
 from base.game import Game
 
 
@@ -26,3 +28,61 @@ class TestGame(TestCase):
         # CHECK BOARD DECK
         self.assertTrue(game.board.deck.num_cards() >= 0)
         self.assertFalse(game.board.deck.is_empty())
+
+    def test_clone(self):
+        random.seed(0)
+        game = Game(keep_history=False, seed=0, audit_cards=True)
+        game.initialize_game()
+        for _ in range(120):
+            game.play_single_step()
+        representations = [game.get_state().create_numeral_representation(player) for player in game.players]
+
+        clone = game.clone()
+        self.assertEqual(representations,
+                         [clone.get_state().create_numeral_representation(player) for player in clone.players])
+        self.assertEqual(game.board.deck.get_cards(), clone.board.deck.get_cards())
+        for player, player_clone in zip(game.players, clone.players):
+            self.assertIsNot(player.hand, player_clone.hand)
+            self.assertIn(player_clone, player_clone.team.players)
+            self.assertIs(clone.teams[game.teams.index(player.team)], player_clone.team)
+        for series, series_clone in zip(game.board.red_team_series, clone.board.red_team_series):
+            self.assertIsNot(series, series_clone)
+            self.assertTrue(clone.board.has_series(clone.red_team, series_clone))
+
+        # Playing the clone leaves the game untouched
+        for _ in range(60):
+            clone.play_single_step()
+            clone.board.auditor.verify(clone.board, clone.players)
+        self.assertEqual(representations,
+                         [game.get_state().create_numeral_representation(player) for player in game.players])
+        game.board.auditor.verify(game.board, game.players)
+
+    def test_stalled(self):
+        # In game 56, a player is left with an empty hand and no valid action
+        random.seed(56)
+        game = Game(keep_history=False, seed=56)
+        game.initialize_game()
+        self.assertFalse(game.is_stalled())
+        self.assertEqual(257, game.play())
+        self.assertTrue(game.is_stalled())
+        self.assertFalse(game.is_finished())
+        self.assertTrue(game.current_player.hand.is_empty())
+        self.assertEqual(0, game.play())
+
+    def test_scores(self):
+        random.seed(0)
+        game = Game(keep_history=False, seed=1)
+        game.initialize_game()
+        while not game.is_finished():
+            game.play_single_step()
+            for team, opponent_team in [(game.red_team, game.blue_team), (game.blue_team, game.red_team)]:
+                # Recompute the incrementally maintained values from scratch
+                team_series = game.board.get_series_for_team(team)
+                series_value = sum(CardSeries(list(series)).get_total_value() for series in team_series)
+                opponent_cards = sum(card.get_score() for player in opponent_team.players for card in player.hand)
+                pile_bonus = 100 if team.has_grabbed_pile() else 0
+                score = game.get_red_team_score if team is game.red_team else game.get_blue_team_score
+                self.assertEqual(series_value + pile_bonus, score(include_opponent_cards=False))
+                self.assertEqual(series_value + opponent_cards + pile_bonus, score())
+                self.assertEqual(any(CardSeries(list(series)).is_pure() for series in team_series),
+                                 game.board.team_has_pure(team))
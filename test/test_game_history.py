@@ -0,0 +1,75 @@
+import random
+from unittest import TestCase
+
+from base.action_service import ActionService
+from base.game import Game
+from base.game_history import GameHistory
+
+
+class TestGameHistory(TestCase):
+
+    @staticmethod
+    def _play(checkpoint_interval: int) -> Game:
+        random.seed(0)
+        game = Game(seed=0)
+        game.history = GameHistory(checkpoint_interval=checkpoint_interval)
+        game.initialize_game()
+        game.play()
+        return game
+
+    @staticmethod
+    def _snapshot(game: Game):
+        board = game.board
+        return (game.current_player_index, board.phase, [player.hand.get_counts().tolist() for player in game.players],
+                board.deck.get_cards(), list(board.stack),
+                [[list(series) for series in team_series]
+                 for team_series in [board.red_team_series, board.blue_team_series]],
+                [team.has_grabbed_pile() for team in game.teams])
+
+    def test_get_state_at(self):
+        # Copy the game at every step, as a reference
+        expected = self._play(checkpoint_interval=1).history
+        history = self._play(checkpoint_interval=10).history
+        self.assertEqual(len(expected), len(history))
+        self.assertEqual(len(expected), len(expected._checkpoints))
+        self.assertEqual((len(history) + 9) // 10, len(history._checkpoints))
+
+        random.seed(0)
+        for i in list(range(len(history))) + random.sample(range(len(history)), 40) + [-1]:
+            state, action = history.get(i)
+            self.assertEqual(self._snapshot(expected.get_state_at(i)), self._snapshot(state))
+            self.assertIs(expected.get_action_at(i), action)
+        self.assertIsNone(history.get_action_at(0))
+        self.assertIsNone(history.get(len(history)))
+        self.assertIsNone(history.get_state_at(-len(history) - 1))
+
+        # The states returned are copies
+        state = history.get_state_at(15)
+        snapshot = self._snapshot(state)
+        state.board.deck.deal()
+        self.assertEqual(snapshot, self._snapshot(history.get_state_at(15)))
+
+    def test_multiple_games(self):
+        random.seed(0)
+        game = Game(seed=0)
+        game.initialize_game()
+        game.play(max_steps=20)
+        game.reset_game(clear_history=False)
+        game.play(max_steps=5)
+        # The first state of each game is kept, as it cannot be reached by an action
+        self.assertEqual(27, len(game.history))
+        self.assertIsNone(game.history.get_action_at(21))
+        self.assertEqual(11, game.history.get_state_at(21).current_player.num_cards())
+        self.assertEqual(self._snapshot(game.history.get_state_at(-1))[2:], self._snapshot(game)[2:])
+
+    def test_altered_game(self):
+        random.seed(0)
+        game = Game(seed=0)
+        game.initialize_game()
+        game.play(max_steps=3)
+        # An action played without being recorded
+        action = ActionService().get_valid_actions(game.current_player, game.board)[0]
+        action.execute(game.current_player, game.board)
+        game.play(max_steps=2)
+        game.history.get_state_at(3)
+        self.assertRaises(Exception, game.history.get_state_at, 5)
@@ -0,0 +1,23 @@
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from base.game import Game
+from base.game_state import GameState
+
+
+class TestGameState(TestCase):
+
+    def test_numeral_representation(self):
+        random.seed(0)
+        game = Game(keep_history=False, seed=0)
+        game.initialize_game()
+        game.play(max_steps=40)
+        state = game.get_state()
+        for player in game.players:
+            representation = state.create_numeral_representation(player)
+            self.assertEqual(GameState.SIZE, len(representation))
+            out = np.zeros(GameState.SIZE, dtype=np.float32)
+            self.assertIs(out, state.create_numeral_array(player, out=out))
+            self.assertEqual(representation, out.astype(int).tolist())
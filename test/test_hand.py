@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from base.card import Card
+from base.cards.hand import Hand
+from base.utils.card_constants import HEARTS, SPADES, CLUBS, JOKER_RANK, JOKER_SUIT
+
+
+class TestHand(TestCase):
+
+    def test_add_pop(self):
+        hand = Hand([Card(5, HEARTS), Card(5, HEARTS)])
+        hand.add(Card(3, CLUBS))
+        hand.add([Card(JOKER_RANK, JOKER_SUIT)])
+        self.assertEqual(4, len(hand))
+        self.assertEqual(2, hand.count(Card(5, HEARTS)))
+        self.assertIn(Card(3, CLUBS), hand)
+        self.assertNotIn(Card(3, SPADES), hand)
+        self.assertNotIn(None, hand)
+
+        hand.pop(Card(5, HEARTS))
+        hand.pop(Card(3, SPADES))  # Not in the hand, ignored
+        self.assertEqual(3, hand.num_cards())
+        self.assertEqual([Card(JOKER_RANK, JOKER_SUIT), Card(5, HEARTS), Card(3, CLUBS)], list(hand))
+        hand.clear()
+        self.assertTrue(hand.is_empty())
+
+    def test_counts(self):
+        hand = Hand([Card(5, HEARTS), Card(5, HEARTS), Card(JOKER_RANK, JOKER_SUIT)])
+        counts = hand.get_counts()
+        self.assertEqual(2, counts[Card(5, HEARTS).get_index()])
+        self.assertEqual(1, counts[Card(JOKER_RANK, JOKER_SUIT).get_index()])
+        self.assertEqual(3, counts.sum())
+        hand.pop(Card(5, HEARTS))
+        self.assertEqual(2, counts[Card(5, HEARTS).get_index()])  # A copy, not affected by the hand changing
+
+    def test_equality(self):
+        self.assertEqual(Hand([Card(5, HEARTS), Card(3, CLUBS)]), Hand([Card(3, CLUBS), Card(5, HEARTS)]))
+        self.assertNotEqual(Hand([Card(5, HEARTS)]), Hand([Card(5, HEARTS), Card(5, HEARTS)]))
+
+    def test_known_cards(self):
+        hand = Hand([Card(5, HEARTS), Card(3, CLUBS)])
+        hand.add([Card(5, HEARTS), Card(JOKER_RANK, JOKER_SUIT)], known=True)
+        self.assertEqual([Card(JOKER_RANK, JOKER_SUIT), Card(5, HEARTS)], hand.get_known_cards())
+        # Either copy may have been played, one of them is still known to be in the hand
+        hand.pop(Card(5, HEARTS))
+        self.assertEqual([Card(JOKER_RANK, JOKER_SUIT), Card(5, HEARTS)], hand.get_known_cards())
+        hand.pop(Card(5, HEARTS))
+        self.assertEqual([Card(JOKER_RANK, JOKER_SUIT)], hand.get_known_cards())
+
+        clone = hand.clone()
+        hand.forget([Card(JOKER_RANK, JOKER_SUIT)])
+        self.assertEqual([], hand.get_known_cards())
+        self.assertEqual([Card(JOKER_RANK, JOKER_SUIT)], clone.get_known_cards())
+        clone.clear()
+        self.assertEqual([], clone.get_known_cards())
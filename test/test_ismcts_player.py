@@ -0,0 +1,86 @@
+import random
+import time
+from unittest import TestCase
+
+from ai.ismcts import ISMCTS
+from ai.ismcts_player import ISMCTSPlayer
+from base.action_service import ActionService
+from base.card_auditor import CardAuditor
+from base.game import Game
+
+
+class TestISMCTSPlayer(TestCase):
+
+    @staticmethod
+    def _create_game(num_steps: int = 40) -> Game:
+        random.seed(0)
+        game = Game(keep_history=False, seed=0, audit_cards=True)
+        game.initialize_game()
+        game.play(max_steps=num_steps)
+        return game
+
+    def test_determinize(self):
+        game = self._create_game()
+        determinization = game.clone()
+        ISMCTS(max_iterations=1, seed=0)._determinize(determinization)
+
+        counts = CardAuditor.count(game.board, game.players)
+        determinized_counts = CardAuditor.count(determinization.board, determinization.players)
+        # The same cards are in the game, with the same number of cards in each location
+        self.assertEqual(counts.sum(axis=0).tolist(), determinized_counts.sum(axis=0).tolist())
+        self.assertEqual(counts.sum(axis=1).tolist(), determinized_counts.sum(axis=1).tolist())
+        # Only the cards the current player cannot see have moved
+        hand = CardAuditor.hand(game.current_player)
+        self.assertEqual(counts[hand].tolist(), determinized_counts[hand].tolist())
+        self.assertEqual(counts[CardAuditor.NUM_LOCATIONS - 2:].tolist(),
+                         determinized_counts[CardAuditor.NUM_LOCATIONS - 2:].tolist())
+        # The stack and the cards known to be in the other hands are public, so they stay in place
+        self.assertEqual(list(game.board.stack), list(determinization.board.stack))
+        known_cards = [player.hand.get_known_cards() for player in game.players]
+        self.assertTrue(any(known_cards))
+        for known, player in zip(known_cards, determinization.players):
+            self.assertEqual(known, player.hand.get_known_cards())
+            self.assertTrue(all(player.hand.count(card) >= known.count(card) for card in known))
+        self.assertNotEqual(counts.tolist(), determinized_counts.tolist())
+
+    def test_search(self):
+        game = self._create_game()
+        visits = ISMCTS(max_iterations=60, seed=0).search(game.get_state())
+        self.assertEqual(60, sum(visits.values()))
+        valid_indices = ActionService().get_valid_action_indices(game.current_player, game.board).tolist()
+        self.assertTrue(set(visits).issubset(valid_indices))
+        self.assertEqual(visits, ISMCTS(max_iterations=60, seed=0).search(game.get_state()))
+        # The game searched is left untouched
+        game.board.auditor.verify(game.board, game.players)
+
+        start = time.perf_counter()
+        ISMCTS(max_time=0.2, seed=0).search(game.get_state())
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertRaises(Exception, ISMCTS)
+
+    def test_choose_action(self):
+        game = self._create_game()
+        player = ISMCTSPlayer(game.current_player_index, max_iterations=0, max_time=None, seed=0)
+        game.set_player(player)
+        # Without any iteration, a random valid action is chosen
+        action = player._choose_action(game.get_state())
+        self.assertTrue(action.validate(player, game.board))
+
+        # No action is valid outside of the phases of a turn
+        game.board.set_phase(None)
+        self.assertRaises(Exception, player._choose_action, game.get_state())
+
+    def test_play(self):
+        game = self._create_game()
+        game.set_player(ISMCTSPlayer(game.current_player_index, max_iterations=10, max_time=None, seed=0))
+        game.set_player(ISMCTSPlayer((game.current_player_index + 1) % 4, max_iterations=10, max_time=None,
+                                     num_workers=2, seed=0))
+        try:
+            self.assertEqual(20, game.play(max_steps=20))
+        finally:
+            for player in game.players:
+                if isinstance(player, ISMCTSPlayer):
+                    player.close()
+        game.board.auditor.verify(game.board, game.players)
+        for player in game.players:
+            self.assertIs(player, game.players[player.identifier].team.players[player.identifier // 2])
@@ -0,0 +1,47 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from base.cards.card_series import CardSeries
+from base.cards.series_catalog import SeriesCatalog
+
+
+class TestSeriesCatalog(TestCase):
+
+    def test_tables_match_series(self):
+        catalog = SeriesCatalog()
+        for series_id, catalog_series in enumerate(catalog.series):
+            series = CardSeries(list(catalog_series.get_raw_cards()))
+            self.assertEqual(series_id, catalog.get_id(series))
+            self.assertEqual(series.is_valid(), catalog.valid[series_id])
+            self.assertEqual(len(series), catalog.lengths[series_id])
+            self.assertEqual(series.get_canasta_score(), catalog.canasta_scores[series_id])
+            self.assertEqual(series.get_total_value(), catalog.total_values[series_id])
+            self.assertEqual(set(series.get_add_front_options()), set(catalog.get_add_front_options(series_id)))
+            self.assertEqual(set(series.get_add_back_options()), set(catalog.get_add_back_options(series_id)))
+            self.assertEqual(set(series.get_swap_joker_options()), set(catalog.get_swap_joker_options(series_id)))
+            self.assertEqual(set(series.get_swap_two_options()), set(catalog.get_swap_two_options(series_id)))
+            for card in series.get_add_front_options():
+                self.assertTrue(catalog.is_add_front_option(series, card))
+
+    def test_unknown_series(self):
+        series = CardSeries(list(SeriesCatalog().series[0].get_raw_cards())[:2])
+        self.assertIsNone(SeriesCatalog().get_id(series))
+        for card in series.get_add_back_options():
+            self.assertTrue(SeriesCatalog().is_add_back_option(series, card))
+
+    def test_save_and_load(self):
+        catalog = SeriesCatalog()
+        loaded = object.__new__(SeriesCatalog)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, SeriesCatalog.FILE_NAME)
+            catalog._save(path, "key")
+            self.assertFalse(loaded._load(path, "other key"))
+            self.assertTrue(loaded._load(path, "key"))
+        self.assertEqual([list(series.get_raw_cards()) for series in catalog.series],
+                         [list(series.get_raw_cards()) for series in loaded.series])
+        self.assertEqual([series.get_code() for series in catalog.series], [series.get_code() for series in loaded.series])
+        for name in SeriesCatalog.TABLES:
+            self.assertTrue(np.array_equal(getattr(catalog, name), getattr(loaded, name)), msg=name)
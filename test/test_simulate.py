@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from run.simulate import FIELDS, play_game, simulate
+
+
+class TestSimulate(TestCase):
+
+    def test_play_game(self):
+        result = play_game(seed=3, max_steps=2000)
+        self.assertEqual(FIELDS, list(result.keys()))
+        self.assertEqual(1, result['finished'])
+        self.assertEqual(0, result['stalled'])
+        self.assertEqual(result, play_game(seed=3, max_steps=2000))
+
+        result = play_game(seed=3, max_steps=10)
+        self.assertEqual(10, result['num_steps'])
+        self.assertEqual(0, result['finished'])
+
+    def test_stalled_game(self):
+        # In game 56, a player is left with an empty hand and no valid action
+        results = [play_game(seed=seed, max_steps=3000) for seed in range(50, 60)]
+        stalled = [result['seed'] for result in results if result['stalled']]
+        self.assertEqual([56], stalled)
+        self.assertEqual(0, results[6]['finished'])
+        self.assertEqual(257, results[6]['num_steps'])
+
+    def test_simulate(self):
+        results = list(simulate(num_games=3, seed=7, max_steps=20, num_workers=2, chunk_size=2))
+        self.assertEqual([7, 8, 9], [result['seed'] for result in results])
+        self.assertEqual(play_game(seed=8, max_steps=20), results[1])
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+import numpy as np
+
+from ai.subproc_vec_canasta_env import SubprocVecCanastaEnv
+from ai.vec_canasta_env import VecCanastaEnv
+
+
+class TestSubprocVecCanastaEnv(TestCase):
+
+    def test_step(self):
+        expected_env = VecCanastaEnv(num_envs=3, seed=0)
+        with SubprocVecCanastaEnv(num_envs=3, num_workers=2, seed=0) as env:
+            self.assertTrue(np.array_equal(expected_env.reset(), env.reset()))
+            masks = env.get_current_actions_masks()
+            self.assertTrue(np.array_equal(expected_env.get_current_actions_masks(), masks))
+
+            random = np.random.default_rng(0)
+            for _ in range(30):
+                actions = np.array([random.choice(np.flatnonzero(mask)) for mask in masks])
+                expected = expected_env.step(actions)
+                results = env.step(actions, copy=False)
+                for expected_array, array in zip(expected, results):
+                    self.assertEqual(expected_array.dtype, array.dtype)
+                    self.assertTrue(np.array_equal(expected_array, array))
+                masks = results[3].copy()
+
+            # Errors in the workers are raised by the environment
+            invalid_action = np.flatnonzero(~masks.any(axis=0))[0]
+            self.assertRaises(Exception, env.step, np.full(3, invalid_action))
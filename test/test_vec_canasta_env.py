@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+import numpy as np
+
+from ai.vec_canasta_env import VecCanastaEnv
+from base.action_service import ActionService
+from base.actions.discard_card_action import DiscardCardAction
+from base.cards.hand import Hand
+from base.enums.game_phase import GamePhase
+from base.game_state import GameState
+
+
+class TestVecCanastaEnv(TestCase):
+
+    def test_step(self):
+        env = VecCanastaEnv(num_envs=3, seed=0)
+        observations = env.reset()
+        self.assertEqual((3, GameState.SIZE), observations.shape)
+        self.assertEqual(np.float32, observations.dtype)
+        masks = env.get_current_actions_masks()
+        self.assertEqual((3, ActionService().num_actions), masks.shape)
+
+        random = np.random.default_rng(0)
+        num_steps = 0
+        while num_steps == 0 or not dones.any():
+            actions = np.array([random.choice(np.flatnonzero(mask)) for mask in masks])
+            observations, rewards, dones, masks = env.step(actions)
+            self.assertEqual((3,), rewards.shape)
+            self.assertEqual(np.float32, rewards.dtype)
+            num_steps += 1
+            if num_steps % 25 != 0 and not dones.any():
+                continue
+            for game, observation, mask in zip(env.games, observations, masks):
+                # Finished games have been reset, so these are always the observations of a game in progress
+                self.assertFalse(game.is_finished())
+                self.assertTrue(np.array_equal(
+                    ActionService().get_valid_actions_mask(game.current_player, game.board), mask))
+                self.assertTrue(np.array_equal(
+                    game.get_state().create_numeral_representation(game.current_player), observation))
+        self.assertRaises(Exception, env.step, actions[:2])
+
+    def test_stalled_game(self):
+        env = VecCanastaEnv(num_envs=2, seed=0)
+        env.reset()
+        masks = env.get_current_actions_masks()
+        # Lead the first game to a dead end: discarding the last card while the team can no longer take a pile
+        game = env.games[0]
+        player = game.current_player
+        card = player.hand.get_raw_cards()[0]
+        player.hand = Hand([card])
+        player.set_pile_grabbed()
+        game.board.grab_left_pile()
+        game.board.grab_right_pile()
+        game.board.set_phase(GamePhase.ACTION_PHASE)
+
+        actions = np.array([ActionService().action_to_idx(DiscardCardAction(card)), np.flatnonzero(masks[1])[0]])
+        observations, rewards, dones, masks = env.step(actions)
+        self.assertEqual([True, False], dones.tolist())
+        # The stalled game has been reset
+        self.assertEqual(11, env.games[0].current_player.num_cards())
+        self.assertTrue(masks.any(axis=1).all())
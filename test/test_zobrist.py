@@ -0,0 +1,82 @@
+import random
+from unittest import TestCase
+
+from base.action_service import ActionService
+from base.actions.put_action import PutAction
+from base.cards.hand import Hand
+from base.enums.game_phase import GamePhase
+from base.game import Game
+from base.transposition_table import TranspositionTable
+from base.zobrist import Zobrist
+
+
+class TestZobrist(TestCase):
+
+    def test_incremental_hash(self):
+        random.seed(0)
+        game = Game(keep_history=False, seed=0)
+        game.initialize_game()
+        hashes = set()
+        num_steps = 0
+        while not game.is_finished():
+            game.play_single_step()
+            num_steps += 1
+            game_hash = game.get_hash()
+            self.assertTrue(0 <= game_hash < 1 << 64)
+            hashes.add(game_hash)
+            for player in game.players:
+                self.assertEqual(Hand(player.hand.get_raw_cards()).get_hash(), player.hand.get_hash())
+            # Recompute the keys of the series from scratch
+            for team_index, team in enumerate(game.teams):
+                self.assertEqual(Zobrist.team_series(game.board.get_series_for_team(team), team_index),
+                                 game.board._series_hashes[team.color])
+            self.assertEqual(game_hash, Game.from_state(game.get_state()).get_hash())
+        # Positions only repeat exceptionally, e.g. when a card is drawn and discarded
+        self.assertGreater(len(hashes), 0.9 * num_steps)
+
+    def test_transpositions(self):
+        for seed in range(20):
+            random.seed(seed)
+            game = Game(keep_history=False, seed=seed)
+            game.initialize_game()
+            while not game.is_finished():
+                if game.board.phase == GamePhase.ACTION_PHASE:
+                    puts = [action for action in ActionService().get_valid_actions(game.current_player, game.board)
+                            if isinstance(action, PutAction)]
+                    for first in puts:
+                        for second in puts:
+                            if first == second:
+                                continue
+                            game_1 = game.clone()
+                            first.execute(game_1.current_player, game_1.board)
+                            if not second.validate(game_1.current_player, game_1.board):
+                                continue
+                            second.execute(game_1.current_player, game_1.board)
+                            game_2 = game.clone()
+                            second.execute(game_2.current_player, game_2.board)
+                            first.execute(game_2.current_player, game_2.board)
+                            self.assertNotEqual(game.get_hash(), game_1.get_hash())
+                            self.assertEqual(game_1.get_hash(), game_2.get_hash())
+                            # A value stored for one order of the actions is found for the other
+                            table = TranspositionTable()
+                            table.put(game_1.get_hash(), 'value')
+                            self.assertEqual('value', table.get(game_2.get_hash()))
+                            self.assertIsNone(table.get(game.get_hash()))
+                            return
+                game.play_single_step()
+        self.fail("No position with two series to put found")
+
+    def test_transposition_table(self):
+        table = TranspositionTable(capacity=2)
+        table.put(1, 'a')
+        table.put(2, 'b')
+        self.assertEqual('a', table.get(1))
+        table.put(3, 'c')  # Replaces the least recently used entry
+        self.assertEqual(2, len(table))
+        self.assertNotIn(2, table)
+        self.assertIsNone(table.get(2))
+        self.assertEqual(['a', 'c'], [table.get(1), table.get(3)])
+        self.assertEqual((3, 1), (table.hits, table.misses))
+        table.clear()
+        self.assertEqual(0, len(table))
+        self.assertRaises(Exception, TranspositionTable, 0)